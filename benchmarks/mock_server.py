@@ -0,0 +1,105 @@
+"""In-process stand-in for a BookStack instance, served through httpx.MockTransport."""
+
+import asyncio
+import json
+import time
+from typing import Any
+
+import httpx
+
+USER = {"id": 1, "name": "Admin", "slug": "admin"}
+TIMESTAMP = "2024-01-01T00:00:00.000000Z"
+
+
+def audit_log_rows(total: int, detail_size: int = 32) -> list[dict[str, Any]]:
+    """Generate audit log entries shaped like the API's, with `detail_size` bytes of detail text."""
+    detail = "x" * detail_size
+    return [
+        {
+            "id": i,
+            "type": "page_update",
+            "detail": detail,
+            "user_id": 1,
+            "loggable_id": i,
+            "loggable_type": "page",
+            "ip": "127.0.0.1",
+            "created_at": TIMESTAMP,
+            "user": USER,
+        }
+        for i in range(1, total + 1)
+    ]
+
+
+def page_rows(total: int) -> list[dict[str, Any]]:
+    """Generate page list items."""
+    return [
+        {
+            "id": i, "book_id": 1, "chapter_id": 0, "name": f"Page {i}", "slug": f"page-{i}",
+            "priority": i, "draft": False, "revision_count": 1, "template": False,
+            "created_at": TIMESTAMP, "updated_at": TIMESTAMP, "created_by": 1, "updated_by": 1,
+            "owned_by": 1, "editor": "wysiwyg", "book_slug": "book",
+        }
+        for i in range(1, total + 1)
+    ]
+
+
+class MockBookStack:
+    """Serves BookStack listing endpoints with offset/count pagination.
+
+    Responses are pre-encoded per (endpoint, offset, count), so the server
+    side costs next to nothing and measurements reflect the client. Latency
+    is simulated per request with `time.sleep` (sync) or `asyncio.sleep`
+    (async), so concurrent requests overlap as they would over a network.
+    """
+
+    def __init__(self, total: int = 1000, latency: float = 0.0, detail_size: int = 32) -> None:
+        """Initialize mock server.
+
+        Args:
+            total: Number of items served by each listing endpoint
+            latency: Seconds added to every request
+            detail_size: Size of the free text field of each audit log entry
+        """
+        self.latency = latency
+        self.requests = 0
+        self._listings = {
+            "/api/audit-log": audit_log_rows(total, detail_size),
+            "/api/pages": page_rows(total),
+        }
+        self._encoded: dict[tuple[str, int, int], bytes] = {}
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        rows = self._listings.get(request.url.path)
+        if rows is None:
+            return httpx.Response(404, json={"error": {"code": 404, "message": "Not found"}})
+
+        params = request.url.params
+        offset, count = int(params.get("offset", 0)), min(int(params.get("count", 100)), 500)
+        key = (request.url.path, offset, count)
+        body = self._encoded.get(key)
+        if body is None:
+            body = self._encoded[key] = json.dumps({"data": rows[offset:offset + count], "total": len(rows)}).encode()
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(request)
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport for `BookStackClient(..., transport=...)`."""
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Transport for `AsyncBookStackClient(..., transport=...)`."""
+        return httpx.MockTransport(self.handle_async)
+
+    def page_bytes(self, path: str = "/api/audit-log", count: int = 100) -> bytes:
+        """Encoded body of the first listing page, for decode and validation benchmarks."""
+        return self._respond(httpx.Request("GET", f"http://bookstack.local{path}?offset=0&count={count}")).content
@@ -0,0 +1,352 @@
+"""Benchmarks of the client against an in-process mock BookStack server.
+
+Usage (from the repository root, with the package installed):
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --quick --compare results.json
+
+Each benchmark is repeated and reported with its median. Results are written
+as JSON; `--compare` prints the change against an earlier result file and
+exits with status 1 if any benchmark regressed by more than `--threshold`.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable, Sized
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+import pydantic
+
+import bookstack_client
+from bookstack_client import AsyncBookStackClient, BookStackClient, get_default_decoder
+from bookstack_client.models import AuditLogItem
+from bookstack_client.models.lazy import build_list_response
+from bookstack_client.models.responses import AuditLogResponse
+
+from .mock_server import MockBookStack
+
+BASE_URL = "http://bookstack.local"
+
+
+class Result:
+    """A benchmark measurement; `higher_is_better` decides what counts as a regression."""
+
+    def __init__(self, name: str, unit: str, samples: list[float], higher_is_better: bool, **params: Any) -> None:
+        self.name = name
+        self.unit = unit
+        self.samples = samples
+        self.higher_is_better = higher_is_better
+        self.params = params
+
+    @property
+    def value(self) -> float:
+        return statistics.median(self.samples)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "params": self.params,
+            "unit": self.unit,
+            "value": self.value,
+            "higher_is_better": self.higher_is_better,
+            "stats": {
+                "runs": len(self.samples),
+                "min": min(self.samples),
+                "max": max(self.samples),
+                "mean": statistics.fmean(self.samples),
+                "stdev": statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0,
+            },
+        }
+
+
+def repeat(func: Callable[[], float], repeats: int) -> list[float]:
+    """Run `func` once to warm up, then `repeats` times, collecting its return values."""
+    func()
+    return [func() for _ in range(repeats)]
+
+
+def per_call(func: Callable[[], Any], number: int) -> Callable[[], float]:
+    """Wrap `func` into a measurement of its average duration in microseconds."""
+    def measure() -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        return (time.perf_counter() - start) / number * 1e6
+    return measure
+
+
+def bench_json_decode(args: argparse.Namespace) -> list[Result]:
+    server = MockBookStack(total=args.page_size, detail_size=args.detail_size)
+    body = server.page_bytes(count=args.page_size)
+    decoders = {"json": json.loads, "default": get_default_decoder()}
+    try:
+        import orjson
+        decoders["orjson"] = orjson.loads
+    except ImportError:
+        pass
+
+    return [
+        Result(
+            "json_decode", "us/page", repeat(per_call(lambda: decode(body), args.number), args.repeats), False,
+            decoder=name, page_size=args.page_size, bytes=len(body),
+        )
+        for name, decode in decoders.items()
+    ]
+
+
+def bench_validation(args: argparse.Namespace) -> list[Result]:
+    server = MockBookStack(total=args.page_size, detail_size=args.detail_size)
+    body = server.page_bytes(count=args.page_size)
+    decoded = json.loads(body)
+
+    variants = {
+        "model_validate": lambda: AuditLogResponse.model_validate(decoded),
+        "model_validate_json": lambda: AuditLogResponse.model_validate_json(body),
+        # Validates each entry on access; measured with every entry accessed once
+        "lazy": lambda: list(build_list_response(AuditLogResponse, AuditLogItem, decoded["data"], "lazy").data),
+    }
+    return [
+        Result(
+            "validation", "us/item",
+            [sample / args.page_size for sample in repeat(per_call(func, args.number), args.repeats)], False,
+            model="AuditLogItem", variant=name, page_size=args.page_size,
+        )
+        for name, func in variants.items()
+    ]
+
+
+def bench_pagination(args: argparse.Namespace) -> list[Result]:
+    results = []
+    for validate, prefetch in ((True, 0), (False, 0), (False, 1)):
+        server = MockBookStack(total=args.items, detail_size=args.detail_size)
+        client = BookStackClient(BASE_URL, "id", "secret", transport=server.transport())
+
+        def run() -> float:
+            start = time.perf_counter()
+            items = sum(1 for _ in client.audit_log.iter(validate=validate, count=args.page_size, prefetch=prefetch))
+            return items / (time.perf_counter() - start)
+
+        results.append(Result(
+            "pagination_throughput", "items/s", repeat(run, args.repeats), True,
+            items=args.items, page_size=args.page_size, validate=validate, prefetch=prefetch, latency_ms=0,
+        ))
+        client.close()
+    return results
+
+
+def bench_concurrency(args: argparse.Namespace) -> list[Result]:
+    results = []
+    for concurrency in (1, 2, 4, 8):
+        server = MockBookStack(total=args.items, latency=args.latency, detail_size=args.detail_size)
+        client = BookStackClient(
+            BASE_URL, "id", "secret", transport=server.transport(), pagination_concurrency=concurrency)
+
+        def run() -> float:
+            start = time.perf_counter()
+            items = len(client.audit_log.list(count=args.page_size).data)
+            return items / (time.perf_counter() - start)
+
+        results.append(Result(
+            "concurrency_scaling", "items/s", repeat(run, args.repeats), True,
+            client="sync", concurrency=concurrency, items=args.items, page_size=args.page_size,
+            latency_ms=args.latency * 1000,
+        ))
+        client.close()
+
+    async def run_async(concurrency: int) -> list[float]:
+        server = MockBookStack(total=args.items, latency=args.latency, detail_size=args.detail_size)
+        async with AsyncBookStackClient(
+            BASE_URL, "id", "secret", transport=server.async_transport(), pagination_concurrency=concurrency
+        ) as client:
+            samples = []
+            for _ in range(args.repeats + 1):
+                start = time.perf_counter()
+                items = len((await client.audit_log.list(count=args.page_size)).data)
+                samples.append(items / (time.perf_counter() - start))
+            return samples[1:]
+
+    for concurrency in (1, 8):
+        results.append(Result(
+            "concurrency_scaling", "items/s", asyncio.run(run_async(concurrency)), True,
+            client="async", concurrency=concurrency, items=args.items, page_size=args.page_size,
+            latency_ms=args.latency * 1000,
+        ))
+    return results
+
+
+def bench_memory(args: argparse.Namespace) -> list[Result]:
+    results = []
+    for mode in ("validate", "compact"):
+        server = MockBookStack(total=args.items, detail_size=args.detail_size)
+        client = BookStackClient(BASE_URL, "id", "secret", transport=server.transport())
+
+        def run() -> float:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                response = client.pages.list(mode=mode, count=args.page_size)
+                retained = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+            return retained / len(response.data)
+
+        results.append(Result(
+            "list_memory", "bytes/item", repeat(run, args.repeats), False,
+            model="PageListItem", mode=mode, items=args.items,
+        ))
+        client.close()
+    return results
+
+
+def bench_columnar(args: argparse.Namespace) -> list[Result]:
+    server = MockBookStack(total=args.items, detail_size=args.detail_size)
+    client = BookStackClient(BASE_URL, "id", "secret", transport=server.transport())
+    fetch: dict[str, Callable[[], Sized]] = {
+        "models": lambda: client.audit_log.list(count=args.page_size).data,
+        "columnar": lambda: client.audit_log.list_columnar(count=args.page_size),
+    }
+
+    results = []
+    for layout, func in fetch.items():
+        def run() -> float:
+            start = time.perf_counter()
+            items = len(func())
+            return items / (time.perf_counter() - start)
+
+        results.append(Result(
+            "columnar_ingest", "items/s", repeat(run, args.repeats), True, layout=layout, items=args.items))
+
+    items = client.audit_log.list(count=args.page_size).data
+    columns = client.audit_log.list_columnar(count=args.page_size)
+    aggregate = {
+        "models": lambda: Counter(item.user_id for item in items),
+        "columnar": lambda: columns.value_counts("user_id"),
+    }
+    for layout, func in aggregate.items():
+        results.append(Result(
+            "columnar_count_by", "us", repeat(per_call(func, 10), args.repeats), False,
+            layout=layout, column="user_id", items=args.items,
+        ))
+    client.close()
+    return results
+
+
+STARTUP_SCENARIOS = {
+    "import": "import bookstack_client",
+    "client": "from bookstack_client import BookStackClient; BookStackClient('http://bookstack.local', 'id', 'secret')",
+    "client_one_resource": (
+        "from bookstack_client import BookStackClient; "
+        "BookStackClient('http://bookstack.local', 'id', 'secret').pages"
+    ),
+    "all_models": "import bookstack_client.models as models; [getattr(models, name) for name in models.__all__]",
+}
+"""Statements timed in a fresh interpreter by the startup benchmark."""
+
+
+def bench_startup(args: argparse.Namespace) -> list[Result]:
+    def run(statement: str) -> float:
+        script = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+        output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+        return float(output) * 1000
+
+    return [
+        Result("startup", "ms", repeat(lambda: run(statement), args.repeats), False, scenario=name)
+        for name, statement in STARTUP_SCENARIOS.items()
+    ]
+
+
+BENCHMARKS = {
+    "startup": bench_startup,
+    "json_decode": bench_json_decode,
+    "validation": bench_validation,
+    "pagination": bench_pagination,
+    "concurrency": bench_concurrency,
+    "memory": bench_memory,
+    "columnar": bench_columnar,
+}
+
+
+def result_key(result: dict[str, Any]) -> str:
+    return result["name"] + json.dumps(result["params"], sort_keys=True)
+
+
+def compare(results: list[dict[str, Any]], baseline_path: str, threshold: float) -> bool:
+    """Print changes against a baseline file; returns True if nothing regressed beyond `threshold`."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {result_key(result): result for result in json.load(f)["results"]}
+
+    ok = True
+    for result in results:
+        previous = baseline.get(result_key(result))
+        if previous is None or not previous["value"]:
+            continue
+        change = result["value"] / previous["value"] - 1
+        regressed = -change > threshold if result["higher_is_better"] else change > threshold
+        ok &= not regressed
+        print(f"{'REGRESSION ' if regressed else ''}{result['name']} {result['params']}: "
+              f"{previous['value']:.4g} -> {result['value']:.4g} {result['unit']} ({change:+.1%})")
+    return ok
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("benchmarks", nargs="*", metavar="BENCHMARK", help="benchmarks to run (default: all)")
+    parser.add_argument("--output", "-o", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="compare against an earlier JSON result file")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change counted as regression")
+    parser.add_argument("--quick", action="store_true", help="fewer items and repeats, for smoke runs")
+    parser.add_argument("--items", type=int, default=10000, help="items served by listing endpoints")
+    parser.add_argument("--page-size", type=int, default=100, help="items per listing page")
+    parser.add_argument("--detail-size", type=int, default=32, help="bytes of free text per audit log entry")
+    parser.add_argument("--latency", type=float, default=0.005, help="simulated latency per request in seconds")
+    parser.add_argument("--repeats", type=int, default=5, help="measured runs per benchmark")
+    parser.add_argument("--number", type=int, default=200, help="calls per run of micro benchmarks")
+    args = parser.parse_args(argv)
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))} (choose from {', '.join(BENCHMARKS)})")
+
+    if args.quick:
+        args.items, args.repeats, args.number = min(args.items, 2000), min(args.repeats, 3), min(args.number, 50)
+
+    results: list[dict[str, Any]] = []
+    for name in args.benchmarks or BENCHMARKS:
+        for result in BENCHMARKS[name](args):
+            data = result.to_dict()
+            results.append(data)
+            print(f"{data['name']:<22} {json.dumps(data['params']):<90} {data['value']:>12.4g} {data['unit']}")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "bookstack_client": bookstack_client.__version__,
+            "httpx": httpx.__version__,
+            "pydantic": pydantic.VERSION,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare and not compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,87 @@
 
 __version__ = "0.1.0"
 
-from .client import BookStackClient
-from .exceptions import BookStackError, BookStackAPIError
+from typing import TYPE_CHECKING
 
-__all__ = ["BookStackClient", "BookStackError", "BookStackAPIError"]
+from .utils import lazy_exports
+
+if TYPE_CHECKING:
+    from .bulk import BatchReport, BulkResult, batch_write_pages, run_bulk, upload_images
+    from .cache import ResponseCache, InMemoryCache
+    from .client import BookStackClient, AsyncBookStackClient
+    from .columnar import ColumnarResult, ColumnData
+    from .decoders import JSONDecoder, get_default_decoder
+    from .exceptions import BookStackError, BookStackAPIError
+    from .exporter import BulkExporter, ExportedFile
+    from .hierarchy import ContentNode, ContentTree, load_hierarchy
+    from .instrumentation import EndpointStats, MetricsCollector, RequestEvent, RequestHooks
+    from .multi import InstanceResult, MultiInstanceClient
+    from .ratelimit import RateLimiter
+    from .replica import LocalReplica, SyncReport
+    from .retry import RetryPolicy
+    from .search_index import LocalSearchIndex
+    from .stores import StateStore, JSONFileStore, SQLiteStore
+    from .sync import AuditLogSync
+    from .transport import AsyncSharedTransport, SharedTransport
+
+_EXPORTS = {
+    ".bulk": ("BatchReport", "BulkResult", "batch_write_pages", "run_bulk", "upload_images"),
+    ".cache": ("ResponseCache", "InMemoryCache"),
+    ".client": ("BookStackClient", "AsyncBookStackClient"),
+    ".columnar": ("ColumnarResult", "ColumnData"),
+    ".decoders": ("JSONDecoder", "get_default_decoder"),
+    ".exceptions": ("BookStackError", "BookStackAPIError"),
+    ".exporter": ("BulkExporter", "ExportedFile"),
+    ".hierarchy": ("ContentNode", "ContentTree", "load_hierarchy"),
+    ".instrumentation": ("EndpointStats", "MetricsCollector", "RequestEvent", "RequestHooks"),
+    ".multi": ("InstanceResult", "MultiInstanceClient"),
+    ".ratelimit": ("RateLimiter",),
+    ".replica": ("LocalReplica", "SyncReport"),
+    ".retry": ("RetryPolicy",),
+    ".search_index": ("LocalSearchIndex",),
+    ".stores": ("StateStore", "JSONFileStore", "SQLiteStore"),
+    ".sync": ("AuditLogSync",),
+    ".transport": ("AsyncSharedTransport", "SharedTransport"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [
+    "BookStackClient",
+    "AsyncBookStackClient",
+    "ResponseCache",
+    "InMemoryCache",
+    "JSONDecoder",
+    "get_default_decoder",
+    "BookStackError",
+    "BookStackAPIError",
+    "ColumnarResult",
+    "ColumnData",
+    "BulkExporter",
+    "BulkResult",
+    "run_bulk",
+    "upload_images",
+    "BatchReport",
+    "batch_write_pages",
+    "ExportedFile",
+    "ContentNode",
+    "ContentTree",
+    "load_hierarchy",
+    "RequestHooks",
+    "RequestEvent",
+    "MetricsCollector",
+    "EndpointStats",
+    "MultiInstanceClient",
+    "InstanceResult",
+    "RateLimiter",
+    "RetryPolicy",
+    "SharedTransport",
+    "AsyncSharedTransport",
+    "LocalReplica",
+    "SyncReport",
+    "LocalSearchIndex",
+    "StateStore",
+    "JSONFileStore",
+    "SQLiteStore",
+    "AuditLogSync",
+]
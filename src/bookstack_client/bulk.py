@@ -0,0 +1,242 @@
+"""Bounded-concurrency bulk operations with per-item results."""
+
+import glob
+import os
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Generic, Literal, TypeVar
+
+from pydantic import ValidationError
+
+from .exceptions import BookStackError
+from .models.images import ImageDetail
+from .models.pages import PageCreate, PageDetail, PageUpdate
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BulkResult(Generic[T, R]):
+    """Outcome of one item of a bulk operation: either a value or an error."""
+
+    __slots__ = ("item", "value", "error")
+
+    def __init__(self, item: T, value: R | None = None, error: Exception | None = None) -> None:
+        self.item = item
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded for this item."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error is not None else f"value={self.value!r}"
+        return f"BulkResult({self.item!r}, {outcome})"
+
+
+BulkProgressCallback = Callable[[BulkResult, int, int], None]
+"""Called with each finished result, the number of finished items and the total."""
+
+
+def run_bulk(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 8,
+    progress: BulkProgressCallback | None = None,
+    errors: tuple[type[Exception], ...] = (BookStackError, OSError),
+) -> list[BulkResult[T, R]]:
+    """Apply `func` to every item on a bounded thread pool.
+
+    Failures of the types in `errors` are recorded in the item's result and
+    do not stop the other items; any other exception aborts the run and is
+    raised.
+
+    Args:
+        func: Operation to run per item, e.g. a bound resource method
+        items: Items to process
+        max_workers: Maximum number of items processed at the same time
+        progress: Callback invoked after each finished item
+        errors: Exception types recorded per item instead of being raised
+
+    Returns:
+        One result per item, in the order of `items`
+    """
+    items = list(items)
+    results: dict[int, BulkResult[T, R]] = {}
+
+    def call(item: T) -> BulkResult[T, R]:
+        try:
+            return BulkResult(item, func(item))
+        except errors as error:
+            return BulkResult(item, error=error)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(call, item): i for i, item in enumerate(items)}
+        try:
+            for finished, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results[futures[future]] = result
+                if progress is not None:
+                    progress(result, finished, len(items))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    return [results[i] for i in range(len(items))]
+
+
+def expand_paths(paths: str | os.PathLike | Iterable[str | os.PathLike]) -> list[Path]:
+    """Expand paths and glob patterns (`**` matches recursively) into a sorted list of files."""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+
+    files: set[Path] = set()
+    for path in paths:
+        path = os.fspath(path)
+        if glob.has_magic(path):
+            files.update(Path(match) for match in glob.iglob(path, recursive=True) if os.path.isfile(match))
+        else:
+            # Plain paths are kept even if missing, so they show up as errors
+            files.add(Path(path))
+    return sorted(files)
+
+
+def upload_images(
+    client,
+    paths: str | os.PathLike | Iterable[str | os.PathLike],
+    uploaded_to: int,
+    max_workers: int = 8,
+    progress: BulkProgressCallback | None = None,
+    **kwargs: Any,
+) -> list[BulkResult[Path, ImageDetail]]:
+    """Upload image files to the gallery concurrently.
+
+    Each file is streamed from disk, so memory use depends on `max_workers`
+    rather than on the size or number of the images.
+
+    Example:
+        results = upload_images(client, "screenshots/**/*.png", uploaded_to=42)
+        failed = [r.item for r in results if not r.ok]
+
+    Args:
+        client: The `BookStackClient` to upload with
+        paths: File paths and/or glob patterns
+        uploaded_to: ID of the page the images belong to
+        max_workers: Maximum number of concurrent uploads
+        progress: Callback invoked after each finished upload
+        **kwargs: Additional arguments passed to `ImagesResource.create`
+
+    Returns:
+        One result per file, holding the `ImageDetail` or the error
+    """
+    return run_bulk(
+        lambda path: client.images.create(uploaded_to, path, **kwargs),
+        expand_paths(paths),
+        max_workers=max_workers,
+        progress=progress,
+    )
+
+
+class WriteOperation:
+    """A single create, update or delete in a batch write."""
+
+    __slots__ = ("action", "id", "data")
+
+    def __init__(self, action: Literal["create", "update", "delete"], id: int | None = None, data: Any = None) -> None:
+        self.action = action
+        self.id = id
+        self.data = data
+
+    def __repr__(self) -> str:
+        target = f" {self.id}" if self.id is not None else ""
+        return f"WriteOperation({self.action}{target})"
+
+
+class BatchReport:
+    """Per-operation outcome of a batch write."""
+
+    __slots__ = ("results",)
+
+    def __init__(self, results: list[BulkResult[WriteOperation, Any]]) -> None:
+        self.results = results
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[BulkResult[WriteOperation, Any]]:
+        return iter(self.results)
+
+    def __repr__(self) -> str:
+        return f"BatchReport(succeeded={len(self.succeeded)}, failed={len(self.failed)})"
+
+    @property
+    def ok(self) -> bool:
+        """Whether every operation succeeded."""
+        return all(result.ok for result in self.results)
+
+    @property
+    def succeeded(self) -> list[BulkResult[WriteOperation, Any]]:
+        """Results of the successful operations."""
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> list[BulkResult[WriteOperation, Any]]:
+        """Results of the failed operations, each holding the mapped exception in `error`."""
+        return [result for result in self.results if not result.ok]
+
+
+def batch_write_pages(
+    client,
+    creates: Iterable[PageCreate | dict[str, Any]] = (),
+    updates: Mapping[int, PageUpdate | dict[str, Any]] | Iterable[tuple[int, PageUpdate | dict[str, Any]]] = (),
+    deletes: Iterable[int] = (),
+    max_workers: int = 8,
+    progress: BulkProgressCallback | None = None,
+) -> BatchReport:
+    """Create, update and delete pages concurrently.
+
+    A failing operation, e.g. with a `BookStackValidationError`, is recorded
+    in the report and does not stop the others. Requests go through the
+    client, so its `RateLimiter` bounds the request rate across all workers
+    and rate-limited requests are retried if it has a `RetryPolicy`.
+
+    Example:
+        report = batch_write_pages(client, creates=generated_pages, max_workers=16)
+        for result in report.failed:
+            log.warning("%r failed: %s", result.item, result.error)
+
+    Args:
+        client: The `BookStackClient` to write with
+        creates: Pages to create
+        updates: Changes to existing pages, by page id
+        deletes: IDs of pages to delete
+        max_workers: Maximum number of concurrent requests
+        progress: Callback invoked after each finished operation
+
+    Returns:
+        One result per operation, in the order creates, updates, deletes.
+        Successful creates and updates hold the `PageDetail`.
+    """
+    if isinstance(updates, Mapping):
+        updates = updates.items()
+
+    operations = [
+        *(WriteOperation("create", data=data) for data in creates),
+        *(WriteOperation("update", page_id, data) for page_id, data in updates),
+        *(WriteOperation("delete", page_id) for page_id in deletes),
+    ]
+
+    def run(operation: WriteOperation) -> PageDetail | None:
+        if operation.action == "create":
+            return client.pages.create(operation.data)
+        if operation.action == "update":
+            return client.pages.update(operation.id, operation.data)
+        return client.pages.delete(operation.id)
+
+    return BatchReport(run_bulk(
+        run, operations, max_workers=max_workers, progress=progress, errors=(BookStackError, ValidationError),
+    ))
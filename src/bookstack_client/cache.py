@@ -0,0 +1,162 @@
+"""Response caching for safe BookStack API requests."""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+CacheKey = tuple[Any, ...]
+"""Cache key made of the HTTP method, the URL including its query and, if the
+request used one, its response decoder."""
+
+
+class CacheEntry:
+    """A cached, decoded response together with its revalidation data."""
+
+    __slots__ = ("value", "expires_at", "etag", "last_modified", "size")
+
+    def __init__(
+        self,
+        value: Any,
+        expires_at: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        size: int = 0,
+    ) -> None:
+        """Initialize cache entry.
+
+        Args:
+            value: Decoded response body
+            expires_at: `time.monotonic()` timestamp after which the entry is stale
+            etag: `ETag` header of the response, if any
+            last_modified: `Last-Modified` header of the response, if any
+            size: Size of the response body in bytes
+        """
+        self.value = value
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+        self.size = size
+
+    def is_fresh(self) -> bool:
+        """Check whether the entry can be served without asking the server."""
+        return time.monotonic() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers turning a request for this entry into a conditional request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache(ABC):
+    """Interface for response caches used by the BookStack clients.
+
+    Implementations must be safe to use from several threads. Cached values are
+    shared between callers and must not be mutated.
+    """
+
+    def __init__(self, ttl: float = 60.0) -> None:
+        """Initialize response cache.
+
+        Args:
+            ttl: Default number of seconds a response is served without revalidation
+        """
+        self.ttl = ttl
+
+    @abstractmethod
+    def get(self, key: CacheKey) -> CacheEntry | None:
+        """Get the entry stored for `key`, fresh or stale."""
+
+    @abstractmethod
+    def set(self, key: CacheKey, entry: CacheEntry) -> None:
+        """Store `entry` under `key`."""
+
+    @abstractmethod
+    def invalidate(self, path: str) -> None:
+        """Drop all entries whose URL path is `path` or lies below it, e.g. "/pages/1" for "/pages"."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop all entries."""
+
+
+class InMemoryCache(ResponseCache):
+    """Thread-safe in-memory LRU response cache.
+
+    Stale entries are kept until evicted so they can be revalidated with a
+    conditional request when the server supplied an `ETag` or `Last-Modified`
+    header.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_entries: int = 1024,
+        max_bytes: int | None = None,
+    ) -> None:
+        """Initialize in-memory cache.
+
+        Args:
+            ttl: Default number of seconds a response is served without revalidation
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of the cached response bodies (None for no limit)
+        """
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: CacheKey, entry: CacheEntry) -> None:
+        if self.max_bytes is not None and entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+
+            self._entries[key] = entry
+            self._size += entry.size
+
+            # Evict least recently used entries
+            while (len(self._entries) > self.max_entries or
+                   (self.max_bytes is not None and self._size > self.max_bytes)):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+    def invalidate(self, path: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if _is_below(_url_path(key[1]), path)]:
+                self._size -= self._entries.pop(key).size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+def _url_path(url: str) -> str:
+    return url.split("?", 1)[0]
+
+
+def _is_below(url_path: str, path: str) -> bool:
+    """Check whether `url_path` is `path` or one of its subpaths, comparing whole segments."""
+    path = path.rstrip("/")
+    return url_path == path or url_path.startswith(path + "/")
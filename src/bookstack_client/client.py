@@ -1,13 +1,65 @@
 """BookStack API client."""
 
+import asyncio
+import re
+import time
 import httpx
-from typing import Any
-from .exceptions import create_api_error, create_connection_error
-from .resources import AuditLogResource
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+from .cache import CacheEntry, CacheKey, ResponseCache
+from .decoders import JSONDecoder, get_default_decoder
+from .exceptions import BookStackError, BookStackRateLimitError, create_api_error, create_connection_error
+from .instrumentation import RequestEvent, RequestHooks
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .utils import HttpMethod
 
+if TYPE_CHECKING:
+    from .resources import (
+        AttachmentsResource,
+        AsyncAttachmentsResource,
+        AuditLogResource,
+        AsyncAuditLogResource,
+        BooksResource,
+        AsyncBooksResource,
+        ChaptersResource,
+        AsyncChaptersResource,
+        ImagesResource,
+        AsyncImagesResource,
+        PagesResource,
+        AsyncPagesResource,
+        RecycleBinResource,
+        AsyncRecycleBinResource,
+        ShelvesResource,
+        AsyncShelvesResource,
+    )
+
+CACHEABLE_METHODS = frozenset({HttpMethod.GET.value, HttpMethod.HEAD.value})
+"""HTTP methods whose responses may be served from the response cache."""
+
+SEND_OPTIONS = ("auth", "follow_redirects")
+"""Per-request arguments of `httpx.Client.request` that `send` takes instead of `build_request`."""
+
+DEPENDENT_COLLECTIONS: dict[str, tuple[str, ...]] = {
+    "pages": ("books", "chapters"),
+    "chapters": ("books",),
+    "books": ("shelves",),
+    "recycle-bin": ("shelves", "books", "chapters", "pages"),
+}
+"""Collections whose cached responses embed entities of another collection, e.g.
+book details list their chapters and pages, and restores bring back any entity."""
+
+# Page number of the listing page being fetched, reported in request events
+_current_page: ContextVar[int | None] = ContextVar("bookstack_current_page", default=None)
 
-class BookStackClient:
-    """Client for interacting with BookStack API."""
+
+class _BaseClient:
+    """Configuration and helpers shared by the sync and async clients."""
 
     def __init__(
         self,
@@ -16,43 +68,308 @@ class BookStackClient:
         token_secret: str,
         verify_ssl: bool = True,
         timeout: float = 30.0,
-        **client_kwargs: Any,
+        pagination_concurrency: int = 1,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        json_decoder: JSONDecoder | None = None,
+        hooks: RequestHooks | Sequence[RequestHooks] | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
     ) -> None:
-        """
-        Initialize BookStack client.
+        if pagination_concurrency < 1:
+            raise ValueError("pagination_concurrency must be at least 1")
 
-        Args:
-            base_url (str): Base URL of BookStack instance
-            token_id (str): API token ID
-            token_secret (str): API token secret
-            verify_ssl (bool): Whether to verify SSL certificates
-            timeout (float): Request timeout in seconds
-            **client_kwargs (Any): Additional arguments passed to `httpx.Client`
-        """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.pagination_concurrency = pagination_concurrency
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.json_decoder = json_decoder or get_default_decoder()
+        if hooks is None:
+            hooks = []
+        # Hooks only need the two callbacks, so anything but a sequence is a single hook
+        self.hooks: list[RequestHooks] = list(hooks) if isinstance(hooks, Sequence) else [hooks]
+        self.limits = limits
+        self.http2 = http2
 
         # Default headers
-        headers = {
+        self._headers = {
             "Authorization": f"Token {token_id}:{token_secret}",
             "Content-Type": "application/json",
             "User-Agent": "bookstack-client/0.1.0",
         }
 
+    def _client_options(self, client_kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Build the keyword arguments for the underlying httpx client."""
+        if "transport" in client_kwargs and (self.limits is not None or self.http2):
+            # httpx silently ignores them for custom transports
+            raise ValueError("limits and http2 cannot be combined with a transport; configure the transport instead")
+
+        headers = dict(self._headers)
+
         # Merge with any custom headers
         if "headers" in client_kwargs:
             headers.update(client_kwargs.pop("headers"))
 
-        self._client = httpx.Client(
-            base_url=f"{self.base_url}/api",
-            headers=headers,
-            timeout=timeout,
-            verify=verify_ssl,
+        options = {
+            "base_url": f"{self.base_url}/api",
+            "headers": headers,
+            "timeout": self.timeout,
+            "verify": self.verify_ssl,
+            "http2": self.http2,
             **client_kwargs,
+        }
+        if self.limits is not None:
+            options["limits"] = self.limits
+        return options
+
+    def _start_event(self, method: str, endpoint: str, attempt: int) -> RequestEvent | None:
+        """Report the start of a request attempt to the hooks."""
+        if not self.hooks:
+            return None
+        event = RequestEvent(method, endpoint, attempt, _current_page.get())
+        for hook in self.hooks:
+            hook.on_request_start(event)
+        event._start = time.perf_counter()
+        return event
+
+    def _end_event(
+        self,
+        event: RequestEvent | None,
+        request: httpx.Request | None,
+        response: httpx.Response | None = None,
+        error: BookStackError | None = None,
+    ) -> None:
+        """Report the outcome of a request attempt to the hooks."""
+        if event is None:
+            return
+        event.elapsed = time.perf_counter() - event._start
+        event.error = error
+        if request is not None:
+            event.bytes_sent = int(request.headers.get("Content-Length", 0))
+        if response is not None:
+            event.status_code = response.status_code
+            try:
+                # Raw (possibly compressed) size, or the body of pre-read responses
+                event.bytes_received = response.num_bytes_downloaded or len(response.content)
+            except httpx.ResponseNotRead:
+                event.bytes_received = 0
+        for hook in self.hooks:
+            hook.on_request_end(event)
+
+    def _decode_response(self, response: httpx.Response, decoder: JSONDecoder | None = None) -> Any:
+        """Decode a JSON response body with `decoder` or the client's JSON decoder."""
+        # Handle empty responses (like DELETE operations)
+        if response.status_code == 204 or not response.content:
+            return {}
+
+        return (decoder or self.json_decoder)(response.content)
+
+    @staticmethod
+    def _cache_key(
+        method: str,
+        endpoint: str,
+        params: Any = None,
+        decoder: JSONDecoder | None = None,
+    ) -> CacheKey:
+        """Build the response cache key for a request."""
+        url = httpx.URL(endpoint)
+        if params:
+            url = url.copy_merge_params(params)
+        key: CacheKey = (method.upper(), str(url))
+        # Bodies decoded by a per-request decoder (e.g. into models) are cached separately
+        return key + (decoder,) if decoder is not None else key
+
+    def _invalidate_cache(self, cache: ResponseCache, endpoint: str) -> None:
+        """Drop cached responses of the collection a write request touched and of those embedding it.
+
+        Writes do not always reveal the parents of an entity (deletes do not,
+        moves change them), so all cached entries of a dependent collection
+        are dropped.
+        """
+        collection = httpx.URL(endpoint).path.strip('/').split('/', 1)[0]
+        for name in (collection, *DEPENDENT_COLLECTIONS.get(collection, ())):
+            cache.invalidate(f"/{name}")
+
+    def _cache_response(
+        self,
+        cache: ResponseCache,
+        key: CacheKey,
+        entry: CacheEntry | None,
+        response: httpx.Response,
+        decoder: JSONDecoder | None = None,
+    ) -> Any:
+        """Store a response in the cache, or refresh `entry` on 304, and return the body."""
+        cache_control = response.headers.get("cache-control", "").lower()
+        max_age = re.search(r"max-age=(\d+)", cache_control)
+        ttl = int(max_age.group(1)) if max_age else cache.ttl
+        expires_at = time.monotonic() + ttl
+
+        if response.status_code == 304 and entry is not None:
+            entry.expires_at = expires_at
+            cache.set(key, entry)
+            return entry.value
+
+        value = self._decode_response(response, decoder)
+        if "no-store" not in cache_control:
+            cache.set(key, CacheEntry(
+                value,
+                expires_at,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+                size=len(response.content),
+            ))
+        return value
+
+    def _pagination_concurrency(self, max_concurrency: int | None) -> int:
+        """Resolve the number of pages fetched concurrently by a listing."""
+        if max_concurrency is None:
+            return self.pagination_concurrency
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        return max_concurrency
+
+    @staticmethod
+    def _page_parts(page: Any) -> tuple[list, int]:
+        """Get the items and the reported total of a decoded listing page."""
+        if isinstance(page, dict):
+            return page.get('data', []), page.get('total', 0)
+        # Pages decoded straight into a `PaginatedResponse` model
+        return page.data, page.total
+
+    @staticmethod
+    def _paginated_url(url: str, offset: int, count: int) -> str:
+        """Append offset and count parameters to a listing URL."""
+        separator = '&' if '?' in url else '?'
+        return f"{url}{separator}offset={offset}&count={count}"
+
+    @staticmethod
+    def _remaining_offsets(total: int, count: int, max_items: int | None) -> range:
+        """Offsets of the pages still to fetch once the first page reported `total`."""
+        limit = min(total, max_items) if max_items else total
+        return range(count, limit, count)
+
+
+class BookStackClient(_BaseClient):
+    """Client for interacting with BookStack API."""
+
+    def __init__(
+        self,
+        base_url: str,
+        token_id: str,
+        token_secret: str,
+        verify_ssl: bool = True,
+        timeout: float = 30.0,
+        pagination_concurrency: int = 1,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        json_decoder: JSONDecoder | None = None,
+        hooks: RequestHooks | Sequence[RequestHooks] | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        **client_kwargs: Any,
+    ) -> None:
+        """
+        Initialize BookStack client.
+
+        Args:
+            base_url (str): Base URL of BookStack instance
+            token_id (str): API token ID
+            token_secret (str): API token secret
+            verify_ssl (bool): Whether to verify SSL certificates
+            timeout (float): Request timeout in seconds
+            pagination_concurrency (int): Default number of pages fetched concurrently
+                by paginated listings once the total is known (1 fetches serially)
+            retry_policy (RetryPolicy | None): Optional policy for retrying rate limited
+                and transient failures, e.g. `RetryPolicy()`; without one, failed
+                requests are raised right away
+            rate_limiter (RateLimiter | None): Optional limiter every request waits
+                on; share one instance between clients using the same API token
+            cache (ResponseCache | None): Optional cache for GET/HEAD responses, e.g.
+                `InMemoryCache()`; cached values are shared and must not be mutated
+            json_decoder (JSONDecoder | None): Callable decoding response bodies from
+                bytes (defaults to orjson or msgspec when installed, else `json.loads`)
+            hooks (RequestHooks | Sequence[RequestHooks] | None): Receivers of an event
+                for every request attempt, e.g. a `MetricsCollector` or any object
+                with `on_request_start` and `on_request_end` methods
+            limits (httpx.Limits | None): Connection pool size and keep-alive expiry
+                (defaults to httpx's limits); keep `max_keepalive_connections` at
+                least at `pagination_concurrency` to reuse connections
+            http2 (bool): Whether to use HTTP/2 where the server supports it, so
+                concurrent requests share one connection (requires the `http2` extra)
+            **client_kwargs (Any): Additional arguments passed to `httpx.Client`, e.g.
+                `transport=SharedTransport(...)` to share one connection pool
+                between clients
+        """
+        super().__init__(
+            base_url,
+            token_id,
+            token_secret,
+            verify_ssl=verify_ssl,
+            timeout=timeout,
+            pagination_concurrency=pagination_concurrency,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            json_decoder=json_decoder,
+            hooks=hooks,
+            limits=limits,
+            http2=http2,
         )
 
-        self.audit_log = AuditLogResource(self)
+        self._client = httpx.Client(**self._client_options(client_kwargs))
+
+    @cached_property
+    def attachments(self) -> "AttachmentsResource":
+        """Attachments API."""
+        from .resources.attachments import AttachmentsResource
+        return AttachmentsResource(self)
+
+    @cached_property
+    def audit_log(self) -> "AuditLogResource":
+        """Audit log API."""
+        from .resources.audit_log import AuditLogResource
+        return AuditLogResource(self)
+
+    @cached_property
+    def books(self) -> "BooksResource":
+        """Books API."""
+        from .resources.books import BooksResource
+        return BooksResource(self)
+
+    @cached_property
+    def chapters(self) -> "ChaptersResource":
+        """Chapters API."""
+        from .resources.chapters import ChaptersResource
+        return ChaptersResource(self)
+
+    @cached_property
+    def images(self) -> "ImagesResource":
+        """Image gallery API."""
+        from .resources.images import ImagesResource
+        return ImagesResource(self)
+
+    @cached_property
+    def pages(self) -> "PagesResource":
+        """Pages API."""
+        from .resources.pages import PagesResource
+        return PagesResource(self)
+
+    @cached_property
+    def recycle_bin(self) -> "RecycleBinResource":
+        """Recycle bin API."""
+        from .resources.recycle_bin import RecycleBinResource
+        return RecycleBinResource(self)
+
+    @cached_property
+    def shelves(self) -> "ShelvesResource":
+        """Shelves API."""
+        from .resources.shelves import ShelvesResource
+        return ShelvesResource(self)
 
     def __enter__(self) -> "BookStackClient":
         return self
@@ -69,37 +386,145 @@ class BookStackClient:
         self,
         method: str,
         endpoint: str,
+        decoder: JSONDecoder | None = None,
         **kwargs: Any
-    ) -> dict[str, Any]:
+    ) -> Any:
         """Make HTTP request to BookStack API.
 
         Args:
             method: HTTP method
             endpoint: API endpoint (without /api prefix)
+            decoder: Decoder for the response body overriding the client's JSON
+                decoder, e.g. `Model.model_validate_json` to validate raw bytes
             **kwargs: Additional arguments passed to httpx request
 
         Returns:
-            JSON response as dictionary
+            JSON response as dictionary, or whatever `decoder` returns
 
         Raises:
             BookStackAPIError: For HTTP errors with API error details
             BookStackError: For connection/request errors
         """
+        if self.cache is None:
+            return self._decode_response(self._send(method, endpoint, **kwargs), decoder)
+
+        if method.upper() not in CACHEABLE_METHODS:
+            response = self._send(method, endpoint, **kwargs)
+            self._invalidate_cache(self.cache, endpoint)
+            return self._decode_response(response, decoder)
+
+        key = self._cache_key(method, endpoint, kwargs.get("params"), decoder)
+        entry = self.cache.get(key)
+        if entry is not None:
+            if entry.is_fresh():
+                return entry.value
+            # Revalidate stale entries when the server supplied validators
+            kwargs["headers"] = {**entry.conditional_headers(), **(kwargs.get("headers") or {})}
+
+        response = self._send(method, endpoint, **kwargs)
+        return self._cache_response(self.cache, key, entry, response, decoder)
+
+    @contextmanager
+    def _stream(self, method: str, endpoint: str, **kwargs: Any) -> Iterator[httpx.Response]:
+        """Send a request without reading the response body.
+
+        The body can then be consumed in chunks with `response.iter_bytes()`.
+        Errors are mapped and retried as for `_request`, but the response
+        cache is bypassed.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (without /api prefix)
+            **kwargs: Additional arguments passed to httpx request
+
+        Yields:
+            The open response; it is closed when the context exits
+        """
+        response = self._send(method, endpoint, stream=True, **kwargs)
         try:
-            response = self._client.request(method, endpoint, **kwargs)
-            response.raise_for_status()
+            yield response
+        except httpx.RequestError as e:
+            raise create_connection_error(e) from e
+        finally:
+            response.close()
+
+    def _send(self, method: str, endpoint: str, stream: bool = False, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying transient failures according to the retry policy."""
+        attempt = 0
+        waited = 0.0
+
+        while True:
+            try:
+                return self._send_once(method, endpoint, stream, attempt, **kwargs)
+            except BookStackError as error:
+                if isinstance(error, BookStackRateLimitError) and self.rate_limiter is not None:
+                    self.rate_limiter.penalize(error.retry_after)
+                if self.retry_policy is None:
+                    raise
+                delay = self.retry_policy.next_delay(method, error, attempt, waited)
+                if delay is None:
+                    raise
+
+            time.sleep(delay)
+            attempt += 1
+            waited += delay
 
-            # Handle empty responses (like DELETE operations)
-            if response.status_code == 204 or not response.text:
-                return {}
+    def _send_once(
+        self,
+        method: str,
+        endpoint: str,
+        stream: bool = False,
+        attempt: int = 0,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """Send a single request and map failures to BookStack errors."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
 
-            return response.json()
+        event = self._start_event(method, endpoint, attempt)
+        request = None
+        try:
+            send_options = {key: kwargs.pop(key) for key in SEND_OPTIONS if key in kwargs}
+            request = self._client.build_request(method, endpoint, **kwargs)
+            response = self._client.send(request, stream=stream, **send_options)
+            # 304 answers a conditional request for a cached response
+            if response.status_code != 304:
+                response.raise_for_status()
 
         except httpx.HTTPStatusError as e:
-            raise create_api_error(e.response) from e
+            if stream:
+                # Error bodies are small; read them for the error details
+                try:
+                    e.response.read()
+                finally:
+                    e.response.close()
+            error: BookStackError = create_api_error(e.response)
+            self._end_event(event, request, e.response, error)
+            raise error from e
 
         except httpx.RequestError as e:
-            raise create_connection_error(e) from e
+            error = create_connection_error(e)
+            self._end_event(event, request, error=error)
+            raise error from e
+
+        self._end_event(event, request, response)
+        return response
+
+    def _fetch_page(self, method: str, url: str, offset: int, count: int, **kwargs: Any) -> Any:
+        """Fetch a single page of a listing endpoint."""
+        if kwargs.get("params") is not None:
+            # httpx replaces the query string of the URL with `params`, so the
+            # offset and count have to be merged into them instead
+            kwargs["params"] = httpx.QueryParams(kwargs["params"]).merge({"offset": offset, "count": count})
+        else:
+            # Build URL with offset and count parameters
+            url = self._paginated_url(url, offset, count)
+
+        token = _current_page.set(offset // count + 1)
+        try:
+            return self._request(method, url, **kwargs)
+        finally:
+            _current_page.reset(token)
 
     def _get_paginated_content(
             self,
@@ -107,49 +532,551 @@ class BookStackClient:
             url: str,
             count: int = 100,
             max_items: int | None = None,
+            max_concurrency: int | None = None,
             **kwargs: Any
     ) -> list:
         """
-        Helper method to fetch paginated content with configurable parameters. For more information about pagination, check the BookStack API docs: https://demo.bookstackapp.com/api/docs#listing-endpoints
+        Helper method to fetch paginated content with configurable parameters. For more information about
+        pagination, check the BookStack API docs: https://demo.bookstackapp.com/api/docs#listing-endpoints
 
         Args:
             method (str): The HTTP method to use for the request.
             url (str): The URL to fetch the paginated content from.
             count (int): Number of items per page (default: 100).
             max_items (int | None): Maximum number of items to fetch (None for all).
+            max_concurrency (int | None): Number of pages fetched concurrently once the
+                first page reported the total (defaults to `pagination_concurrency`).
             **kwargs (Any): Additional keyword arguments to pass to the request.
 
         Returns:
-            list: A list of items fetched from the paginated endpoint.
+            list: A list of items fetched from the paginated endpoint, in offset order.
         """
+        concurrency = self._pagination_concurrency(max_concurrency)
+        prefetch = concurrency if concurrency > 1 else 0
+
         items = []
+        for page_items in self._iter_paginated_content(
+                method, url, count, max_items, prefetch=prefetch, **kwargs):
+            items.extend(page_items)
+
+        # Trim to max_items if specified
+        if max_items and len(items) > max_items:
+            items = items[:max_items]
+
+        return items
+
+    def _iter_paginated_content(
+            self,
+            method: str,
+            url: str,
+            count: int = 100,
+            max_items: int | None = None,
+            prefetch: int = 0,
+            **kwargs: Any
+    ) -> Iterator[list]:
+        """
+        Lazily walk a paginated endpoint, yielding one page of items at a time.
+
+        Only the current page (plus at most `prefetch` read-ahead pages) is held in
+        memory, so this is suitable for listings of any size.
+
+        Args:
+            method (str): The HTTP method to use for the request.
+            url (str): The URL to fetch the paginated content from.
+            count (int): Number of items per page (default: 100).
+            max_items (int | None): Maximum number of items to yield (None for all).
+            prefetch (int): Number of pages fetched ahead in the background while the
+                caller consumes the current one (0 fetches on demand).
+            **kwargs (Any): Additional keyword arguments to pass to the request.
+
+        Yields:
+            list: The items of each non-empty page, in offset order.
+        """
+        if prefetch > 0:
+            yield from self._iter_paginated_content_ahead(method, url, count, max_items, prefetch, **kwargs)
+            return
+
+        fetched = 0
         offset = 0
 
         while True:
-            # Build URL with offset and count parameters
-            separator = '&' if '?' in url else '?'
-            paginated_url = f"{url}{separator}offset={offset}&count={count}"
+            data = self._fetch_page(method, url, offset, count, **kwargs)
 
-            response = self._client.request(method, paginated_url, **kwargs)
-            response.raise_for_status()
-            data: dict = response.json()
+            page_items, total = self._page_parts(data)
 
-            page_items = data.get('data', [])
-            items.extend(page_items)
+            # Trim the last page to max_items if specified
+            if max_items and fetched + len(page_items) > max_items:
+                page_items = page_items[:max_items - fetched]
+            fetched += len(page_items)
 
-            total = data.get('total', 0)
+            if page_items:
+                yield page_items
 
             # Break conditions
-            if (len(items) >= total or
+            if (fetched >= total or
                 len(page_items) == 0 or
-                    (max_items and len(items) >= max_items)):
+                    (max_items and fetched >= max_items)):
                 break
 
             # Move to next page
             offset += count
 
-        # Trim to max_items if specified
+    def _iter_paginated_content_ahead(
+            self,
+            method: str,
+            url: str,
+            count: int,
+            max_items: int | None,
+            prefetch: int,
+            **kwargs: Any
+    ) -> Iterator[list]:
+        """Walk a paginated endpoint while keeping up to `prefetch` later pages in flight.
+
+        The first page is fetched directly to learn the total; the remaining offset
+        windows are then requested on a thread pool, at most `prefetch` at a time.
+        Pending requests are cancelled when the consumer stops early.
+        """
+        data = self._fetch_page(method, url, 0, count, **kwargs)
+        page_items, total = self._page_parts(data)
+        if max_items:
+            page_items = page_items[:max_items]
+        if not page_items:
+            return
+
+        offsets = iter(self._remaining_offsets(total, count, max_items))
+        fetched = 0
+        pending: deque = deque()
+        pool = ThreadPoolExecutor(max_workers=prefetch)
+
+        def schedule() -> None:
+            while len(pending) < prefetch:
+                offset = next(offsets, None)
+                if offset is None:
+                    break
+                pending.append(pool.submit(self._fetch_page, method, url, offset, count, **kwargs))
+
+        try:
+            while True:
+                # Keep the read-ahead window full before handing the page out
+                schedule()
+                fetched += len(page_items)
+                yield page_items
+
+                if not pending:
+                    break
+                page_items, _ = self._page_parts(pending.popleft().result())
+                if max_items and fetched + len(page_items) > max_items:
+                    page_items = page_items[:max_items - fetched]
+                if not page_items:
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncBookStackClient(_BaseClient):
+    """Asynchronous client for interacting with BookStack API.
+
+    Mirrors `BookStackClient`, but is built on `httpx.AsyncClient` so that many
+    requests can be in flight on a single event loop. Resource methods return
+    awaitables.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token_id: str,
+        token_secret: str,
+        verify_ssl: bool = True,
+        timeout: float = 30.0,
+        pagination_concurrency: int = 1,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        json_decoder: JSONDecoder | None = None,
+        hooks: RequestHooks | Sequence[RequestHooks] | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        **client_kwargs: Any,
+    ) -> None:
+        """
+        Initialize async BookStack client.
+
+        Args:
+            base_url (str): Base URL of BookStack instance
+            token_id (str): API token ID
+            token_secret (str): API token secret
+            verify_ssl (bool): Whether to verify SSL certificates
+            timeout (float): Request timeout in seconds
+            pagination_concurrency (int): Default number of pages fetched concurrently
+                by paginated listings once the total is known (1 fetches serially)
+            retry_policy (RetryPolicy | None): Optional policy for retrying rate limited
+                and transient failures, e.g. `RetryPolicy()`; without one, failed
+                requests are raised right away
+            rate_limiter (RateLimiter | None): Optional limiter every request waits
+                on; share one instance between clients using the same API token
+            cache (ResponseCache | None): Optional cache for GET/HEAD responses, e.g.
+                `InMemoryCache()`; cached values are shared and must not be mutated
+            json_decoder (JSONDecoder | None): Callable decoding response bodies from
+                bytes (defaults to orjson or msgspec when installed, else `json.loads`)
+            hooks (RequestHooks | Sequence[RequestHooks] | None): Receivers of an event
+                for every request attempt, e.g. a `MetricsCollector` or any object
+                with `on_request_start` and `on_request_end` methods
+            limits (httpx.Limits | None): Connection pool size and keep-alive expiry
+                (defaults to httpx's limits); keep `max_keepalive_connections` at
+                least at `pagination_concurrency` to reuse connections
+            http2 (bool): Whether to use HTTP/2 where the server supports it, so
+                concurrent requests share one connection (requires the `http2` extra)
+            **client_kwargs (Any): Additional arguments passed to `httpx.AsyncClient`, e.g.
+                `transport=AsyncSharedTransport(...)` to share one connection pool
+                between clients
+        """
+        super().__init__(
+            base_url,
+            token_id,
+            token_secret,
+            verify_ssl=verify_ssl,
+            timeout=timeout,
+            pagination_concurrency=pagination_concurrency,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            json_decoder=json_decoder,
+            hooks=hooks,
+            limits=limits,
+            http2=http2,
+        )
+
+        self._client = httpx.AsyncClient(**self._client_options(client_kwargs))
+
+    @cached_property
+    def attachments(self) -> "AsyncAttachmentsResource":
+        """Attachments API."""
+        from .resources.attachments import AsyncAttachmentsResource
+        return AsyncAttachmentsResource(self)
+
+    @cached_property
+    def audit_log(self) -> "AsyncAuditLogResource":
+        """Audit log API."""
+        from .resources.audit_log import AsyncAuditLogResource
+        return AsyncAuditLogResource(self)
+
+    @cached_property
+    def books(self) -> "AsyncBooksResource":
+        """Books API."""
+        from .resources.books import AsyncBooksResource
+        return AsyncBooksResource(self)
+
+    @cached_property
+    def chapters(self) -> "AsyncChaptersResource":
+        """Chapters API."""
+        from .resources.chapters import AsyncChaptersResource
+        return AsyncChaptersResource(self)
+
+    @cached_property
+    def images(self) -> "AsyncImagesResource":
+        """Image gallery API."""
+        from .resources.images import AsyncImagesResource
+        return AsyncImagesResource(self)
+
+    @cached_property
+    def pages(self) -> "AsyncPagesResource":
+        """Pages API."""
+        from .resources.pages import AsyncPagesResource
+        return AsyncPagesResource(self)
+
+    @cached_property
+    def recycle_bin(self) -> "AsyncRecycleBinResource":
+        """Recycle bin API."""
+        from .resources.recycle_bin import AsyncRecycleBinResource
+        return AsyncRecycleBinResource(self)
+
+    @cached_property
+    def shelves(self) -> "AsyncShelvesResource":
+        """Shelves API."""
+        from .resources.shelves import AsyncShelvesResource
+        return AsyncShelvesResource(self)
+
+    async def __aenter__(self) -> "AsyncBookStackClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client:
+            await self._client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        decoder: JSONDecoder | None = None,
+        **kwargs: Any
+    ) -> Any:
+        """Make HTTP request to BookStack API.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (without /api prefix)
+            decoder: Decoder for the response body overriding the client's JSON
+                decoder, e.g. `Model.model_validate_json` to validate raw bytes
+            **kwargs: Additional arguments passed to httpx request
+
+        Returns:
+            JSON response as dictionary, or whatever `decoder` returns
+
+        Raises:
+            BookStackAPIError: For HTTP errors with API error details
+            BookStackError: For connection/request errors
+        """
+        if self.cache is None:
+            return self._decode_response(await self._send(method, endpoint, **kwargs), decoder)
+
+        if method.upper() not in CACHEABLE_METHODS:
+            response = await self._send(method, endpoint, **kwargs)
+            self._invalidate_cache(self.cache, endpoint)
+            return self._decode_response(response, decoder)
+
+        key = self._cache_key(method, endpoint, kwargs.get("params"), decoder)
+        entry = self.cache.get(key)
+        if entry is not None:
+            if entry.is_fresh():
+                return entry.value
+            kwargs["headers"] = {**entry.conditional_headers(), **(kwargs.get("headers") or {})}
+
+        response = await self._send(method, endpoint, **kwargs)
+        return self._cache_response(self.cache, key, entry, response, decoder)
+
+    @asynccontextmanager
+    async def _stream(self, method: str, endpoint: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """Send a request without reading the response body. See `BookStackClient._stream`."""
+        response = await self._send(method, endpoint, stream=True, **kwargs)
+        try:
+            yield response
+        except httpx.RequestError as e:
+            raise create_connection_error(e) from e
+        finally:
+            await response.aclose()
+
+    async def _send(self, method: str, endpoint: str, stream: bool = False, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying transient failures according to the retry policy."""
+        attempt = 0
+        waited = 0.0
+
+        while True:
+            try:
+                return await self._send_once(method, endpoint, stream, attempt, **kwargs)
+            except BookStackError as error:
+                if isinstance(error, BookStackRateLimitError) and self.rate_limiter is not None:
+                    self.rate_limiter.penalize(error.retry_after)
+                if self.retry_policy is None:
+                    raise
+                delay = self.retry_policy.next_delay(method, error, attempt, waited)
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+            attempt += 1
+            waited += delay
+
+    async def _send_once(
+        self,
+        method: str,
+        endpoint: str,
+        stream: bool = False,
+        attempt: int = 0,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """Send a single request and map failures to BookStack errors."""
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        event = self._start_event(method, endpoint, attempt)
+        request = None
+        try:
+            send_options = {key: kwargs.pop(key) for key in SEND_OPTIONS if key in kwargs}
+            request = self._client.build_request(method, endpoint, **kwargs)
+            response = await self._client.send(request, stream=stream, **send_options)
+            # 304 answers a conditional request for a cached response
+            if response.status_code != 304:
+                response.raise_for_status()
+
+        except httpx.HTTPStatusError as e:
+            if stream:
+                try:
+                    await e.response.aread()
+                finally:
+                    await e.response.aclose()
+            error: BookStackError = create_api_error(e.response)
+            self._end_event(event, request, e.response, error)
+            raise error from e
+
+        except httpx.RequestError as e:
+            error = create_connection_error(e)
+            self._end_event(event, request, error=error)
+            raise error from e
+
+        self._end_event(event, request, response)
+        return response
+
+    async def _fetch_page(self, method: str, url: str, offset: int, count: int, **kwargs: Any) -> Any:
+        """Fetch a single page of a listing endpoint."""
+        if kwargs.get("params") is not None:
+            kwargs["params"] = httpx.QueryParams(kwargs["params"]).merge({"offset": offset, "count": count})
+        else:
+            url = self._paginated_url(url, offset, count)
+
+        token = _current_page.set(offset // count + 1)
+        try:
+            return await self._request(method, url, **kwargs)
+        finally:
+            _current_page.reset(token)
+
+    async def _get_paginated_content(
+            self,
+            method: str,
+            url: str,
+            count: int = 100,
+            max_items: int | None = None,
+            max_concurrency: int | None = None,
+            **kwargs: Any
+    ) -> list:
+        """
+        Helper method to fetch paginated content with configurable parameters.
+        See `BookStackClient._get_paginated_content`.
+
+        Args:
+            method (str): The HTTP method to use for the request.
+            url (str): The URL to fetch the paginated content from.
+            count (int): Number of items per page (default: 100).
+            max_items (int | None): Maximum number of items to fetch (None for all).
+            max_concurrency (int | None): Number of pages fetched concurrently once the
+                first page reported the total (defaults to `pagination_concurrency`).
+            **kwargs (Any): Additional keyword arguments to pass to the request.
+
+        Returns:
+            list: A list of items fetched from the paginated endpoint, in offset order.
+        """
+        concurrency = self._pagination_concurrency(max_concurrency)
+        prefetch = concurrency if concurrency > 1 else 0
+
+        items = []
+        async for page_items in self._iter_paginated_content(
+                method, url, count, max_items, prefetch=prefetch, **kwargs):
+            items.extend(page_items)
+
         if max_items and len(items) > max_items:
             items = items[:max_items]
 
         return items
+
+    async def _iter_paginated_content(
+            self,
+            method: str,
+            url: str,
+            count: int = 100,
+            max_items: int | None = None,
+            prefetch: int = 0,
+            **kwargs: Any
+    ) -> AsyncGenerator[list, None]:
+        """
+        Lazily walk a paginated endpoint, yielding one page of items at a time.
+        See `BookStackClient._iter_paginated_content`.
+
+        Args:
+            method (str): The HTTP method to use for the request.
+            url (str): The URL to fetch the paginated content from.
+            count (int): Number of items per page (default: 100).
+            max_items (int | None): Maximum number of items to yield (None for all).
+            prefetch (int): Number of pages fetched ahead in the background while the
+                caller consumes the current one (0 fetches on demand).
+            **kwargs (Any): Additional keyword arguments to pass to the request.
+
+        Yields:
+            list: The items of each non-empty page, in offset order.
+        """
+        if prefetch > 0:
+            async with aclosing(self._iter_paginated_content_ahead(
+                    method, url, count, max_items, prefetch, **kwargs)) as pages:
+                async for page_items in pages:
+                    yield page_items
+            return
+
+        fetched = 0
+        offset = 0
+
+        while True:
+            data = await self._fetch_page(method, url, offset, count, **kwargs)
+
+            page_items, total = self._page_parts(data)
+
+            if max_items and fetched + len(page_items) > max_items:
+                page_items = page_items[:max_items - fetched]
+            fetched += len(page_items)
+
+            if page_items:
+                yield page_items
+
+            if (fetched >= total or
+                len(page_items) == 0 or
+                    (max_items and fetched >= max_items)):
+                break
+
+            offset += count
+
+    async def _iter_paginated_content_ahead(
+            self,
+            method: str,
+            url: str,
+            count: int,
+            max_items: int | None,
+            prefetch: int,
+            **kwargs: Any
+    ) -> AsyncGenerator[list, None]:
+        """Walk a paginated endpoint while keeping up to `prefetch` later pages in flight.
+
+        See `BookStackClient._iter_paginated_content_ahead`. Pending tasks are
+        cancelled and awaited when the generator is closed; use
+        `contextlib.aclosing` when breaking out of the iteration early.
+        """
+        data = await self._fetch_page(method, url, 0, count, **kwargs)
+        page_items, total = self._page_parts(data)
+        if max_items:
+            page_items = page_items[:max_items]
+        if not page_items:
+            return
+
+        offsets = iter(self._remaining_offsets(total, count, max_items))
+        fetched = 0
+        pending: deque = deque()
+
+        def schedule() -> None:
+            while len(pending) < prefetch:
+                offset = next(offsets, None)
+                if offset is None:
+                    break
+                pending.append(asyncio.ensure_future(
+                    self._fetch_page(method, url, offset, count, **kwargs)))
+
+        try:
+            while True:
+                schedule()
+                fetched += len(page_items)
+                yield page_items
+
+                if not pending:
+                    break
+                page_items, _ = self._page_parts(await pending.popleft())
+                if max_items and fetched + len(page_items) > max_items:
+                    page_items = page_items[:max_items - fetched]
+                if not page_items:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
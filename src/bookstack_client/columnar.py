@@ -0,0 +1,326 @@
+"""Column-oriented containers for listing results."""
+
+import json
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from .sinks import Column
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+_TYPECODES = {int: "q", float: "d", bool: "b", datetime: "q", str: "i"}
+
+
+def _to_epoch_us(value: str | datetime) -> int:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+class ColumnData:
+    """The values of one column, stored in a typed `array.array`.
+
+    - `int`: int64 values
+    - `float`: float64 values
+    - `bool`: int8 values, 0 or 1
+    - `datetime`: int64 microseconds since the Unix epoch, in UTC
+    - `str`: dictionary encoded; int32 `values` are codes into `categories`
+
+    Missing values are 0 in `values` and 0 in `mask`, which is None while the
+    column has no missing values; missing strings have the code -1.
+    """
+
+    __slots__ = ("name", "type", "values", "mask", "_categories", "_codes")
+
+    def __init__(self, name: str, type: type) -> None:
+        self.name = name
+        self.type = type
+        self.values = array(_TYPECODES[type])
+        self.mask: bytearray | None = None
+        self._categories: list[str] = []
+        # Codes of known strings, or epoch values of parsed timestamps
+        self._codes: dict[Any, int] = {None: -1 if type is str else 0}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def categories(self) -> list[str] | None:
+        """The distinct values of a string column, in order of appearance; None for other columns."""
+        return self._categories if self.type is str else None
+
+    def __repr__(self) -> str:
+        return f"ColumnData({self.name!r}, {self.type.__name__}, {len(self)} values)"
+
+    def extend(self, raw: list[Any]) -> None:
+        """Append raw API values."""
+        start = len(self.values)
+        # Missing strings are marked by their code instead
+        missing = [] if self.type is str else [i for i, value in enumerate(raw) if value is None]
+
+        if self.type is str:
+            self.values.extend(self._lookup(raw, self._encode))
+        elif self.type is datetime:
+            # Listings repeat timestamps a lot, so each distinct one is parsed once
+            self.values.extend(self._lookup(raw, self._parse))
+        elif missing:
+            self.values.extend(0 if value is None else value for value in raw)
+        else:
+            self.values.extend(raw)
+
+        if self.mask is None and missing:
+            self.mask = bytearray(b"\x01") * start
+        if self.mask is not None:
+            self.mask.extend(b"\x01" * len(raw))
+            for i in missing:
+                self.mask[start + i] = 0
+
+    def _lookup(self, raw: list[Any], convert: Callable[[Any], int]) -> list[int]:
+        codes = self._codes
+        try:
+            return [codes[value] for value in raw]
+        except (KeyError, TypeError):
+            # Some values are new or unhashable; go through them one by one
+            return [convert(value) for value in raw]
+
+    def _encode(self, value: Any) -> int:
+        if isinstance(value, (dict, list)):
+            # Nested objects of union-typed fields, e.g. `RecycleBinItem.deletable`
+            value = json.dumps(value, separators=(",", ":"))
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._categories)
+            self._categories.append(value)
+        return code
+
+    def _parse(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = _to_epoch_us(value)
+        return code
+
+    def to_list(self) -> list[Any]:
+        """The values as Python objects, with None for missing values."""
+        if self.type is str:
+            lookup = [*self._categories, None]
+            return [lookup[code] for code in self.values]
+        values: list[Any]
+        if self.type is datetime:
+            values = [_EPOCH + timedelta(microseconds=value) for value in self.values]
+        elif self.type is bool:
+            values = [bool(value) for value in self.values]
+        else:
+            values = self.values.tolist()
+        if self.mask is not None:
+            values = [value if valid else None for value, valid in zip(values, self.mask, strict=True)]
+        return values
+
+    def to_numpy(self):
+        """The values as a NumPy array, sharing memory with `values` where possible.
+
+        Timestamps are `datetime64[us]` (UTC) and booleans `bool`; missing
+        values keep their placeholder, see `valid`. String columns are
+        decoded into an object array, which copies; use `values` and
+        `categories` for their codes.
+        """
+        import numpy as np
+
+        if self.type is str:
+            lookup = np.array([*self._categories, None], dtype=object)
+            return lookup[np.frombuffer(self.values, dtype=np.int32)]
+        dtype = {int: np.int64, float: np.float64, bool: np.int8, datetime: np.int64}[self.type]
+        values = np.frombuffer(self.values, dtype=dtype)
+        if self.type is bool:
+            return values.view(np.bool_)
+        if self.type is datetime:
+            return values.view("datetime64[us]")
+        return values
+
+    def valid(self):
+        """NumPy boolean array, True where a value is present."""
+        import numpy as np
+
+        if self.type is str:
+            return np.frombuffer(self.values, dtype=np.int32) >= 0
+        if self.mask is None:
+            return np.ones(len(self), dtype=np.bool_)
+        return np.frombuffer(self.mask, dtype=np.bool_)
+
+    def to_arrow(self):
+        """The values as a pyarrow array, sharing memory with `values` where possible.
+
+        Strings become a dictionary array and timestamps `timestamp[us, UTC]`.
+        Booleans, and columns with missing values, are copied, since Arrow
+        stores both as bitmaps.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if self.type is str:
+            codes = pa.Array.from_buffers(pa.int32(), len(self), [None, pa.py_buffer(self.values)])
+            if -1 in self.values:
+                codes = pc.if_else(pc.equal(codes, -1), pa.scalar(None, pa.int32()), codes)
+            return pa.DictionaryArray.from_arrays(codes, pa.array(self._categories, pa.string()))
+
+        arrow_type = {
+            int: pa.int64(), float: pa.float64(), bool: pa.int8(), datetime: pa.timestamp("us", tz="UTC"),
+        }[self.type]
+        values = pa.Array.from_buffers(arrow_type, len(self), [None, pa.py_buffer(self.values)])
+        if self.type is bool:
+            values = values.cast(pa.bool_())
+        if self.mask is not None:
+            mask = pa.Array.from_buffers(pa.int8(), len(self), [None, pa.py_buffer(self.mask)]).cast(pa.bool_())
+            values = pc.if_else(mask, values, pa.scalar(None, values.type))
+        return values
+
+    def to_pandas(self):
+        """The values as a pandas Series."""
+        import numpy as np
+        import pandas as pd
+
+        if self.type is str:
+            return pd.Series(pd.Categorical.from_codes(
+                np.frombuffer(self.values, dtype=np.int32), categories=self._categories), name=self.name)
+        if self.type is datetime:
+            values = self.to_numpy()
+            if self.mask is not None:
+                values = np.where(self.valid(), values, np.datetime64("NaT"))
+            return pd.Series(values, name=self.name).dt.tz_localize("UTC")
+        if self.mask is None:
+            return pd.Series(self.to_numpy(), name=self.name)
+        array_type = pd.arrays.BooleanArray if self.type is bool else (
+            pd.arrays.FloatingArray if self.type is float else pd.arrays.IntegerArray)
+        return pd.Series(array_type(self.to_numpy(), ~self.valid()), name=self.name)
+
+    def value_counts(self, bucket: timedelta | None = None) -> dict[Any, int]:
+        """Count the occurrences of each value, most frequent first.
+
+        Counting runs over the stored codes or values, not over Python
+        objects per item, and uses NumPy when it is installed.
+
+        Args:
+            bucket: For timestamp columns, count per interval of this length
+                instead of per value; keys are the interval starts
+        """
+        values: Any = self.values
+        if bucket is not None:
+            if self.type is not datetime:
+                raise ValueError("bucket can only be used with timestamp columns")
+            width = bucket // _MICROSECOND
+        try:
+            import numpy as np
+        except ImportError:
+            if bucket is not None:
+                values = (value // width * width for value in values)
+            counts: dict[Any, int] = Counter(values)
+        else:
+            values = np.frombuffer(values, dtype=values.typecode)
+            if bucket is not None:
+                values = values // width * width
+            keys, totals = np.unique(values, return_counts=True)
+            counts = dict(zip(keys.tolist(), totals.tolist(), strict=True))
+
+        if self.mask is not None and self.type is not str:
+            # Placeholders of missing values are counted apart from real zeros
+            missing = self.mask.count(0)
+            if missing:
+                counts[0] -= missing
+                if not counts[0]:
+                    del counts[0]
+                counts[None] = missing
+
+        return dict(sorted(
+            ((self._decode(key), count) for key, count in counts.items()),
+            key=lambda pair: pair[1], reverse=True,
+        ))
+
+    def _decode(self, key: Any) -> Any:
+        if key is None:
+            return None
+        if self.type is str:
+            return self._categories[key] if key >= 0 else None
+        if self.type is datetime:
+            return _EPOCH + timedelta(microseconds=key)
+        if self.type is bool:
+            return bool(key)
+        return key
+
+
+class ColumnarResult:
+    """Listing items stored column by column, for vectorized analytics.
+
+    Built from raw API items without creating a model per item. Each column
+    is a `ColumnData` of typed arrays that NumPy and pyarrow can use
+    without copying, and the whole result converts into a pandas DataFrame
+    or an Arrow table.
+
+    Example:
+        log = client.audit_log.list_columnar(count=500)
+        log.value_counts("type")
+        log.value_counts("created_at", bucket=timedelta(hours=1))
+        df = log.to_pandas()
+    """
+
+    def __init__(self, columns: Iterable[Column]) -> None:
+        """Initialize columnar result.
+
+        Args:
+            columns: Columns to store, see `sinks.model_columns`
+        """
+        self.columns = list(columns)
+        self._data = {column.name: ColumnData(column.name, column.type) for column in self.columns}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> ColumnData:
+        return self._data[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __repr__(self) -> str:
+        return f"ColumnarResult({len(self)} rows, columns={list(self._data)})"
+
+    @property
+    def names(self) -> list[str]:
+        """Column names in order."""
+        return list(self._data)
+
+    def extend(self, items: list[dict[str, Any]]) -> None:
+        """Append a batch of raw API items, e.g. a listing page."""
+        for column in self.columns:
+            if len(column.path) == 1:
+                key = column.path[0]
+                values = [item.get(key) for item in items]
+            else:
+                values = [column.get(item) for item in items]
+            self._data[column.name].extend(values)
+        self._length += len(items)
+
+    def value_counts(self, name: str, bucket: timedelta | None = None) -> dict[Any, int]:
+        """Count the occurrences of each value of a column. See `ColumnData.value_counts`."""
+        return self._data[name].value_counts(bucket)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """NumPy arrays by column name. See `ColumnData.to_numpy`."""
+        return {name: data.to_numpy() for name, data in self._data.items()}
+
+    def to_arrow(self):
+        """A pyarrow Table. See `ColumnData.to_arrow`."""
+        import pyarrow as pa
+
+        return pa.Table.from_arrays([data.to_arrow() for data in self._data.values()], names=self.names)
+
+    def to_pandas(self):
+        """A pandas DataFrame with categorical string columns and UTC timestamps."""
+        import pandas as pd
+
+        return pd.DataFrame({name: data.to_pandas() for name, data in self._data.items()})
@@ -0,0 +1,29 @@
+"""JSON decoding of BookStack API response bodies."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+JSONDecoder = Callable[[bytes], Any]
+"""Callable turning a raw response body into Python objects or models."""
+
+
+def get_default_decoder() -> JSONDecoder:
+    """Get the fastest available JSON decoder.
+
+    Prefers `orjson`, then `msgspec`, and falls back to the standard library
+    `json` module when neither is installed.
+    """
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+        return msgspec.json.Decoder().decode
+    except ImportError:
+        pass
+
+    return json.loads
@@ -0,0 +1,137 @@
+"""Bulk export of pages, chapters and books to files."""
+
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Literal
+
+from .bulk import BulkProgressCallback, BulkResult, run_bulk
+from .models.base import ExportFormat
+
+ExportType = Literal["page", "chapter", "book"]
+
+ExportItem = tuple[ExportType, int]
+"""An entity to export as `(type, id)`, e.g. `("page", 42)`."""
+
+EXPORT_EXTENSIONS = {
+    "markdown": "md",
+    "html": "html",
+    "pdf": "pdf",
+    "plain-text": "txt",
+    "plaintext": "txt",
+}
+"""File extension used for each export format."""
+
+
+class ExportedFile:
+    """A file on disk holding one export of a bulk run."""
+
+    __slots__ = ("path", "bytes_written", "skipped")
+
+    def __init__(self, path: Path, bytes_written: int = 0, skipped: bool = False) -> None:
+        self.path = path
+        self.bytes_written = bytes_written
+        self.skipped = skipped
+
+    def __repr__(self) -> str:
+        state = "skipped" if self.skipped else f"{self.bytes_written} bytes"
+        return f"ExportedFile({str(self.path)!r}, {state})"
+
+
+class BulkExporter:
+    """Export many pages, chapters or books concurrently, streaming each to disk.
+
+    Every export is streamed in chunks into a temporary file in the output
+    directory and renamed to `<type>-<id>.<ext>` once complete, so neither
+    the exports nor partial files ever linger in memory or in the output. An
+    interrupted run can simply be started again: exports whose file already
+    exists are skipped.
+
+    Example:
+        exporter = BulkExporter(client, "export", format="pdf", max_workers=4)
+        results = exporter.export_pages(page.id for page in client.pages.iter())
+        failed = [result.item for result in results if not result.ok]
+    """
+
+    def __init__(
+        self,
+        client,
+        directory: str | os.PathLike,
+        format: ExportFormat = "markdown",
+        max_workers: int = 4,
+        chunk_size: int = 65536,
+        overwrite: bool = False,
+        progress: BulkProgressCallback | None = None,
+    ) -> None:
+        """Initialize bulk exporter.
+
+        Args:
+            client: The `BookStackClient` to export with
+            directory: Output directory; it is created if missing
+            format: Export format ("markdown", "html", "pdf" or "plaintext")
+            max_workers: Maximum number of exports running at the same time
+            chunk_size: Size of the chunks streamed to disk
+            overwrite: Export again even if the output file already exists
+            progress: Callback invoked after each finished export
+        """
+        if format not in EXPORT_EXTENSIONS:
+            raise ValueError(f"Unsupported export format: {format!r}")
+
+        self._client = client
+        self.directory = Path(directory)
+        self.format = format
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.overwrite = overwrite
+        self.progress = progress
+
+    def path_for(self, type: ExportType, id: int) -> Path:
+        """Output path of an export."""
+        return self.directory / f"{type}-{id}.{EXPORT_EXTENSIONS[self.format]}"
+
+    def export_pages(self, page_ids: Iterable[int]) -> list[BulkResult[ExportItem, ExportedFile]]:
+        """Export pages. See `export`."""
+        return self.export(("page", page_id) for page_id in page_ids)
+
+    def export_chapters(self, chapter_ids: Iterable[int]) -> list[BulkResult[ExportItem, ExportedFile]]:
+        """Export chapters. See `export`."""
+        return self.export(("chapter", chapter_id) for chapter_id in chapter_ids)
+
+    def export_books(self, book_ids: Iterable[int]) -> list[BulkResult[ExportItem, ExportedFile]]:
+        """Export books. See `export`."""
+        return self.export(("book", book_id) for book_id in book_ids)
+
+    def export(self, items: Iterable[ExportItem]) -> list[BulkResult[ExportItem, ExportedFile]]:
+        """Export entities concurrently.
+
+        A failing export, whether the API request or writing the file failed,
+        does not stop the others; its error is recorded in the result instead.
+
+        Args:
+            items: `(type, id)` pairs, e.g. `[("book", 1), ("page", 42)]`
+
+        Returns:
+            One result per item, in the order of `items`, holding the
+            `ExportedFile` or the error
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return run_bulk(self._export_one, items, max_workers=self.max_workers, progress=self.progress)
+
+    def _export_one(self, item: ExportItem) -> ExportedFile:
+        type, id = item
+        path = self.path_for(type, id)
+        if not self.overwrite and path.exists():
+            return ExportedFile(path, skipped=True)
+
+        resource = {"page": self._client.pages, "chapter": self._client.chapters, "book": self._client.books}[type]
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{path.name}.", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                written = resource.export(id, self.format, f, self.chunk_size)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        return ExportedFile(path, bytes_written=written)
@@ -0,0 +1,215 @@
+"""In-memory index of the shelf, book, chapter and page hierarchy."""
+
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Literal, cast
+
+from .models.books import BookDetail
+from .models.shelves import ShelfDetail
+from .utils import read_or_none
+
+NodeType = Literal["bookshelf", "book", "chapter", "page"]
+
+
+class ContentNode:
+    """A shelf, book, chapter or page in a `ContentTree`.
+
+    `data` holds the model the node was built from: `ShelfDetail` for
+    shelves, `BookDetail` for books, `BookContentItem` for chapters and pages
+    directly in a book, and `BookContentPage` for pages inside a chapter.
+    """
+
+    __slots__ = ("type", "id", "name", "slug", "parent", "children", "data")
+
+    def __init__(self, type: NodeType, data: Any, parent: "ContentNode | None" = None) -> None:
+        self.type = type
+        self.id: int = data.id
+        self.name: str = data.name
+        self.slug: str = data.slug
+        self.parent = parent
+        self.children: list[ContentNode] = []
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"ContentNode({self.type} {self.id}, {self.name!r})"
+
+    @property
+    def book(self) -> "ContentNode | None":
+        """The book containing this node (the node itself for books)."""
+        node: ContentNode | None = self
+        while node is not None and node.type != "book":
+            node = node.parent
+        return node
+
+    def ancestors(self) -> list["ContentNode"]:
+        """Parents of this node, nearest first. Books have none; see `ContentTree.shelves_of`."""
+        ancestors = []
+        node = self.parent
+        while node is not None:
+            ancestors.append(node)
+            node = node.parent
+        return ancestors
+
+    def walk(self) -> Iterator["ContentNode"]:
+        """Iterate over this node and all its descendants, depth first."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+
+class ContentTree:
+    """Index of the content hierarchy with constant-time lookups.
+
+    Books appear once, however many shelves list them: the same book node is
+    a child of each of its shelves, while its `parent` is None. Books on no
+    shelf are still part of the tree via `books`.
+    """
+
+    def __init__(self) -> None:
+        self.shelves: list[ContentNode] = []
+        self.books: list[ContentNode] = []
+        self._by_id: dict[tuple[str, int], ContentNode] = {}
+        self._by_slug: dict[tuple[str | None, ...], ContentNode] = {}
+        self._shelves_of: dict[int, list[ContentNode]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[ContentNode]:
+        return iter(self._by_id.values())
+
+    @staticmethod
+    def _slug_key(node: ContentNode) -> tuple[str | None, ...]:
+        if node.type in ("bookshelf", "book"):
+            return node.type, node.slug
+        # Chapter and page slugs are only unique within their book
+        book = node.book
+        return node.type, book.slug if book is not None else None, node.slug
+
+    def _add(self, node: ContentNode) -> ContentNode:
+        self._by_id[(node.type, node.id)] = node
+        self._by_slug[self._slug_key(node)] = node
+        return node
+
+    def get(self, type: NodeType, id: int) -> ContentNode | None:
+        """Look up a node by type and id."""
+        return self._by_id.get((type, id))
+
+    def get_by_slug(self, type: NodeType, slug: str, book_slug: str | None = None) -> ContentNode | None:
+        """Look up a node by slug; chapters and pages also need their book's slug."""
+        key = (type, slug) if type in ("bookshelf", "book") else (type, book_slug, slug)
+        return self._by_slug.get(key)
+
+    def shelves_of(self, book: ContentNode) -> list[ContentNode]:
+        """Shelves listing a book."""
+        return self._shelves_of.get(book.id, [])
+
+    def add_book(self, detail: BookDetail) -> ContentNode:
+        """Add a book with its chapters and pages, replacing an existing entry."""
+        # A replaced book keeps its position in `books` and on its shelves
+        position = len(self.books)
+        shelf_positions: list[tuple[ContentNode, int]] = []
+        existing = self.get("book", detail.id)
+        if existing is not None:
+            position = self.books.index(existing)
+            shelf_positions = [(shelf, shelf.children.index(existing)) for shelf in self.shelves_of(existing)]
+            self.remove(existing)
+
+        book = self._add(ContentNode("book", detail))
+        for item in detail.contents:
+            child = self._add(ContentNode(cast(NodeType, item.type), item, book))
+            book.children.append(child)
+            for page in item.pages:
+                child.children.append(self._add(ContentNode("page", page, child)))
+        self.books.insert(position, book)
+
+        for shelf, index in shelf_positions:
+            shelf.children.insert(index, book)
+            self._shelves_of.setdefault(book.id, []).append(shelf)
+        return book
+
+    def add_shelf(self, detail: ShelfDetail) -> ContentNode:
+        """Add a shelf, linking it to the books already in the tree and replacing an existing entry."""
+        # A replaced shelf keeps its position in `shelves`
+        position = len(self.shelves)
+        existing = self.get("bookshelf", detail.id)
+        if existing is not None:
+            position = self.shelves.index(existing)
+            self.remove(existing)
+
+        shelf = self._add(ContentNode("bookshelf", detail))
+        for shelf_book in detail.books:
+            book = self.get("book", shelf_book.id)
+            if book is not None:
+                shelf.children.append(book)
+                self._shelves_of.setdefault(book.id, []).append(shelf)
+        self.shelves.insert(position, shelf)
+        return shelf
+
+    def remove(self, node: ContentNode) -> None:
+        """Remove a node and its descendants from the tree."""
+        descendants = [node] if node.type == "bookshelf" else list(node.walk())
+        for descendant in descendants:
+            del self._by_id[(descendant.type, descendant.id)]
+            del self._by_slug[self._slug_key(descendant)]
+
+        if node.parent is not None:
+            node.parent.children.remove(node)
+        elif node.type == "book":
+            self.books.remove(node)
+            for shelf in self._shelves_of.pop(node.id, []):
+                shelf.children.remove(node)
+        else:
+            self.shelves.remove(node)
+            for book in node.children:
+                self._shelves_of[book.id].remove(node)
+
+
+def load_hierarchy(client, max_workers: int = 8, shelves: bool = True) -> ContentTree:
+    """Load the whole content hierarchy into a `ContentTree`.
+
+    Book details already contain their chapters and pages, so the tree is
+    built from the book and shelf listings plus one request per book and per
+    shelf. These requests run concurrently on up to `max_workers` threads,
+    and each book is fetched once even if it is on several shelves.
+
+    Example:
+        tree = load_hierarchy(client)
+        page = tree.get_by_slug("page", "installation", book_slug="admin-guide")
+        breadcrumbs = [node.name for node in reversed(page.ancestors())]
+
+    Args:
+        client: The `BookStackClient` to load with
+        max_workers: Maximum number of concurrent requests
+        shelves: Also load shelves; disable when only books are needed
+
+    Returns:
+        The loaded tree
+    """
+    books: dict[int, Future[BookDetail | None]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        shelf_ids = pool.submit(lambda: [item["id"] for item in client.shelves.iter(validate=False, count=500)]) \
+            if shelves else None
+
+        for item in client.books.iter(validate=False, count=500):
+            books[item["id"]] = pool.submit(read_or_none, client.books.read, item["id"])
+
+        shelf_details: list[Future[ShelfDetail | None]] = [
+            pool.submit(read_or_none, client.shelves.read, shelf_id)
+            for shelf_id in (shelf_ids.result() if shelf_ids is not None else [])
+        ]
+
+        tree = ContentTree()
+        for future in books.values():
+            detail = future.result()
+            if detail is not None:
+                tree.add_book(detail)
+
+        for shelf_future in shelf_details:
+            shelf = shelf_future.result()
+            if shelf is not None:
+                tree.add_shelf(shelf)
+
+    return tree
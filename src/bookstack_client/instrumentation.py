@@ -0,0 +1,204 @@
+"""Request instrumentation hooks and per-endpoint metrics."""
+
+import math
+import re
+import threading
+import time
+from collections import deque
+
+from .exceptions import BookStackError
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """Reduce an endpoint to its route, e.g. `/pages/12/export/pdf?x=1` to `/pages/{id}/export/pdf`."""
+    return _ID_SEGMENT.sub("/{id}", endpoint.split("?", 1)[0])
+
+
+class RequestEvent:
+    """A single HTTP request attempt as seen by `RequestHooks`.
+
+    Retries of a request are separate events with an increasing `attempt`.
+    The outcome fields (`elapsed`, `status_code`, `bytes_received`, `error`)
+    are set once the attempt finished. For streamed responses, such as
+    exports and attachment downloads, the attempt finishes when the headers
+    arrive, so the body is not included in `elapsed` and `bytes_received`.
+    """
+
+    __slots__ = (
+        "method", "endpoint", "route", "attempt", "page", "started_at",
+        "elapsed", "status_code", "bytes_sent", "bytes_received", "error", "_start",
+    )
+
+    def __init__(self, method: str, endpoint: str, attempt: int = 0, page: int | None = None) -> None:
+        self.method = method
+        self.endpoint = endpoint
+        self.route = normalize_endpoint(endpoint)
+        self.attempt = attempt
+        self.page = page
+        self.started_at = time.time()
+        self.elapsed: float | None = None
+        self.status_code: int | None = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.error: BookStackError | None = None
+        self._start = time.perf_counter()
+
+    def __repr__(self) -> str:
+        outcome = self.status_code if self.error is None else type(self.error).__name__
+        return f"RequestEvent({self.method} {self.endpoint}, attempt={self.attempt}, {outcome})"
+
+
+class RequestHooks:
+    """Interface for receiving request events from a client.
+
+    Both methods are no-ops; override the ones you need. They are called on
+    the thread (or task) sending the request, so implementations shared by
+    concurrent requests must be thread-safe and should return quickly.
+    """
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Called right before a request attempt is sent."""
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        """Called after a request attempt finished or failed."""
+
+
+class EndpointStats:
+    """Aggregated metrics of one method and route."""
+
+    __slots__ = (
+        "method", "route", "count", "errors", "retries", "total_time",
+        "p50", "p95", "p99", "bytes_sent", "bytes_received", "throughput",
+    )
+
+    def __init__(self, method: str, route: str) -> None:
+        self.method = method
+        self.route = route
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.total_time = 0.0
+        self.p50 = 0.0
+        self.p95 = 0.0
+        self.p99 = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.throughput = 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed attempts."""
+        return self.errors / self.count if self.count else 0.0
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        return self.total_time / self.count if self.count else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"EndpointStats({self.method} {self.route}, count={self.count}, "
+            f"p50={self.p50 * 1000:.1f}ms, p95={self.p95 * 1000:.1f}ms, p99={self.p99 * 1000:.1f}ms, "
+            f"error_rate={self.error_rate:.1%})"
+        )
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class _EndpointSamples:
+    __slots__ = ("stats", "latencies", "first_at", "last_at")
+
+    def __init__(self, method: str, route: str, max_samples: int) -> None:
+        self.stats = EndpointStats(method, route)
+        self.latencies: deque[float] = deque(maxlen=max_samples)
+        self.first_at = 0.0
+        self.last_at = 0.0
+
+
+class MetricsCollector(RequestHooks):
+    """Aggregates request events into per-endpoint latency, error and throughput metrics.
+
+    Requests are grouped by method and route, with numeric ids replaced by
+    `{id}`. Percentiles are computed over the latest `max_samples` attempts
+    of each route; counts and totals cover all attempts.
+
+    Example:
+        metrics = MetricsCollector()
+        client = BookStackClient(url, token_id, token_secret, hooks=metrics)
+        ...
+        print(metrics.report())
+    """
+
+    def __init__(self, max_samples: int = 10000) -> None:
+        """Initialize metrics collector.
+
+        Args:
+            max_samples: Number of latencies kept per route for percentiles
+        """
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._endpoints: dict[tuple[str, str], _EndpointSamples] = {}
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        key = (event.method, event.route)
+        finished_at = event.started_at + (event.elapsed or 0.0)
+        with self._lock:
+            samples = self._endpoints.get(key)
+            if samples is None:
+                samples = self._endpoints[key] = _EndpointSamples(event.method, event.route, self.max_samples)
+                samples.first_at = event.started_at
+
+            stats = samples.stats
+            stats.count += 1
+            stats.errors += event.error is not None
+            stats.retries += event.attempt > 0
+            stats.total_time += event.elapsed or 0.0
+            stats.bytes_sent += event.bytes_sent
+            stats.bytes_received += event.bytes_received
+            samples.latencies.append(event.elapsed or 0.0)
+            samples.last_at = max(samples.last_at, finished_at)
+
+    def reset(self) -> None:
+        """Discard all collected metrics."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> list[EndpointStats]:
+        """Current metrics per endpoint, ordered by total time spent, highest first."""
+        with self._lock:
+            endpoints = []
+            for samples in self._endpoints.values():
+                stats = EndpointStats(samples.stats.method, samples.stats.route)
+                for name in ("count", "errors", "retries", "total_time", "bytes_sent", "bytes_received"):
+                    setattr(stats, name, getattr(samples.stats, name))
+                endpoints.append((stats, list(samples.latencies), samples.last_at - samples.first_at))
+
+        for stats, latencies, window in endpoints:
+            latencies.sort()
+            stats.p50 = _percentile(latencies, 0.50)
+            stats.p95 = _percentile(latencies, 0.95)
+            stats.p99 = _percentile(latencies, 0.99)
+            stats.throughput = stats.count / window if window > 0 else 0.0
+        return sorted((stats for stats, _, _ in endpoints), key=lambda stats: stats.total_time, reverse=True)
+
+    def report(self) -> str:
+        """Render `snapshot` as a plain text table."""
+        header = (
+            f"{'endpoint':<40} {'count':>7} {'err%':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'total s':>8} {'req/s':>7}"
+        )
+        lines = [header, "-" * len(header)]
+        for stats in self.snapshot():
+            lines.append(
+                f"{stats.method + ' ' + stats.route:<40} {stats.count:>7} {stats.error_rate * 100:>6.1f} "
+                f"{stats.p50 * 1000:>8.1f} {stats.p95 * 1000:>8.1f} {stats.p99 * 1000:>8.1f} "
+                f"{stats.total_time:>8.2f} {stats.throughput:>7.1f}"
+            )
+        return "\n".join(lines)
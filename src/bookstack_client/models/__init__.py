@@ -1,132 +1,211 @@
 """BookStack client models."""
 
-# Base models
-from .base import User, Tag, Cover, Links, ExportFormat
-
-# Book models
-from .books import (
-    BookListItem,
-    BookDetail,
-    BookCreate,
-    BookUpdate,
-    BookContentItem,
-    BookContentPage,
-    ShelfBook,
-)
-
-# Chapter models
-from .chapters import (
-    ChapterListItem,
-    ChapterDetail,
-    ChapterCreate,
-    ChapterUpdate,
-    ChapterPage,
-)
-
-# Page models
-from .pages import (
-    PageListItem,
-    PageDetail,
-    PageCreate,
-    PageUpdate,
-)
-
-# Attachment models
-from .attachments import (
-    AttachmentListItem,
-    AttachmentDetail,
-    AttachmentCreate,
-    AttachmentUpdate,
-)
-
-# Image models
-from .images import (
-    ImageListItem,
-    ImageDetail,
-    ImageCreate,
-    ImageUpdate,
-    ImageThumbs,
-    ImageContent,
-)
-
-# Search models
-from .search import (
-    SearchResultItem,
-    SearchPreviewHtml,
-    SearchResultBook,
-    SearchResultChapter,
-    SearchResponse,
-    SearchRequest,
-)
-
-# Shelf models
-from .shelves import (
-    ShelfListItem,
-    ShelfDetail,
-    ShelfCreate,
-    ShelfUpdate,
-    ShelfResponse,
-)
-
-# User models
-from .users import (
-    UserListItem,
-    UserDetail,
-    UserCreate,
-    UserUpdate,
-    UserDelete,
-    UserRole,
-)
-
-# Role models
-from .roles import (
-    RoleListItem,
-    RoleDetail,
-    RoleCreate,
-    RoleUpdate,
-    RoleResponse,
-    RoleUser,
-)
-
-# Recycle bin models
-from .recycle_bin import (
-    RecycleBinItem,
-    DeletablePage,
-    DeletableBook,
-    DeletableChapter,
-    DeletableBookshelf,
-    DeletableParent,
-    RecycleBinRestoreResponse,
-    RecycleBinDestroyResponse,
-)
-
-# Permission models
-from .permissions import (
-    ContentPermissions,
-    ContentPermissionsUpdate,
-    RolePermission,
-    RolePermissionUpdate,
-    FallbackPermissions,
-    FallbackPermissionsUpdate,
-    PermissionRole,
-)
-
-# Audit log models
-from .audit_log import (
-    AuditLogItem,
-)
-
-# Response models
-from .responses import (
-    PaginatedResponse,
-    ErrorDetail,
-    ValidationError,
-    BookListResponse,
-    ChapterListResponse,
-    PageListResponse,
-    AttachmentListResponse,
-    ImageListResponse,
-)
+from typing import TYPE_CHECKING
+
+from ..utils import lazy_exports
+
+if TYPE_CHECKING:
+    # Base models
+    from .base import User, Tag, Cover, Links, ExportFormat
+
+    # Book models
+    from .books import (
+        BookListItem,
+        BookDetail,
+        BookCreate,
+        BookUpdate,
+        BookContentItem,
+        BookContentPage,
+        ShelfBook,
+    )
+
+    # Chapter models
+    from .chapters import (
+        ChapterListItem,
+        ChapterDetail,
+        ChapterCreate,
+        ChapterUpdate,
+        ChapterPage,
+    )
+
+    # Page models
+    from .pages import (
+        PageListItem,
+        PageDetail,
+        PageCreate,
+        PageUpdate,
+    )
+
+    # Attachment models
+    from .attachments import (
+        AttachmentListItem,
+        AttachmentDetail,
+        AttachmentCreate,
+        AttachmentUpdate,
+    )
+
+    # Image models
+    from .images import (
+        ImageListItem,
+        ImageDetail,
+        ImageCreate,
+        ImageUpdate,
+        ImageThumbs,
+        ImageContent,
+    )
+
+    # Search models
+    from .search import (
+        SearchResultItem,
+        SearchPreviewHtml,
+        SearchResultBook,
+        SearchResultChapter,
+        SearchResponse,
+        SearchRequest,
+    )
+
+    # Shelf models
+    from .shelves import (
+        ShelfListItem,
+        ShelfDetail,
+        ShelfCreate,
+        ShelfUpdate,
+        ShelfResponse,
+    )
+
+    # User models
+    from .users import (
+        UserListItem,
+        UserDetail,
+        UserCreate,
+        UserUpdate,
+        UserDelete,
+        UserRole,
+    )
+
+    # Role models
+    from .roles import (
+        RoleListItem,
+        RoleDetail,
+        RoleCreate,
+        RoleUpdate,
+        RoleResponse,
+        RoleUser,
+    )
+
+    # Recycle bin models
+    from .recycle_bin import (
+        RecycleBinItem,
+        DeletablePage,
+        DeletableBook,
+        DeletableChapter,
+        DeletableBookshelf,
+        DeletableParent,
+        RecycleBinRestoreResponse,
+        RecycleBinDestroyResponse,
+    )
+
+    # Permission models
+    from .permissions import (
+        ContentPermissions,
+        ContentPermissionsUpdate,
+        RolePermission,
+        RolePermissionUpdate,
+        FallbackPermissions,
+        FallbackPermissionsUpdate,
+        PermissionRole,
+    )
+
+    # Audit log models
+    from .audit_log import (
+        AuditLogItem,
+    )
+
+    # Validation helpers
+    from .lazy import (
+        ResponseMode,
+        LazyModelList,
+    )
+    from .records import (
+        RecordPage,
+        record_from_data,
+        record_type,
+        to_record,
+    )
+
+    # Response models
+    from .responses import (
+        PaginatedResponse,
+        ErrorDetail,
+        ValidationError,
+        BookListResponse,
+        ChapterListResponse,
+        PageListResponse,
+        AttachmentListResponse,
+        ImageListResponse,
+    )
+
+_EXPORTS = {
+    ".base": ("User", "Tag", "Cover", "Links", "ExportFormat"),
+    ".books": (
+        "BookListItem",
+        "BookDetail",
+        "BookCreate",
+        "BookUpdate",
+        "BookContentItem",
+        "BookContentPage",
+        "ShelfBook",
+    ),
+    ".chapters": ("ChapterListItem", "ChapterDetail", "ChapterCreate", "ChapterUpdate", "ChapterPage"),
+    ".pages": ("PageListItem", "PageDetail", "PageCreate", "PageUpdate"),
+    ".attachments": ("AttachmentListItem", "AttachmentDetail", "AttachmentCreate", "AttachmentUpdate"),
+    ".images": ("ImageListItem", "ImageDetail", "ImageCreate", "ImageUpdate", "ImageThumbs", "ImageContent"),
+    ".search": (
+        "SearchResultItem",
+        "SearchPreviewHtml",
+        "SearchResultBook",
+        "SearchResultChapter",
+        "SearchResponse",
+        "SearchRequest",
+    ),
+    ".shelves": ("ShelfListItem", "ShelfDetail", "ShelfCreate", "ShelfUpdate", "ShelfResponse"),
+    ".users": ("UserListItem", "UserDetail", "UserCreate", "UserUpdate", "UserDelete", "UserRole"),
+    ".roles": ("RoleListItem", "RoleDetail", "RoleCreate", "RoleUpdate", "RoleResponse", "RoleUser"),
+    ".recycle_bin": (
+        "RecycleBinItem",
+        "DeletablePage",
+        "DeletableBook",
+        "DeletableChapter",
+        "DeletableBookshelf",
+        "DeletableParent",
+        "RecycleBinRestoreResponse",
+        "RecycleBinDestroyResponse",
+    ),
+    ".permissions": (
+        "ContentPermissions",
+        "ContentPermissionsUpdate",
+        "RolePermission",
+        "RolePermissionUpdate",
+        "FallbackPermissions",
+        "FallbackPermissionsUpdate",
+        "PermissionRole",
+    ),
+    ".audit_log": ("AuditLogItem",),
+    ".lazy": ("ResponseMode", "LazyModelList"),
+    ".records": ("RecordPage", "record_from_data", "record_type", "to_record"),
+    ".responses": (
+        "PaginatedResponse",
+        "ErrorDetail",
+        "ValidationError",
+        "BookListResponse",
+        "ChapterListResponse",
+        "PageListResponse",
+        "AttachmentListResponse",
+        "ImageListResponse",
+    ),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Base
@@ -225,6 +304,14 @@ __all__ = [
     # Audit Log
     "AuditLogItem",
 
+    # Validation helpers
+    "ResponseMode",
+    "LazyModelList",
+    "RecordPage",
+    "record_from_data",
+    "record_type",
+    "to_record",
+
     # Responses
     "PaginatedResponse",
     "ErrorDetail",
@@ -15,13 +15,12 @@ class AttachmentBase(BaseModel):
     order: int
     created_at: datetime
     updated_at: datetime
-    created_by: int
-    updated_by: int
 
 
 class AttachmentListItem(AttachmentBase):
     """Attachment as returned in list responses."""
-    pass
+    created_by: int
+    updated_by: int
 
 
 class AttachmentDetail(AttachmentBase):
@@ -26,15 +26,14 @@ class ImageBase(BaseModel):
     path: str
     type: Literal["gallery", "drawio"]
     uploaded_to: int
-    created_by: int
-    updated_by: int
     created_at: datetime
     updated_at: datetime
 
 
 class ImageListItem(ImageBase):
     """Image as returned in list responses."""
-    pass
+    created_by: int
+    updated_by: int
 
 
 class ImageDetail(ImageBase):
@@ -0,0 +1,120 @@
+"""Deferred validation of list response items."""
+
+from collections.abc import Iterator, Sequence
+from typing import Any, Literal, TypeVar, overload
+from pydantic import BaseModel
+
+from .records import RecordPage, record_from_data, to_record
+
+M = TypeVar('M', bound=BaseModel)
+R = TypeVar('R', bound=BaseModel)
+
+ResponseMode = Literal["validate", "lazy", "compact"]
+"""How list endpoints turn response items into models.
+
+- ``validate``: validate every item up front (default)
+- ``lazy``: validate each item the first time it is accessed
+- ``compact``: skip the models and keep every item as a read-only named
+  tuple record with the model's field names (see `record_type`), which
+  takes far less memory than a model instance; the listing is returned as
+  a `RecordPage` and values keep their JSON types
+"""
+
+
+class LazyModelList(Sequence[M]):
+    """Read-only list of raw items that are validated into models on first access."""
+
+    __slots__ = ("_model", "_items", "_models")
+
+    def __init__(self, model: type[M], items: list[dict[str, Any]]) -> None:
+        """Initialize lazy model list.
+
+        Args:
+            model: The model class items are validated into
+            items: Raw item data as returned by the API
+        """
+        self._model = model
+        self._items = items
+        self._models: list[M | None] = [None] * len(items)
+
+    @property
+    def raw(self) -> list[dict[str, Any]]:
+        """The unvalidated item data."""
+        return self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[M]: ...
+
+    def __getitem__(self, index: int | slice) -> M | list[M]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        instance = self._models[index]
+        if instance is None:
+            instance = self._model.model_validate(self._items[index])
+            self._models[index] = instance
+        return instance
+
+    def __iter__(self) -> Iterator[M]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._model.__name__}, {len(self)} items)"
+
+
+@overload
+def build_list_response(
+    response_model: type[R],
+    item_model: type[BaseModel],
+    items: list[Any],
+    mode: Literal["validate", "lazy"] = "validate",
+) -> R: ...
+
+
+@overload
+def build_list_response(
+    response_model: type[R],
+    item_model: type[BaseModel],
+    items: list[Any],
+    mode: Literal["compact"],
+) -> RecordPage: ...
+
+
+def build_list_response(
+    response_model: type[R],
+    item_model: type[BaseModel],
+    items: list[Any],
+    mode: ResponseMode = "validate",
+) -> R | RecordPage:
+    """Wrap raw list items in a paginated response model.
+
+    Args:
+        response_model: Paginated response model, e.g. `AuditLogResponse`
+        item_model: Model of a single item, e.g. `AuditLogItem`
+        items: Raw item data as returned by the API, or items already validated
+            into `item_model` (or, in compact mode, converted into its record)
+        mode: How items are turned into models, see `ResponseMode`
+
+    Returns:
+        The response model holding the items, or a `RecordPage` in compact mode
+    """
+    if mode == "validate":
+        return response_model(data=items, total=len(items))
+    if mode == "lazy":
+        return response_model.model_construct(data=LazyModelList(item_model, items), total=len(items))
+    if mode == "compact":
+        records = [
+            item if isinstance(item, tuple)
+            else to_record(item) if isinstance(item, BaseModel)
+            else record_from_data(item_model, item)
+            for item in items
+        ]
+        return RecordPage(records, len(records))
+    raise ValueError(f"Unknown response mode: {mode!r}")
@@ -0,0 +1,120 @@
+"""Compact read-only records for large list results."""
+
+from collections import namedtuple
+from collections.abc import Callable
+from functools import cache
+from typing import Any, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+
+@cache
+def record_type(model: type[BaseModel]) -> type[Any]:
+    """Get the record type of a model: a named tuple with the model's field names.
+
+    Records take a fraction of the memory of model instances, which carry a
+    `__dict__` and the set of explicitly set fields each. Fields are read
+    the same way (`record.name`) but cannot be assigned. Field names that
+    are not valid tuple field names are replaced by their position (`_3`).
+    """
+    return namedtuple(f"{model.__name__}Record", model.model_fields, rename=True)
+
+
+class RecordPage:
+    """A listing fetched in compact mode, holding its items as records.
+
+    It has the `data` and `total` attributes of a paginated response, but it
+    is not a model: use `record._asdict()` to turn a record into a dict.
+    """
+
+    __slots__ = ("data", "total")
+
+    def __init__(self, data: list[tuple], total: int) -> None:
+        self.data = data
+        self.total = total
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.data)} records, total={self.total})"
+
+
+def _compact(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return to_record(value)
+    if isinstance(value, list):
+        return tuple(_compact(item) for item in value)
+    return value
+
+
+def to_record(instance: BaseModel) -> tuple:
+    """Convert a model instance into its record, nested models and lists included."""
+    return record_type(type(instance))._make(
+        _compact(getattr(instance, name)) for name in type(instance).model_fields)
+
+
+def _nested_model(annotation: Any) -> type[BaseModel] | None:
+    """Find the model a field holds, e.g. `User` for `User | None` or `list[User]`."""
+    if get_origin(annotation) is None and isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = _nested_model(arg)
+        if model is not None:
+            return model
+    return None
+
+
+def _from_data(value: Any, model: type[BaseModel] | None) -> Any:
+    if isinstance(value, dict) and model is not None:
+        return record_from_data(model, value)
+    if isinstance(value, list):
+        return tuple(_from_data(item, model) for item in value)
+    return value
+
+
+def _field_default(field: FieldInfo) -> Any:
+    if field.is_required():
+        return None
+    return _from_data(field.get_default(call_default_factory=True), None)
+
+
+@cache
+def _record_builder(model: type[BaseModel]) -> Callable[[dict[str, Any]], tuple]:
+    make = record_type(model)._make
+    fields = [
+        (field.alias or name, _nested_model(field.annotation), _field_default(field))
+        for name, field in model.model_fields.items()
+    ]
+
+    def build(data: dict[str, Any]) -> tuple:
+        return make(_from_data(data[key], nested) if key in data else default for key, nested, default in fields)
+
+    return build
+
+
+def record_from_data(model: type[BaseModel], data: dict[str, Any]) -> tuple:
+    """Convert raw item data into the record of `model` without validating it.
+
+    Nested objects become records of their models and missing optional
+    fields get their defaults. Values keep their JSON types, so dates stay
+    strings and invalid data is not detected.
+    """
+    return _record_builder(model)(data)
+
+
+@cache
+def record_page_decoder(
+    item_model: type[BaseModel],
+    json_decoder: Callable[[bytes], Any],
+) -> Callable[[bytes], dict[str, Any]]:
+    """Get a decoder turning the items of a listing page straight into records of `item_model`.
+
+    No models are built. The decoder is cached per item model and JSON
+    decoder, so responses it decoded can be found in a response cache.
+    """
+    build = _record_builder(item_model)
+
+    def decode(content: bytes) -> dict[str, Any]:
+        page = json_decoder(content)
+        return {"data": [build(item) for item in page["data"]], "total": page["total"]}
+
+    return decode
@@ -1,18 +1,22 @@
 """API response wrapper models."""
 
-from typing import Generic, TypeVar, Any
+import importlib
+import threading
+from typing import TYPE_CHECKING, Generic, TypeVar, Any
 from pydantic import BaseModel, Field
-from .chapters import ChapterListItem
-from .images import ImageListItem
-from .attachments import AttachmentListItem
-from .pages import PageListItem
-from .books import BookListItem
-from .search import SearchResultItem
-from .shelves import ShelfListItem
-from .users import UserListItem
-from .roles import RoleListItem
-from .recycle_bin import RecycleBinItem
-from .audit_log import AuditLogItem
+
+if TYPE_CHECKING:
+    from .chapters import ChapterListItem
+    from .images import ImageListItem
+    from .attachments import AttachmentListItem
+    from .pages import PageListItem
+    from .books import BookListItem
+    from .search import SearchResultItem
+    from .shelves import ShelfListItem
+    from .users import UserListItem
+    from .roles import RoleListItem
+    from .recycle_bin import RecycleBinItem
+    from .audit_log import AuditLogItem
 
 T = TypeVar('T')
 
@@ -36,15 +40,50 @@ class ValidationError(BaseModel):
     errors: dict[str, list[str]] = Field(default_factory=dict)
 
 
-# Commonly used response types
-BookListResponse = PaginatedResponse[BookListItem]
-ChapterListResponse = PaginatedResponse[ChapterListItem]
-PageListResponse = PaginatedResponse[PageListItem]
-AttachmentListResponse = PaginatedResponse[AttachmentListItem]
-ImageListResponse = PaginatedResponse[ImageListItem]
-SearchResponse = PaginatedResponse[SearchResultItem]
-ShelfListResponse = PaginatedResponse[ShelfListItem]
-UserListResponse = PaginatedResponse[UserListItem]
-RoleListResponse = PaginatedResponse[RoleListItem]
-RecycleBinResponse = PaginatedResponse[RecycleBinItem]
-AuditLogResponse = PaginatedResponse[AuditLogItem]
+# Commonly used response types, created on first use by `__getattr__` so
+# that importing one of them does not build the schemas of all item models
+_RESPONSE_ITEMS = {
+    "BookListResponse": (".books", "BookListItem"),
+    "ChapterListResponse": (".chapters", "ChapterListItem"),
+    "PageListResponse": (".pages", "PageListItem"),
+    "AttachmentListResponse": (".attachments", "AttachmentListItem"),
+    "ImageListResponse": (".images", "ImageListItem"),
+    "SearchResponse": (".search", "SearchResultItem"),
+    "ShelfListResponse": (".shelves", "ShelfListItem"),
+    "UserListResponse": (".users", "UserListItem"),
+    "RoleListResponse": (".roles", "RoleListItem"),
+    "RecycleBinResponse": (".recycle_bin", "RecycleBinItem"),
+    "AuditLogResponse": (".audit_log", "AuditLogItem"),
+}
+_response_lock = threading.Lock()
+
+if TYPE_CHECKING:
+    BookListResponse = PaginatedResponse[BookListItem]
+    ChapterListResponse = PaginatedResponse[ChapterListItem]
+    PageListResponse = PaginatedResponse[PageListItem]
+    AttachmentListResponse = PaginatedResponse[AttachmentListItem]
+    ImageListResponse = PaginatedResponse[ImageListItem]
+    SearchResponse = PaginatedResponse[SearchResultItem]
+    ShelfListResponse = PaginatedResponse[ShelfListItem]
+    UserListResponse = PaginatedResponse[UserListItem]
+    RoleListResponse = PaginatedResponse[RoleListItem]
+    RecycleBinResponse = PaginatedResponse[RecycleBinItem]
+    AuditLogResponse = PaginatedResponse[AuditLogItem]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, item = _RESPONSE_ITEMS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # Concurrent first uses must end up with the same class
+    with _response_lock:
+        response = globals().get(name)
+        if response is None:
+            item_model = getattr(importlib.import_module(module, __package__), item)
+            response = globals()[name] = PaginatedResponse[item_model]  # type: ignore[valid-type]
+    return response
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_RESPONSE_ITEMS})
@@ -2,7 +2,6 @@
 
 from datetime import datetime
 from pydantic import BaseModel
-from .base import User
 
 
 class RoleUser(BaseModel):
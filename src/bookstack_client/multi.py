@@ -0,0 +1,317 @@
+"""Running the same call against many BookStack instances concurrently."""
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from operator import attrgetter
+from typing import Any, Generic, TypeVar
+
+from pydantic import ValidationError
+
+from .client import BookStackClient
+from .exceptions import BookStackError, BookStackTimeoutError
+
+R = TypeVar("R")
+
+Call = str | Callable[..., Any]
+"""A dotted client attribute path such as "audit_log.list", or a callable taking the client."""
+
+
+class InstanceResult(Generic[R]):
+    """A value or an error, tagged with the instance it came from."""
+
+    __slots__ = ("instance", "value", "error", "elapsed")
+
+    def __init__(
+        self, instance: str, value: R | None = None, error: Exception | None = None, elapsed: float | None = None,
+    ) -> None:
+        self.instance = instance
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded on this instance."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error is not None else f"value={self.value!r}"
+        return f"InstanceResult({self.instance!r}, {outcome})"
+
+
+class _Finished:
+    """Queue marker of an instance whose items are exhausted."""
+
+    __slots__ = ("instance",)
+
+    def __init__(self, instance: str) -> None:
+        self.instance = instance
+
+
+class MultiInstanceClient:
+    """Fans calls out to a set of BookStack instances and streams back tagged results.
+
+    Every instance gets its own worker threads, `concurrency` of them, so
+    concurrent calls are bounded per instance and a slow or failing instance
+    only holds up its own work. Failures of the types in `errors` are
+    returned as results of their instance instead of being raised.
+
+    A `timeout` bounds the wall time of a call across all instances.
+    Instances that have not answered by then get a `BookStackTimeoutError`
+    result. Their requests cannot be interrupted and keep the instance's
+    worker busy until they finish, so combine it with the clients' own
+    request `timeout`.
+
+    Example:
+        multi = MultiInstanceClient.from_config({
+            "sales": {"base_url": "https://wiki.sales.example", "token_id": ..., "token_secret": ...},
+            "ops": {"base_url": "https://wiki.ops.example", "token_id": ..., "token_secret": ...},
+        }, timeout=60)
+        for result in multi.run("audit_log.list", count=50, params={"filter[type]": "page_delete"}):
+            if result.ok:
+                print(result.instance, result.value.total)
+    """
+
+    def __init__(
+        self,
+        clients: Mapping[str, BookStackClient],
+        concurrency: int = 1,
+        timeout: float | None = None,
+        errors: tuple[type[Exception], ...] = (BookStackError, OSError, ValidationError),
+    ) -> None:
+        """Initialize multi-instance client.
+
+        Args:
+            clients: Clients by instance name
+            concurrency: Maximum number of calls running on each instance at a time
+            timeout: Default time limit of a call across all instances, in seconds
+            errors: Exception types returned per instance instead of being raised;
+                model validation errors are included, as instances may run
+                different BookStack versions
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.clients = dict(clients)
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.errors = errors
+        self._owns_clients = False
+        self._executors = {
+            name: ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"bookstack-{name}")
+            for name in self.clients
+        }
+
+    @classmethod
+    def from_config(
+        cls,
+        instances: Mapping[str, Mapping[str, Any]],
+        concurrency: int = 1,
+        timeout: float | None = None,
+        **client_kwargs: Any,
+    ) -> "MultiInstanceClient":
+        """Create clients from per-instance settings; they are closed by `close`.
+
+        Args:
+            instances: `BookStackClient` arguments (base_url, token_id,
+                token_secret, ...) by instance name
+            concurrency: Maximum number of calls running on each instance at a time
+            timeout: Default time limit of a call across all instances, in seconds
+            **client_kwargs: Arguments passed to every `BookStackClient`, e.g. a
+                `SharedTransport` or `retry_policy`
+        """
+        multi = cls(
+            {name: BookStackClient(**{**client_kwargs, **settings}) for name, settings in instances.items()},
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+        multi._owns_clients = True
+        return multi
+
+    def __enter__(self) -> "MultiInstanceClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker threads, and close the clients if created by `from_config`."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        if self._owns_clients:
+            for client in self.clients.values():
+                client.close()
+
+    def _resolve(self, call: Call, client: BookStackClient) -> Callable[..., Any]:
+        if isinstance(call, str):
+            return attrgetter(call)(client)
+        return lambda *args, **kwargs: call(client, *args, **kwargs)
+
+    def _names(self, instances: Iterable[str] | None) -> list[str]:
+        if instances is None:
+            return list(self.clients)
+        names = list(instances)
+        unknown = set(names) - set(self.clients)
+        if unknown:
+            raise KeyError(f"Unknown instances: {', '.join(sorted(unknown))}")
+        return names
+
+    def _deadline(self, timeout: float | None) -> float | None:
+        return time.monotonic() + timeout if timeout is not None else None
+
+    def run(
+        self,
+        call: Call,
+        *args: Any,
+        instances: Iterable[str] | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Iterator[InstanceResult]:
+        """Run a call on every instance, yielding results as they finish.
+
+        Args:
+            call: Client method path like "audit_log.list", or a callable
+                receiving the client as its first argument
+            *args: Positional arguments of the call
+            instances: Names of the instances to run on (default: all)
+            timeout: Time limit for all instances, in seconds (defaults to
+                the `timeout` given at construction)
+            **kwargs: Keyword arguments of the call
+
+        Yields:
+            One result per instance, in the order they finish
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = self._deadline(timeout)
+
+        def invoke(name: str) -> InstanceResult:
+            start = time.perf_counter()
+            try:
+                value = self._resolve(call, self.clients[name])(*args, **kwargs)
+            except self.errors as error:
+                return InstanceResult(name, error=error, elapsed=time.perf_counter() - start)
+            return InstanceResult(name, value, elapsed=time.perf_counter() - start)
+
+        futures = {self._executors[name].submit(invoke, name): name for name in self._names(instances)}
+        pending = set(futures)
+        try:
+            remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            for future in as_completed(futures, timeout=remaining):
+                pending.discard(future)
+                yield future.result()
+        except FuturesTimeoutError:
+            for future in pending:
+                if future.done():
+                    yield future.result()
+                else:
+                    yield InstanceResult(futures[future], error=BookStackTimeoutError(
+                        f"Instance {futures[future]!r} did not answer in time", timeout))
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def gather(
+        self,
+        call: Call,
+        *args: Any,
+        instances: Iterable[str] | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> dict[str, InstanceResult]:
+        """Run a call on every instance and wait for all results. See `run`.
+
+        Returns:
+            Results by instance name, in the order of the instances
+        """
+        names = self._names(instances)
+        results = {
+            result.instance: result for result in self.run(call, *args, instances=names, timeout=timeout, **kwargs)
+        }
+        return {name: results[name] for name in names}
+
+    def iter_items(
+        self,
+        call: Call,
+        *args: Any,
+        instances: Iterable[str] | None = None,
+        timeout: float | None = None,
+        buffer: int = 1000,
+        **kwargs: Any,
+    ) -> Iterator[InstanceResult]:
+        """Stream the items of an iterating call from every instance, merged as they arrive.
+
+        Example:
+            for result in multi.iter_items("audit_log.iter", validate=False, params=query):
+                if result.ok:
+                    write(result.instance, result.value)
+                else:
+                    log.warning("%s failed: %s", result.instance, result.error)
+
+        Args:
+            call: Client method path returning an iterable, like "audit_log.iter",
+                or a callable receiving the client as its first argument
+            *args: Positional arguments of the call
+            instances: Names of the instances to run on (default: all)
+            timeout: Time limit for all instances, in seconds (defaults to
+                the `timeout` given at construction)
+            buffer: Maximum number of items held between the instances and the
+                consumer; instances pause while it is full
+            **kwargs: Keyword arguments of the call
+
+        Yields:
+            A result per item, holding it in `value`. An instance that fails
+            yields one last result holding the error.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = self._deadline(timeout)
+        items: queue.Queue[InstanceResult | _Finished] = queue.Queue(maxsize=buffer)
+        stopped = threading.Event()
+
+        def put(entry: InstanceResult | _Finished) -> bool:
+            while not stopped.is_set():
+                try:
+                    items.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(name: str) -> None:
+            try:
+                for item in self._resolve(call, self.clients[name])(*args, **kwargs):
+                    if deadline is not None and time.monotonic() > deadline:
+                        raise BookStackTimeoutError(f"Instance {name!r} did not finish in time", timeout)
+                    if not put(InstanceResult(name, item)):
+                        return
+            except self.errors as error:
+                put(InstanceResult(name, error=error))
+            finally:
+                put(_Finished(name))
+
+        active = set(self._names(instances))
+        futures = [self._executors[name].submit(produce, name) for name in active]
+        try:
+            while active:
+                try:
+                    remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+                    entry = items.get(timeout=remaining)
+                except queue.Empty:
+                    for name in sorted(active):
+                        yield InstanceResult(name, error=BookStackTimeoutError(
+                            f"Instance {name!r} did not finish in time", timeout))
+                    return
+                if isinstance(entry, _Finished):
+                    active.discard(entry.instance)
+                else:
+                    yield entry
+            for future in futures:
+                # Surfaces exceptions not listed in `errors`
+                future.result()
+        finally:
+            stopped.set()
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,80 @@
+"""Client-side rate limiting for BookStack API requests."""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting the rate of API requests.
+
+    BookStack throttles API calls per user and minute (`API_REQUESTS_PER_MIN`,
+    180 by default). The bucket refills continuously at `requests / period`
+    tokens per second and holds at most `burst` tokens, so requests are spread
+    evenly instead of being sent in bursts that trip the server limit.
+
+    Callers reserve a token and then sleep for the returned delay, which keeps
+    the lock short and allows one limiter to be shared between threads, event
+    loops and several clients using the same API token.
+    """
+
+    def __init__(self, requests: int = 180, period: float = 60.0, burst: int = 1) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            requests: Number of requests allowed per period
+            period: Length of the period in seconds
+            burst: Maximum number of requests that may be sent back to back
+        """
+        if requests < 1 or period <= 0 or burst < 1:
+            raise ValueError("requests, period and burst must be positive")
+
+        self.requests = requests
+        self.period = period
+        self.burst = burst
+        self._rate = requests / period
+        self._tokens = float(burst)
+        # Time the token count was last updated. Moved into the future while
+        # the server asked us to back off.
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return the number of seconds to wait before sending.
+
+        Tokens may be taken on credit; the returned delay then covers the time
+        needed to pay the debt back, which queues concurrent callers in order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+
+            delay = max(0.0, self._updated - now)
+            if self._tokens < 0:
+                delay += -self._tokens / self._rate
+            return delay
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def penalize(self, retry_after: float | None = None) -> None:
+        """Pause the bucket after the server rejected a request with 429.
+
+        Args:
+            retry_after: Seconds the server asked to wait (defaults to the
+                interval between two requests)
+        """
+        pause = retry_after if retry_after is not None else 1 / self._rate
+        with self._lock:
+            until = time.monotonic() + pause
+            if until > self._updated:
+                self._updated = until
+                self._tokens = min(self._tokens, 0.0)
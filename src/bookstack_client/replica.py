@@ -0,0 +1,284 @@
+"""Incremental local replica of BookStack content in SQLite."""
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Literal
+
+from .exceptions import BookStackPermissionError
+from .models.books import BookDetail
+from .models.chapters import ChapterDetail
+from .models.pages import PageDetail
+from .models.shelves import ShelfDetail
+from .utils import format_filter_datetime, read_or_none
+
+EntityType = Literal["bookshelf", "book", "chapter", "page"]
+
+Entity = ShelfDetail | BookDetail | ChapterDetail | PageDetail
+"""Detail model of a replicated entity."""
+
+ENTITY_MODELS: dict[EntityType, type[Entity]] = {
+    "bookshelf": ShelfDetail,
+    "book": BookDetail,
+    "chapter": ChapterDetail,
+    "page": PageDetail,
+}
+"""Detail model stored for each entity type."""
+
+_RESOURCES = {"bookshelf": "shelves", "book": "books", "chapter": "chapters", "page": "pages"}
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class SyncReport:
+    """Summary of a `LocalReplica.sync` run."""
+
+    __slots__ = ("updated", "deleted", "deletions_checked")
+
+    def __init__(self) -> None:
+        self.updated: dict[str, int] = {entity_type: 0 for entity_type in ENTITY_MODELS}
+        self.deleted = 0
+        self.deletions_checked = False
+
+    def __repr__(self) -> str:
+        return f"SyncReport(updated={self.updated}, deleted={self.deleted}, deletions_checked={self.deletions_checked})"
+
+
+class LocalReplica:
+    """Read replica of shelves, books, chapters and pages in a SQLite database.
+
+    Each entity is stored as its detail model (`ShelfDetail`, `BookDetail`,
+    `ChapterDetail`, `PageDetail`) next to a few indexed columns for queries.
+    After the first run, `sync` only downloads entities whose `updated_at`
+    moved since the previous run and removes entities that appeared in the
+    recycle bin since then.
+
+    Reading the recycle bin requires admin permissions for settings and
+    permissions. Without them, deletions are skipped (see
+    `SyncReport.deletions_checked`) and only a `full` sync removes deleted
+    entities. Items permanently removed from the recycle bin between two
+    runs are also only caught by a full sync.
+
+    Restoring an entity from the recycle bin does not change its
+    `updated_at`, so restored entities are only picked up again by a full
+    sync.
+
+    Example:
+        replica = LocalReplica("wiki.db")
+        report = replica.sync(client)
+        page = replica.get("page", 42)
+    """
+
+    def __init__(self, path: str | os.PathLike = ":memory:") -> None:
+        """Initialize local replica.
+
+        Args:
+            path: Path of the SQLite database (":memory:" for a temporary replica)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entities ("
+                "type TEXT NOT NULL, id INTEGER NOT NULL, book_id INTEGER, chapter_id INTEGER, "
+                "name TEXT NOT NULL, slug TEXT NOT NULL, updated_at TEXT NOT NULL, data TEXT NOT NULL, "
+                "PRIMARY KEY (type, id))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS entities_book ON entities (book_id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS entities_chapter ON entities (chapter_id)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS replica_state (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The underlying connection, for ad hoc analytics queries on the `entities` table."""
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM entities").fetchone()[0]
+
+    def count(self, entity_type: EntityType) -> int:
+        """Number of stored entities of a type."""
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM entities WHERE type = ?", (entity_type,)).fetchone()[0]
+
+    def get(self, entity_type: EntityType, entity_id: int) -> Entity | None:
+        """Get a stored entity as its detail model, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM entities WHERE type = ? AND id = ?", (entity_type, entity_id)).fetchone()
+        return ENTITY_MODELS[entity_type].model_validate_json(row[0]) if row else None
+
+    def iter(self, entity_type: EntityType) -> Iterator[Entity]:
+        """Iterate over the stored entities of a type in id order."""
+        model = ENTITY_MODELS[entity_type]
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM entities WHERE type = ? ORDER BY id", (entity_type,)).fetchall()
+        for (data,) in rows:
+            yield model.model_validate_json(data)
+
+    def _get_state(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM replica_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO replica_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    def _store(self, entity_type: EntityType, entities: list[Entity]) -> None:
+        rows = [
+            (
+                entity_type, entity.id, getattr(entity, "book_id", None), getattr(entity, "chapter_id", None) or None,
+                entity.name, entity.slug, entity.updated_at.isoformat(), entity.model_dump_json(),
+            )
+            for entity in entities
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entities (type, id, book_id, chapter_id, name, slug, updated_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def delete(self, entity_type: EntityType, entity_id: int) -> int:
+        """Remove an entity, and for books and chapters their contents.
+
+        Returns:
+            Number of removed entities
+        """
+        with self._lock, self._conn:
+            deleted = self._conn.execute(
+                "DELETE FROM entities WHERE type = ? AND id = ?", (entity_type, entity_id)).rowcount
+            if entity_type == "book":
+                deleted += self._conn.execute(
+                    "DELETE FROM entities WHERE type IN ('chapter', 'page') AND book_id = ?", (entity_id,)).rowcount
+            elif entity_type == "chapter":
+                deleted += self._conn.execute(
+                    "DELETE FROM entities WHERE type = 'page' AND chapter_id = ?", (entity_id,)).rowcount
+        return deleted
+
+    def sync(self, client, full: bool = False, count: int = 100, max_workers: int = 8) -> SyncReport:
+        """Bring the replica up to date.
+
+        Args:
+            client: The `BookStackClient` to read content with
+            full: Download everything again and remove entities no longer
+                listed, regardless of the stored state
+            count: Number of items per listing page
+            max_workers: Number of concurrent detail requests
+
+        Returns:
+            What the run changed
+        """
+        report = SyncReport()
+        if full:
+            # Taken before listing: pruning covers earlier deletions, later ones are seen next time
+            self._skip_deletions(client)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for entity_type in ENTITY_MODELS:
+                seen = self._sync_type(client, pool, entity_type, full, count, report)
+                if full:
+                    report.deleted += self._prune(entity_type, seen)
+
+        if full:
+            report.deletions_checked = True
+        else:
+            self._sync_deletions(client, count, report)
+        return report
+
+    def _sync_type(self, client, pool: ThreadPoolExecutor, entity_type: EntityType, full: bool, count: int,
+                   report: SyncReport) -> set[int]:
+        resource = getattr(client, _RESOURCES[entity_type])
+        state_key = f"{entity_type}:updated_at"
+
+        query = {"sort": "+updated_at"}
+        since = None if full else self._get_state(state_key)
+        if since is not None:
+            query["filter[updated_at:gte]"] = since
+
+        seen: set[int] = set()
+        for items in resource.iter_pages(validate=False, count=count, params=query, prefetch=1):
+            seen.update(item["id"] for item in items)
+
+            # The filter only has second precision, so items at the boundary
+            # are listed again; skip those the replica already has
+            stored = {} if full else self._stored_versions(entity_type, [item["id"] for item in items])
+            ids = [
+                item["id"] for item in items
+                if stored.get(item["id"]) != _parse_timestamp(item["updated_at"])
+            ]
+            entities: list[Entity | None] = list(pool.map(partial(read_or_none, resource.read), ids))
+
+            self._store(entity_type, [entity for entity in entities if entity is not None])
+            for entity_id, entity in zip(ids, entities, strict=True):
+                if entity is None:
+                    # Deleted between listing and reading
+                    report.deleted += self.delete(entity_type, entity_id)
+            report.updated[entity_type] += sum(entity is not None for entity in entities)
+
+            # Items are sorted by updated_at, so the last one moves the state forward
+            self._set_state(state_key, format_filter_datetime(_parse_timestamp(items[-1]["updated_at"])))
+
+        return seen
+
+    def _stored_versions(self, entity_type: EntityType, ids: list[int]) -> dict[int, datetime]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, updated_at FROM entities WHERE type = ? AND id IN ({', '.join('?' * len(ids))})",
+                (entity_type, *ids),
+            ).fetchall()
+        return {entity_id: datetime.fromisoformat(updated_at) for entity_id, updated_at in rows}
+
+    def _prune(self, entity_type: EntityType, seen: set[int]) -> int:
+        with self._lock:
+            stored = {row[0] for row in self._conn.execute("SELECT id FROM entities WHERE type = ?", (entity_type,))}
+        return sum(self.delete(entity_type, entity_id) for entity_id in stored - seen)
+
+    def _set_deletions_cursor(self, item: dict) -> None:
+        # The server's timestamps rather than the local clock, which may be off
+        self._set_state("recycle_bin:created_at", format_filter_datetime(_parse_timestamp(item["created_at"])))
+
+    def _sync_deletions(self, client, count: int, report: SyncReport) -> None:
+        query = {"sort": "+created_at"}
+        since = self._get_state("recycle_bin:created_at")
+        if since is not None:
+            # Second precision: entries at the boundary are listed again, which is harmless
+            query["filter[created_at:gte]"] = since
+
+        try:
+            for items in client.recycle_bin.iter_pages(validate=False, count=count, params=query):
+                for item in items:
+                    report.deleted += self.delete(item["deletable_type"], item["deletable_id"])
+                # Items are sorted by created_at, so the last one moves the cursor forward
+                self._set_deletions_cursor(items[-1])
+        except BookStackPermissionError:
+            return
+        report.deletions_checked = True
+
+    def _skip_deletions(self, client) -> None:
+        """Move the deletions cursor to the newest recycle bin entry, already covered by a full sync."""
+        query = {"sort": "-created_at"}
+        try:
+            for item in client.recycle_bin.iter(validate=False, count=1, max_items=1, params=query):
+                self._set_deletions_cursor(item)
+        except BookStackPermissionError:
+            pass
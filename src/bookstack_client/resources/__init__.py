@@ -1,7 +1,47 @@
 """This module initializes the resources for the BookStack client."""
 
-from .audit_log import AuditLogResource
+from typing import TYPE_CHECKING
+
+from ..utils import lazy_exports
+
+if TYPE_CHECKING:
+    from .attachments import AttachmentsResource, AsyncAttachmentsResource
+    from .audit_log import AuditLogResource, AsyncAuditLogResource
+    from .books import BooksResource, AsyncBooksResource
+    from .chapters import ChaptersResource, AsyncChaptersResource
+    from .images import ImagesResource, AsyncImagesResource
+    from .pages import PagesResource, AsyncPagesResource
+    from .recycle_bin import RecycleBinResource, AsyncRecycleBinResource
+    from .shelves import ShelvesResource, AsyncShelvesResource
+
+_EXPORTS = {
+    ".attachments": ("AttachmentsResource", "AsyncAttachmentsResource"),
+    ".audit_log": ("AuditLogResource", "AsyncAuditLogResource"),
+    ".books": ("BooksResource", "AsyncBooksResource"),
+    ".chapters": ("ChaptersResource", "AsyncChaptersResource"),
+    ".images": ("ImagesResource", "AsyncImagesResource"),
+    ".pages": ("PagesResource", "AsyncPagesResource"),
+    ".recycle_bin": ("RecycleBinResource", "AsyncRecycleBinResource"),
+    ".shelves": ("ShelvesResource", "AsyncShelvesResource"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
+    "AttachmentsResource",
+    "AsyncAttachmentsResource",
     "AuditLogResource",
+    "AsyncAuditLogResource",
+    "BooksResource",
+    "AsyncBooksResource",
+    "ChaptersResource",
+    "AsyncChaptersResource",
+    "ImagesResource",
+    "AsyncImagesResource",
+    "PagesResource",
+    "AsyncPagesResource",
+    "RecycleBinResource",
+    "AsyncRecycleBinResource",
+    "ShelvesResource",
+    "AsyncShelvesResource",
 ]
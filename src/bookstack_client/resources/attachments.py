@@ -0,0 +1,253 @@
+import base64
+import os
+import re
+from typing import Any, BinaryIO
+
+from .base import AsyncListingResource, ListingResource, Upload, multipart_kwargs, open_upload
+from ..models.attachments import AttachmentListItem, AttachmentDetail
+from ..models.responses import AttachmentListResponse
+from ..utils import HttpMethod
+
+_CONTENT_KEY = re.compile(rb'"content"\s*:\s*"')
+_EXTERNAL = re.compile(rb'"external"\s*:\s*true')
+
+
+class _Base64ContentWriter:
+    """Decodes the base64 `content` field of a streamed attachment response into a file.
+
+    Only the JSON preceding the field and a remainder of less than four
+    base64 characters are buffered, so memory use does not depend on the
+    size of the attachment.
+    """
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        self._head = b""
+        self._pending = b""
+        self._in_content = False
+        self._done = False
+        self.written = 0
+
+    def feed(self, chunk: bytes) -> None:
+        if self._done:
+            return
+
+        if not self._in_content:
+            self._head += chunk
+            match = _CONTENT_KEY.search(self._head)
+            if match is None:
+                return
+            if _EXTERNAL.search(self._head, 0, match.start()):
+                raise ValueError("Attachment is an external link, its content is a URL rather than a file")
+            chunk = self._head[match.end():]
+            self._head = b""
+            self._in_content = True
+
+        end = chunk.find(b'"')
+        if end != -1:
+            chunk = chunk[:end]
+            self._done = True
+
+        # JSON encoders may escape the "/" of the base64 alphabet as "\/"
+        data = self._pending + chunk.replace(b"\\", b"")
+        usable = len(data) if self._done else len(data) - len(data) % 4
+        self._pending = data[usable:]
+        if usable:
+            decoded = base64.b64decode(data[:usable], validate=True)
+            self._f.write(decoded)
+            self.written += len(decoded)
+
+    def close(self) -> None:
+        if not self._done:
+            raise ValueError("Attachment response ended before its content was complete")
+
+
+def _attachment_data(name: str | None, uploaded_to: int | None, link: str | None) -> dict[str, Any]:
+    return {"name": name, "uploaded_to": uploaded_to, "link": link}
+
+
+class AttachmentsResource(ListingResource[AttachmentListItem]):
+    """Resource class for handling attachment operations in BookStack API."""
+
+    endpoint = '/attachments'
+    response_model = AttachmentListResponse
+    item_model = AttachmentListItem
+
+    def read(self, attachment_id: int) -> AttachmentDetail:
+        """Retrieve an attachment including its content.
+
+        The content of file attachments is base64 encoded and held in memory
+        as a whole; use `download` for large files.
+        """
+        return self._read(f'/attachments/{attachment_id}', AttachmentDetail)
+
+    def create(
+        self,
+        name: str,
+        uploaded_to: int,
+        file: Upload | None = None,
+        link: str | None = None,
+        filename: str | None = None,
+    ) -> AttachmentListItem:
+        """Create a file or link attachment.
+
+        Files are streamed from disk as a multipart body, so uploads of any
+        size need only constant memory.
+
+        Args:
+            name: Name of the attachment
+            uploaded_to: ID of the page the attachment belongs to
+            file: Path, binary file object or raw content to upload
+            link: URL for a link attachment; used instead of `file`
+            filename: Uploaded file name; defaults to the name of `file`
+        """
+        if (file is None) == (link is None):
+            raise ValueError("Either 'file' or 'link' must be provided, but not both")
+
+        data = _attachment_data(name, uploaded_to, link)
+        if file is None:
+            return self._request(
+                HttpMethod.POST.value, '/attachments', json=data, decoder=AttachmentListItem.model_validate_json)
+
+        with open_upload(file, filename) as upload:
+            return self._request(
+                HttpMethod.POST.value, '/attachments', decoder=AttachmentListItem.model_validate_json,
+                **multipart_kwargs(data, {"file": upload}),
+            )
+
+    def update(
+        self,
+        attachment_id: int,
+        name: str | None = None,
+        uploaded_to: int | None = None,
+        file: Upload | None = None,
+        link: str | None = None,
+        filename: str | None = None,
+    ) -> AttachmentListItem:
+        """Update an attachment, optionally replacing its file. See `create`."""
+        data = _attachment_data(name, uploaded_to, link)
+        if file is None:
+            data = {key: value for key, value in data.items() if value is not None}
+            return self._request(
+                HttpMethod.PUT.value, f'/attachments/{attachment_id}', json=data,
+                decoder=AttachmentListItem.model_validate_json,
+            )
+
+        # PHP only parses multipart bodies of POST requests, hence the method override
+        data["_method"] = HttpMethod.PUT.value
+        with open_upload(file, filename) as upload:
+            return self._request(
+                HttpMethod.POST.value, f'/attachments/{attachment_id}', decoder=AttachmentListItem.model_validate_json,
+                **multipart_kwargs(data, {"file": upload}),
+            )
+
+    def delete(self, attachment_id: int) -> None:
+        """Delete an attachment."""
+        self._request(HttpMethod.DELETE.value, f'/attachments/{attachment_id}')
+
+    def download(self, attachment_id: int, target: str | os.PathLike | BinaryIO, chunk_size: int = 65536) -> int:
+        """Download a file attachment, decoding its base64 content straight into `target`.
+
+        The response is streamed and decoded chunk by chunk, so memory use
+        stays constant regardless of the attachment size.
+
+        Args:
+            attachment_id: ID of the attachment
+            target: Output path or binary file object
+            chunk_size: Size of the response chunks read at a time
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            ValueError: If the attachment is a link rather than a file
+        """
+        with self._client._stream(HttpMethod.GET.value, f'/attachments/{attachment_id}') as response:
+            f = open(target, "wb") if isinstance(target, (str, os.PathLike)) else target
+            try:
+                writer = _Base64ContentWriter(f)
+                for chunk in response.iter_bytes(chunk_size):
+                    writer.feed(chunk)
+                writer.close()
+            finally:
+                if f is not target:
+                    f.close()
+        return writer.written
+
+
+class AsyncAttachmentsResource(AsyncListingResource[AttachmentListItem]):
+    """Async resource class for handling attachment operations in BookStack API."""
+
+    endpoint = '/attachments'
+    response_model = AttachmentListResponse
+    item_model = AttachmentListItem
+
+    async def read(self, attachment_id: int) -> AttachmentDetail:
+        """Retrieve an attachment including its content. See `AttachmentsResource.read`."""
+        return await self._read(f'/attachments/{attachment_id}', AttachmentDetail)
+
+    async def create(
+        self,
+        name: str,
+        uploaded_to: int,
+        file: Upload | None = None,
+        link: str | None = None,
+        filename: str | None = None,
+    ) -> AttachmentListItem:
+        """Create a file or link attachment. See `AttachmentsResource.create`."""
+        if (file is None) == (link is None):
+            raise ValueError("Either 'file' or 'link' must be provided, but not both")
+
+        data = _attachment_data(name, uploaded_to, link)
+        if file is None:
+            return await self._request(
+                HttpMethod.POST.value, '/attachments', json=data, decoder=AttachmentListItem.model_validate_json)
+
+        with open_upload(file, filename) as upload:
+            return await self._request(
+                HttpMethod.POST.value, '/attachments', decoder=AttachmentListItem.model_validate_json,
+                **multipart_kwargs(data, {"file": upload}),
+            )
+
+    async def update(
+        self,
+        attachment_id: int,
+        name: str | None = None,
+        uploaded_to: int | None = None,
+        file: Upload | None = None,
+        link: str | None = None,
+        filename: str | None = None,
+    ) -> AttachmentListItem:
+        """Update an attachment, optionally replacing its file. See `AttachmentsResource.update`."""
+        data = _attachment_data(name, uploaded_to, link)
+        if file is None:
+            data = {key: value for key, value in data.items() if value is not None}
+            return await self._request(
+                HttpMethod.PUT.value, f'/attachments/{attachment_id}', json=data,
+                decoder=AttachmentListItem.model_validate_json,
+            )
+
+        data["_method"] = HttpMethod.PUT.value
+        with open_upload(file, filename) as upload:
+            return await self._request(
+                HttpMethod.POST.value, f'/attachments/{attachment_id}', decoder=AttachmentListItem.model_validate_json,
+                **multipart_kwargs(data, {"file": upload}),
+            )
+
+    async def delete(self, attachment_id: int) -> None:
+        """Delete an attachment."""
+        await self._request(HttpMethod.DELETE.value, f'/attachments/{attachment_id}')
+
+    async def download(self, attachment_id: int, target: str | os.PathLike | BinaryIO, chunk_size: int = 65536) -> int:
+        """Download a file attachment into `target`. See `AttachmentsResource.download`."""
+        async with self._client._stream(HttpMethod.GET.value, f'/attachments/{attachment_id}') as response:
+            f = open(target, "wb") if isinstance(target, (str, os.PathLike)) else target
+            try:
+                writer = _Base64ContentWriter(f)
+                async for chunk in response.aiter_bytes(chunk_size):
+                    writer.feed(chunk)
+                writer.close()
+            finally:
+                if f is not target:
+                    f.close()
+        return writer.written
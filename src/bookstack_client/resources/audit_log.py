@@ -1,11 +1,55 @@
-from .base import BaseResource
+from typing import TYPE_CHECKING
+
+from .base import AsyncListingResource, ListingResource
+from ..models.audit_log import AuditLogItem
 from ..models.responses import AuditLogResponse
 
+if TYPE_CHECKING:
+    from ..sinks import Column, RecordSink
+
 
-class AuditLogResource(BaseResource):
+class AuditLogResource(ListingResource[AuditLogItem]):
     """Resource class for handling audit log operations in BookStack API."""
 
-    def list(self, **params) -> AuditLogResponse:
-        """Retrieve a list of audit log entries."""
-        data = self._get_paginated('/audit-log', **params)
-        return AuditLogResponse(data=data, total=len(data))
+    endpoint = '/audit-log'
+    response_model = AuditLogResponse
+    item_model = AuditLogItem
+
+    @property
+    def columns(self) -> "list[Column]":
+        """Flat export columns of audit log entries, for use with the sinks in `bookstack_client.sinks`."""
+        from ..sinks import model_columns
+
+        return model_columns(AuditLogItem)
+
+    def export(self, sink: "RecordSink", prefetch: int = 1, **params) -> int:
+        """Stream audit log entries into a sink page by page.
+
+        Entries are written as raw data without building models, and the next
+        page is fetched while the current one is written, so memory stays
+        constant for logs of any size.
+
+        Example:
+            with ParquetSink("audit.parquet", client.audit_log.columns) as sink:
+                client.audit_log.export(sink, count=500)
+
+        Args:
+            sink: Destination, e.g. an `NDJSONSink`, `CSVSink` or `ParquetSink`
+                created with `columns`
+            prefetch: Number of pages fetched ahead while writing
+            **params: Pagination and request arguments, as for `list`
+
+        Returns:
+            Number of entries written
+        """
+        from ..sinks import write_pages
+
+        return write_pages(self._iter_paginated(self.endpoint, prefetch=prefetch, **params), sink)
+
+
+class AsyncAuditLogResource(AsyncListingResource[AuditLogItem]):
+    """Async resource class for handling audit log operations in BookStack API."""
+
+    endpoint = '/audit-log'
+    response_model = AuditLogResponse
+    item_model = AuditLogItem
@@ -1,9 +1,72 @@
 """Base resource class for BookStack API client."""
 
+import os
+import uuid
+from collections.abc import AsyncGenerator, Iterator, Sequence
+from contextlib import aclosing, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, Generic, Literal, TypeVar, overload
+
+from pydantic import BaseModel
+
 # from ..client import BookStackClient
 # create BookStackClient.pyi to avoid circular import issues?
+from ..models.base import ExportFormat
+from ..models.responses import PaginatedResponse
 from ..utils import HttpMethod
 
+if TYPE_CHECKING:
+    from ..columnar import ColumnarResult
+    from ..models.lazy import ResponseMode
+    from ..models.records import RecordPage
+
+M = TypeVar('M', bound=BaseModel)
+T = TypeVar('T', bound=BaseModel)
+
+Upload = str | os.PathLike | BinaryIO | bytes
+"""A file to upload: a path, a binary file object or the raw content."""
+
+
+@contextmanager
+def open_upload(file: Upload, filename: str | None = None) -> Iterator[tuple[str, BinaryIO | bytes]]:
+    """Open a file for a streamed multipart upload.
+
+    Paths are opened here and closed afterwards; file objects are read in
+    chunks by httpx and left open.
+
+    Yields:
+        The `(filename, file)` pair for httpx's `files` argument
+    """
+    if isinstance(file, (str, os.PathLike)):
+        path = Path(file)
+        with open(path, "rb") as f:
+            yield filename or path.name, f
+    else:
+        yield filename or Path(getattr(file, "name", None) or "upload").name, file
+
+
+def multipart_kwargs(data: dict[str, Any], files: dict[str, tuple[str, BinaryIO | bytes]]) -> dict[str, Any]:
+    """Build request arguments for a multipart/form-data request.
+
+    The client sends `Content-Type: application/json` by default, which
+    would stop httpx from setting the multipart header, so the header is
+    set explicitly here with a boundary that httpx then uses for the body.
+    """
+    boundary = uuid.uuid4().hex
+    return {
+        "data": {key: value for key, value in data.items() if value is not None},
+        "files": files,
+        "headers": {"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    }
+
+
+def export_endpoint(endpoint: str, format: ExportFormat) -> str:
+    """Build the export endpoint of an entity, e.g. "/pages/1/export/pdf".
+
+    "plain-text" is how the web UI names the format, the API expects "plaintext".
+    """
+    return f"{endpoint}/export/{'plaintext' if format == 'plain-text' else format}"
+
 
 class BaseResource:
     """Base resource class for BookStack API client."""
@@ -11,8 +74,195 @@ class BaseResource:
     def __init__(self, client):
         self._client = client
 
-    def _request(self, method: str, endpoint: str, **kwargs) -> dict:
+    def _request(self, method: str, endpoint: str, **kwargs) -> Any:
         return self._client._request(method, endpoint, **kwargs)
 
     def _get_paginated(self, endpoint: str, **kwargs) -> list:
         return self._client._get_paginated_content(HttpMethod.GET.value, endpoint, **kwargs)
+
+    def _iter_paginated(self, endpoint: str, **kwargs) -> Iterator[list]:
+        return self._client._iter_paginated_content(HttpMethod.GET.value, endpoint, **kwargs)
+
+    def _read(self, endpoint: str, model: type[M], **kwargs) -> M:
+        """Fetch a single entity, validating it straight from the response bytes."""
+        return self._request(HttpMethod.GET.value, endpoint, decoder=model.model_validate_json, **kwargs)
+
+    def _download(self, endpoint: str, target: str | os.PathLike | BinaryIO, chunk_size: int = 65536) -> int:
+        """Stream a response body into a file without holding it in memory.
+
+        Returns:
+            Number of bytes written
+        """
+        with self._client._stream(HttpMethod.GET.value, endpoint) as response:
+            if isinstance(target, (str, os.PathLike)):
+                with open(target, "wb") as f:
+                    return _write_chunks(response.iter_bytes(chunk_size), f)
+            return _write_chunks(response.iter_bytes(chunk_size), target)
+
+
+class ListingResource(BaseResource, Generic[T]):
+    """Base class of resources with a paginated listing endpoint.
+
+    Subclasses set the endpoint and the models of the listing.
+    """
+
+    endpoint: ClassVar[str]
+    """Path of the listing, e.g. "/books"."""
+    response_model: ClassVar[type[PaginatedResponse]]
+    item_model: ClassVar[type[BaseModel]]
+
+    @overload
+    def list(self, mode: Literal["validate", "lazy"] = "validate", **params) -> PaginatedResponse[T]: ...
+
+    @overload
+    def list(self, mode: Literal["compact"], **params) -> "RecordPage": ...
+
+    def list(self, mode: "ResponseMode" = "validate", **params) -> "PaginatedResponse[T] | RecordPage":
+        """Retrieve all items of the listing.
+
+        Args:
+            mode: How items are turned into models; "lazy" validates each item
+                only when it is first accessed; "compact" skips the models and
+                returns a `RecordPage` of read-only records using much less memory
+            **params: Pagination and request arguments
+        """
+        from ..models.lazy import build_list_response
+        from ..models.records import record_page_decoder
+
+        if mode == "validate":
+            # Validate each page straight from the raw response bytes
+            params.setdefault("decoder", self.response_model.model_validate_json)
+        elif mode == "compact":
+            # Turn each page into records as it arrives, without building models
+            params.setdefault("decoder", record_page_decoder(self.item_model, self._client.json_decoder))
+        data = self._get_paginated(self.endpoint, **params)
+        return build_list_response(self.response_model, self.item_model, data, mode)
+
+    def iter(self, validate: bool = True, **params) -> Iterator[T | dict[str, Any]]:
+        """Iterate over the items of the listing page by page.
+
+        Only one page is held in memory at a time, regardless of the total
+        size of the listing.
+
+        Args:
+            validate: Yield validated models (default) or the raw item dicts
+            **params: Pagination and request arguments, as for `list`
+        """
+        for page in self.iter_pages(validate, **params):
+            yield from page
+
+    def iter_pages(self, validate: bool = True, **params) -> Iterator[Sequence[T | dict[str, Any]]]:
+        """Iterate over the pages of the listing. See `iter`."""
+        if validate:
+            params.setdefault("decoder", self.response_model.model_validate_json)
+        return self._iter_paginated(self.endpoint, **params)
+
+    def list_columnar(self, prefetch: int = 1, **params) -> "ColumnarResult":
+        """Retrieve all items of the listing into a `ColumnarResult` for analytics.
+
+        Items are stored column by column straight from the response data,
+        without building a model per item, and the next page is fetched
+        while one is stored.
+
+        Args:
+            prefetch: Number of pages fetched ahead while storing
+            **params: Pagination and request arguments, as for `list`
+        """
+        from ..columnar import ColumnarResult
+        from ..sinks import model_columns
+
+        result = ColumnarResult(model_columns(self.item_model))
+        for page in self._iter_paginated(self.endpoint, prefetch=prefetch, **params):
+            result.extend(page)
+        return result
+
+
+def _write_chunks(chunks: Iterator[bytes], f: BinaryIO) -> int:
+    written = 0
+    for chunk in chunks:
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+
+class AsyncBaseResource:
+    """Base resource class for the async BookStack API client."""
+
+    def __init__(self, client):
+        self._client = client
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Any:
+        return await self._client._request(method, endpoint, **kwargs)
+
+    async def _get_paginated(self, endpoint: str, **kwargs) -> list:
+        return await self._client._get_paginated_content(HttpMethod.GET.value, endpoint, **kwargs)
+
+    def _iter_paginated(self, endpoint: str, **kwargs) -> AsyncGenerator[list, None]:
+        return self._client._iter_paginated_content(HttpMethod.GET.value, endpoint, **kwargs)
+
+    async def _read(self, endpoint: str, model: type[M], **kwargs) -> M:
+        return await self._request(HttpMethod.GET.value, endpoint, decoder=model.model_validate_json, **kwargs)
+
+    async def _download(self, endpoint: str, target: str | os.PathLike | BinaryIO, chunk_size: int = 65536) -> int:
+        """Stream a response body into a file. See `BaseResource._download`."""
+        written = 0
+        async with self._client._stream(HttpMethod.GET.value, endpoint) as response:
+            f = open(target, "wb") if isinstance(target, (str, os.PathLike)) else target
+            try:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+            finally:
+                if f is not target:
+                    f.close()
+        return written
+
+
+class AsyncListingResource(AsyncBaseResource, Generic[T]):
+    """Base class of async resources with a paginated listing endpoint. See `ListingResource`."""
+
+    endpoint: ClassVar[str]
+    response_model: ClassVar[type[PaginatedResponse]]
+    item_model: ClassVar[type[BaseModel]]
+
+    @overload
+    async def list(self, mode: Literal["validate", "lazy"] = "validate", **params) -> PaginatedResponse[T]: ...
+
+    @overload
+    async def list(self, mode: Literal["compact"], **params) -> "RecordPage": ...
+
+    async def list(self, mode: "ResponseMode" = "validate", **params) -> "PaginatedResponse[T] | RecordPage":
+        """Retrieve all items of the listing. See `ListingResource.list`."""
+        from ..models.lazy import build_list_response
+        from ..models.records import record_page_decoder
+
+        if mode == "validate":
+            params.setdefault("decoder", self.response_model.model_validate_json)
+        elif mode == "compact":
+            params.setdefault("decoder", record_page_decoder(self.item_model, self._client.json_decoder))
+        data = await self._get_paginated(self.endpoint, **params)
+        return build_list_response(self.response_model, self.item_model, data, mode)
+
+    async def iter(self, validate: bool = True, **params) -> AsyncGenerator[T | dict[str, Any], None]:
+        """Iterate over the items of the listing page by page. See `ListingResource.iter`."""
+        async with aclosing(self.iter_pages(validate, **params)) as pages:
+            async for page in pages:
+                for item in page:
+                    yield item
+
+    def iter_pages(self, validate: bool = True, **params) -> AsyncGenerator[Sequence[T | dict[str, Any]], None]:
+        """Iterate over the pages of the listing. See `ListingResource.iter_pages`."""
+        if validate:
+            params.setdefault("decoder", self.response_model.model_validate_json)
+        return self._iter_paginated(self.endpoint, **params)
+
+    async def list_columnar(self, prefetch: int = 1, **params) -> "ColumnarResult":
+        """Retrieve all items of the listing into a `ColumnarResult`. See `ListingResource.list_columnar`."""
+        from ..columnar import ColumnarResult
+        from ..sinks import model_columns
+
+        result = ColumnarResult(model_columns(self.item_model))
+        async with aclosing(self._iter_paginated(self.endpoint, prefetch=prefetch, **params)) as pages:
+            async for page in pages:
+                result.extend(page)
+        return result
@@ -0,0 +1,64 @@
+import os
+from typing import BinaryIO
+
+from .base import AsyncListingResource, ListingResource, export_endpoint
+from ..models.books import BookListItem, BookDetail
+from ..models.base import ExportFormat
+from ..models.responses import BookListResponse
+
+
+class BooksResource(ListingResource[BookListItem]):
+    """Resource class for handling book operations in BookStack API."""
+
+    endpoint = '/books'
+    response_model = BookListResponse
+    item_model = BookListItem
+
+    def read(self, book_id: int) -> BookDetail:
+        """Retrieve a single book with its details."""
+        return self._read(f'/books/{book_id}', BookDetail)
+
+    def export(
+        self,
+        book_id: int,
+        format: ExportFormat,
+        target: str | os.PathLike | BinaryIO,
+        chunk_size: int = 65536,
+    ) -> int:
+        """Export a book and stream the file into `target` chunk by chunk.
+
+        The export is never held in memory as a whole, so large PDF exports
+        are safe to download.
+
+        Args:
+            book_id: ID of the book
+            format: Export format ("markdown", "html", "pdf" or "plaintext")
+            target: Output path or binary file object
+            chunk_size: Size of the chunks written to `target`
+
+        Returns:
+            Number of bytes written
+        """
+        return self._download(export_endpoint(f'/books/{book_id}', format), target, chunk_size)
+
+
+class AsyncBooksResource(AsyncListingResource[BookListItem]):
+    """Async resource class for handling book operations in BookStack API."""
+
+    endpoint = '/books'
+    response_model = BookListResponse
+    item_model = BookListItem
+
+    async def read(self, book_id: int) -> BookDetail:
+        """Retrieve a single book with its details."""
+        return await self._read(f'/books/{book_id}', BookDetail)
+
+    async def export(
+        self,
+        book_id: int,
+        format: ExportFormat,
+        target: str | os.PathLike | BinaryIO,
+        chunk_size: int = 65536,
+    ) -> int:
+        """Export a book and stream the file into `target`. See `BooksResource.export`."""
+        return await self._download(export_endpoint(f'/books/{book_id}', format), target, chunk_size)
@@ -0,0 +1,64 @@
+import os
+from typing import BinaryIO
+
+from .base import AsyncListingResource, ListingResource, export_endpoint
+from ..models.chapters import ChapterListItem, ChapterDetail
+from ..models.base import ExportFormat
+from ..models.responses import ChapterListResponse
+
+
+class ChaptersResource(ListingResource[ChapterListItem]):
+    """Resource class for handling chapter operations in BookStack API."""
+
+    endpoint = '/chapters'
+    response_model = ChapterListResponse
+    item_model = ChapterListItem
+
+    def read(self, chapter_id: int) -> ChapterDetail:
+        """Retrieve a single chapter with its details."""
+        return self._read(f'/chapters/{chapter_id}', ChapterDetail)
+
+    def export(
+        self,
+        chapter_id: int,
+        format: ExportFormat,
+        target: str | os.PathLike | BinaryIO,
+        chunk_size: int = 65536,
+    ) -> int:
+        """Export a chapter and stream the file into `target` chunk by chunk.
+
+        The export is never held in memory as a whole, so large PDF exports
+        are safe to download.
+
+        Args:
+            chapter_id: ID of the chapter
+            format: Export format ("markdown", "html", "pdf" or "plaintext")
+            target: Output path or binary file object
+            chunk_size: Size of the chunks written to `target`
+
+        Returns:
+            Number of bytes written
+        """
+        return self._download(export_endpoint(f'/chapters/{chapter_id}', format), target, chunk_size)
+
+
+class AsyncChaptersResource(AsyncListingResource[ChapterListItem]):
+    """Async resource class for handling chapter operations in BookStack API."""
+
+    endpoint = '/chapters'
+    response_model = ChapterListResponse
+    item_model = ChapterListItem
+
+    async def read(self, chapter_id: int) -> ChapterDetail:
+        """Retrieve a single chapter with its details."""
+        return await self._read(f'/chapters/{chapter_id}', ChapterDetail)
+
+    async def export(
+        self,
+        chapter_id: int,
+        format: ExportFormat,
+        target: str | os.PathLike | BinaryIO,
+        chunk_size: int = 65536,
+    ) -> int:
+        """Export a chapter and stream the file into `target`. See `ChaptersResource.export`."""
+        return await self._download(export_endpoint(f'/chapters/{chapter_id}', format), target, chunk_size)
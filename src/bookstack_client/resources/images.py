@@ -0,0 +1,136 @@
+from typing import Literal
+
+from .base import AsyncListingResource, ListingResource, Upload, multipart_kwargs, open_upload
+from ..models.images import ImageListItem, ImageDetail
+from ..models.responses import ImageListResponse
+from ..utils import HttpMethod
+
+
+class ImagesResource(ListingResource[ImageListItem]):
+    """Resource class for handling image gallery operations in BookStack API."""
+
+    endpoint = '/image-gallery'
+    response_model = ImageListResponse
+    item_model = ImageListItem
+
+    def read(self, image_id: int) -> ImageDetail:
+        """Retrieve a single image with its details."""
+        return self._read(f'/image-gallery/{image_id}', ImageDetail)
+
+    def create(
+        self,
+        uploaded_to: int,
+        image: Upload,
+        name: str | None = None,
+        type: Literal["gallery", "drawio"] = "gallery",
+        filename: str | None = None,
+    ) -> ImageDetail:
+        """Upload a new image to the gallery.
+
+        The image is streamed from disk as a multipart body instead of being
+        read into memory first.
+
+        Args:
+            uploaded_to: ID of the page the image belongs to
+            image: Path, binary file object or raw content of the image
+            name: Image name; defaults to the file name
+            type: "gallery" or "drawio"
+            filename: Uploaded file name; defaults to the name of `image`
+        """
+        data = {"type": type, "uploaded_to": uploaded_to, "name": name}
+        with open_upload(image, filename) as upload:
+            return self._request(
+                HttpMethod.POST.value, '/image-gallery', decoder=ImageDetail.model_validate_json,
+                **multipart_kwargs(data, {"image": upload}),
+            )
+
+    def update(
+        self,
+        image_id: int,
+        name: str | None = None,
+        image: Upload | None = None,
+        filename: str | None = None,
+    ) -> ImageDetail:
+        """Rename an image and/or replace its file. See `create`.
+
+        Raises:
+            ValueError: If neither a name nor an image is given
+        """
+        if name is None and image is None:
+            raise ValueError("Pass a name and/or an image to update")
+        if image is None:
+            return self._request(
+                HttpMethod.PUT.value, f'/image-gallery/{image_id}', json={"name": name},
+                decoder=ImageDetail.model_validate_json,
+            )
+
+        # PHP only parses multipart bodies of POST requests, hence the method override
+        data = {"_method": HttpMethod.PUT.value, "name": name}
+        with open_upload(image, filename) as upload:
+            return self._request(
+                HttpMethod.POST.value, f'/image-gallery/{image_id}', decoder=ImageDetail.model_validate_json,
+                **multipart_kwargs(data, {"image": upload}),
+            )
+
+    def delete(self, image_id: int) -> None:
+        """Delete an image."""
+        self._request(HttpMethod.DELETE.value, f'/image-gallery/{image_id}')
+
+
+class AsyncImagesResource(AsyncListingResource[ImageListItem]):
+    """Async resource class for handling image gallery operations in BookStack API."""
+
+    endpoint = '/image-gallery'
+    response_model = ImageListResponse
+    item_model = ImageListItem
+
+    async def read(self, image_id: int) -> ImageDetail:
+        """Retrieve a single image with its details."""
+        return await self._read(f'/image-gallery/{image_id}', ImageDetail)
+
+    async def create(
+        self,
+        uploaded_to: int,
+        image: Upload,
+        name: str | None = None,
+        type: Literal["gallery", "drawio"] = "gallery",
+        filename: str | None = None,
+    ) -> ImageDetail:
+        """Upload a new image to the gallery. See `ImagesResource.create`."""
+        data = {"type": type, "uploaded_to": uploaded_to, "name": name}
+        with open_upload(image, filename) as upload:
+            return await self._request(
+                HttpMethod.POST.value, '/image-gallery', decoder=ImageDetail.model_validate_json,
+                **multipart_kwargs(data, {"image": upload}),
+            )
+
+    async def update(
+        self,
+        image_id: int,
+        name: str | None = None,
+        image: Upload | None = None,
+        filename: str | None = None,
+    ) -> ImageDetail:
+        """Rename an image and/or replace its file. See `ImagesResource.update`.
+
+        Raises:
+            ValueError: If neither a name nor an image is given
+        """
+        if name is None and image is None:
+            raise ValueError("Pass a name and/or an image to update")
+        if image is None:
+            return await self._request(
+                HttpMethod.PUT.value, f'/image-gallery/{image_id}', json={"name": name},
+                decoder=ImageDetail.model_validate_json,
+            )
+
+        data = {"_method": HttpMethod.PUT.value, "name": name}
+        with open_upload(image, filename) as upload:
+            return await self._request(
+                HttpMethod.POST.value, f'/image-gallery/{image_id}', decoder=ImageDetail.model_validate_json,
+                **multipart_kwargs(data, {"image": upload}),
+            )
+
+    async def delete(self, image_id: int) -> None:
+        """Delete an image."""
+        await self._request(HttpMethod.DELETE.value, f'/image-gallery/{image_id}')
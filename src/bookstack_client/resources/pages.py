@@ -0,0 +1,114 @@
+import os
+from typing import Any, BinaryIO
+
+from .base import AsyncListingResource, ListingResource, export_endpoint
+from ..models.pages import PageListItem, PageDetail, PageCreate, PageUpdate
+from ..models.base import ExportFormat
+from ..models.responses import PageListResponse
+from ..utils import HttpMethod
+
+
+class PagesResource(ListingResource[PageListItem]):
+    """Resource class for handling page operations in BookStack API."""
+
+    endpoint = '/pages'
+    response_model = PageListResponse
+    item_model = PageListItem
+
+    def read(self, page_id: int) -> PageDetail:
+        """Retrieve a single page with its details."""
+        return self._read(f'/pages/{page_id}', PageDetail)
+
+    def export(
+        self,
+        page_id: int,
+        format: ExportFormat,
+        target: str | os.PathLike | BinaryIO,
+        chunk_size: int = 65536,
+    ) -> int:
+        """Export a page and stream the file into `target` chunk by chunk.
+
+        The export is never held in memory as a whole, so large PDF exports
+        are safe to download.
+
+        Args:
+            page_id: ID of the page
+            format: Export format ("markdown", "html", "pdf" or "plaintext")
+            target: Output path or binary file object
+            chunk_size: Size of the chunks written to `target`
+
+        Returns:
+            Number of bytes written
+        """
+        return self._download(export_endpoint(f'/pages/{page_id}', format), target, chunk_size)
+
+    def create(self, data: PageCreate | dict[str, Any]) -> PageDetail:
+        """Create a page.
+
+        Args:
+            data: The new page; dicts are validated as `PageCreate`
+        """
+        data = PageCreate.model_validate(data)
+        return self._request(
+            HttpMethod.POST.value, '/pages', json=data.model_dump(mode="json", exclude_none=True),
+            decoder=PageDetail.model_validate_json,
+        )
+
+    def update(self, page_id: int, data: PageUpdate | dict[str, Any]) -> PageDetail:
+        """Update a page, changing only the fields set in `data`.
+
+        Args:
+            page_id: ID of the page
+            data: The changes; dicts are validated as `PageUpdate`
+        """
+        data = PageUpdate.model_validate(data)
+        return self._request(
+            HttpMethod.PUT.value, f'/pages/{page_id}', json=data.model_dump(mode="json", exclude_unset=True),
+            decoder=PageDetail.model_validate_json,
+        )
+
+    def delete(self, page_id: int) -> None:
+        """Delete a page, moving it to the recycle bin."""
+        self._request(HttpMethod.DELETE.value, f'/pages/{page_id}')
+
+
+class AsyncPagesResource(AsyncListingResource[PageListItem]):
+    """Async resource class for handling page operations in BookStack API."""
+
+    endpoint = '/pages'
+    response_model = PageListResponse
+    item_model = PageListItem
+
+    async def read(self, page_id: int) -> PageDetail:
+        """Retrieve a single page with its details."""
+        return await self._read(f'/pages/{page_id}', PageDetail)
+
+    async def export(
+        self,
+        page_id: int,
+        format: ExportFormat,
+        target: str | os.PathLike | BinaryIO,
+        chunk_size: int = 65536,
+    ) -> int:
+        """Export a page and stream the file into `target`. See `PagesResource.export`."""
+        return await self._download(export_endpoint(f'/pages/{page_id}', format), target, chunk_size)
+
+    async def create(self, data: PageCreate | dict[str, Any]) -> PageDetail:
+        """Create a page. See `PagesResource.create`."""
+        data = PageCreate.model_validate(data)
+        return await self._request(
+            HttpMethod.POST.value, '/pages', json=data.model_dump(mode="json", exclude_none=True),
+            decoder=PageDetail.model_validate_json,
+        )
+
+    async def update(self, page_id: int, data: PageUpdate | dict[str, Any]) -> PageDetail:
+        """Update a page. See `PagesResource.update`."""
+        data = PageUpdate.model_validate(data)
+        return await self._request(
+            HttpMethod.PUT.value, f'/pages/{page_id}', json=data.model_dump(mode="json", exclude_unset=True),
+            decoder=PageDetail.model_validate_json,
+        )
+
+    async def delete(self, page_id: int) -> None:
+        """Delete a page, moving it to the recycle bin."""
+        await self._request(HttpMethod.DELETE.value, f'/pages/{page_id}')
@@ -0,0 +1,44 @@
+from .base import AsyncListingResource, ListingResource
+from ..models.recycle_bin import RecycleBinItem, RecycleBinRestoreResponse, RecycleBinDestroyResponse
+from ..models.responses import RecycleBinResponse
+from ..utils import HttpMethod
+
+
+class RecycleBinResource(ListingResource[RecycleBinItem]):
+    """Resource class for handling recycle bin operations in BookStack API."""
+
+    endpoint = '/recycle-bin'
+    response_model = RecycleBinResponse
+    item_model = RecycleBinItem
+
+    def restore(self, deletion_id: int) -> RecycleBinRestoreResponse:
+        """Restore a deleted item and its children."""
+        return self._request(
+            HttpMethod.PUT.value, f'/recycle-bin/{deletion_id}', decoder=RecycleBinRestoreResponse.model_validate_json)
+
+    def destroy(self, deletion_id: int) -> RecycleBinDestroyResponse:
+        """Permanently delete an item from the recycle bin."""
+        return self._request(
+            HttpMethod.DELETE.value, f'/recycle-bin/{deletion_id}',
+            decoder=RecycleBinDestroyResponse.model_validate_json,
+        )
+
+
+class AsyncRecycleBinResource(AsyncListingResource[RecycleBinItem]):
+    """Async resource class for handling recycle bin operations in BookStack API."""
+
+    endpoint = '/recycle-bin'
+    response_model = RecycleBinResponse
+    item_model = RecycleBinItem
+
+    async def restore(self, deletion_id: int) -> RecycleBinRestoreResponse:
+        """Restore a deleted item and its children."""
+        return await self._request(
+            HttpMethod.PUT.value, f'/recycle-bin/{deletion_id}', decoder=RecycleBinRestoreResponse.model_validate_json)
+
+    async def destroy(self, deletion_id: int) -> RecycleBinDestroyResponse:
+        """Permanently delete an item from the recycle bin."""
+        return await self._request(
+            HttpMethod.DELETE.value, f'/recycle-bin/{deletion_id}',
+            decoder=RecycleBinDestroyResponse.model_validate_json,
+        )
@@ -0,0 +1,27 @@
+from .base import AsyncListingResource, ListingResource
+from ..models.shelves import ShelfListItem, ShelfDetail
+from ..models.responses import ShelfListResponse
+
+
+class ShelvesResource(ListingResource[ShelfListItem]):
+    """Resource class for handling bookshelf operations in BookStack API."""
+
+    endpoint = '/shelves'
+    response_model = ShelfListResponse
+    item_model = ShelfListItem
+
+    def read(self, shelf_id: int) -> ShelfDetail:
+        """Retrieve a single shelf with its books."""
+        return self._read(f'/shelves/{shelf_id}', ShelfDetail)
+
+
+class AsyncShelvesResource(AsyncListingResource[ShelfListItem]):
+    """Async resource class for handling bookshelf operations in BookStack API."""
+
+    endpoint = '/shelves'
+    response_model = ShelfListResponse
+    item_model = ShelfListItem
+
+    async def read(self, shelf_id: int) -> ShelfDetail:
+        """Retrieve a single shelf with its books."""
+        return await self._read(f'/shelves/{shelf_id}', ShelfDetail)
@@ -0,0 +1,124 @@
+"""Retry policy for BookStack API requests."""
+
+import random
+from .exceptions import (
+    BookStackError,
+    BookStackAPIError,
+    BookStackConnectionError,
+    BookStackRateLimitError,
+)
+from .utils import HttpMethod
+
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+"""HTTP status codes that are considered transient."""
+
+IDEMPOTENT_METHODS = frozenset({
+    HttpMethod.GET.value,
+    HttpMethod.HEAD.value,
+    HttpMethod.OPTIONS.value,
+    HttpMethod.PUT.value,
+    HttpMethod.DELETE.value,
+})
+"""HTTP methods that can be repeated without changing the outcome."""
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    Delays grow exponentially (`backoff_factor * 2 ** attempt`, capped at
+    `max_backoff`) with full jitter. A `Retry-After` value reported by the server
+    is used as a lower bound for the delay. Retries stop once `max_retries` is
+    reached or the next delay would push the total time spent waiting over
+    `max_total_wait`.
+
+    Rate limited requests (429) are rejected by BookStack before they are
+    processed, so they are retried for every method. Other transient failures
+    are only retried for methods in `retry_methods`.
+
+    Clients only retry requests when they are given a policy.
+
+    Example:
+        client = BookStackClient(url, token_id, token_secret, retry_policy=RetryPolicy(max_retries=5))
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        max_total_wait: float = 120.0,
+        jitter: bool = True,
+        retry_statuses: frozenset[int] = DEFAULT_RETRY_STATUSES,
+        retry_methods: frozenset[str] = IDEMPOTENT_METHODS,
+    ) -> None:
+        """Initialize retry policy.
+
+        Args:
+            max_retries: Maximum number of retries per request (0 disables retrying)
+            backoff_factor: Base delay in seconds for the exponential backoff
+            max_backoff: Upper bound in seconds for a single backoff delay
+            max_total_wait: Upper bound in seconds for all delays of one request
+            jitter: Whether to randomize delays to spread out concurrent retries
+            retry_statuses: HTTP status codes that are retried
+            retry_methods: HTTP methods that are retried on non rate limit failures
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_total_wait = max_total_wait
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+
+    def is_retryable(self, method: str, error: BookStackError) -> bool:
+        """Check whether a request that failed with `error` may be repeated."""
+        if isinstance(error, BookStackRateLimitError):
+            return 429 in self.retry_statuses
+
+        if method.upper() not in self.retry_methods:
+            return False
+
+        if isinstance(error, BookStackAPIError):
+            return error.status_code in self.retry_statuses
+
+        return isinstance(error, BookStackConnectionError)
+
+    def get_delay(self, attempt: int, error: BookStackError) -> float:
+        """Compute the delay in seconds before retry number `attempt` (0-based)."""
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            delay = max(delay, float(retry_after))
+
+        return delay
+
+    def next_delay(
+        self,
+        method: str,
+        error: BookStackError,
+        attempt: int,
+        waited: float = 0.0,
+    ) -> float | None:
+        """Get the delay before the next retry, or None if the error should be raised.
+
+        Args:
+            method: HTTP method of the failed request
+            error: The mapped error the request failed with
+            attempt: Number of retries already made for this request
+            waited: Total seconds already spent waiting for this request
+
+        Returns:
+            Delay in seconds, or None when the request must not be retried
+        """
+        if attempt >= self.max_retries or not self.is_retryable(method, error):
+            return None
+
+        delay = self.get_delay(attempt, error)
+        if waited + delay > self.max_total_wait:
+            return None
+
+        return delay
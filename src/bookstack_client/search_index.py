@@ -0,0 +1,277 @@
+"""Local full-text index mirroring BookStack content."""
+
+import html
+import json
+import os
+import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, Literal
+
+from .models.search import SearchResultItem
+from .utils import format_filter_datetime, read_or_none
+
+IndexedType = Literal["book", "chapter", "page"]
+
+# Entity types are packed into the FTS rowid next to the entity id
+_TYPE_KEYS = {"bookshelf": 1, "book": 2, "chapter": 3, "page": 4}
+_TYPE_SHIFT = 40
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+# Private-use markers for snippet()/highlight(), replaced after HTML escaping
+_MARK_START = "\ue000"
+_MARK_END = "\ue001"
+
+
+def html_to_text(value: str | None) -> str:
+    """Reduce page HTML to plain text for indexing."""
+    if not value:
+        return ""
+    return _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", value))).strip()
+
+
+def _quote_query(query: str) -> str:
+    """Turn free text into an FTS5 query matching all terms literally."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+class LocalSearchIndex:
+    """Full-text index of books, chapters and pages backed by SQLite FTS5.
+
+    `refresh` pulls content through a client. After the first full load only
+    entities whose `updated_at` moved since the previous refresh are fetched
+    again. `search` then answers queries locally, returning results
+    compatible with the server's `SearchResultItem`.
+
+    Entities deleted on the server are not detected by a refresh; drop them
+    with `remove`, or rebuild with `refresh(client, full=True)` after `clear`.
+
+    Example:
+        index = LocalSearchIndex("search.db")
+        index.refresh(client)
+        results = index.search("deployment checklist")
+    """
+
+    def __init__(self, path: str | os.PathLike = ":memory:") -> None:
+        """Initialize local search index.
+
+        Args:
+            path: Path of the SQLite database (":memory:" for a temporary index)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS search_content USING fts5("
+                "name, body, type UNINDEXED, entity UNINDEXED, "
+                "tokenize = 'unicode61 remove_diacritics 2')"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_state (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM search_content").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    @staticmethod
+    def _rowid(entity_type: str, entity_id: int) -> int:
+        return (_TYPE_KEYS[entity_type] << _TYPE_SHIFT) | entity_id
+
+    def _get_state(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM search_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO search_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    def add(self, entity_type: IndexedType, entity: dict[str, Any], body: str = "") -> None:
+        """Add or replace a single entity.
+
+        Args:
+            entity_type: "book", "chapter" or "page"
+            entity: Entity data; must contain at least id, name, slug, created_at,
+                updated_at and url
+            body: Plain text to index next to the name
+        """
+        self._upsert([(entity_type, entity, body)])
+
+    def _upsert(self, rows: list[tuple[str, dict[str, Any], str]]) -> None:
+        with self._lock, self._conn:
+            for entity_type, entity, body in rows:
+                rowid = self._rowid(entity_type, entity["id"])
+                self._conn.execute("DELETE FROM search_content WHERE rowid = ?", (rowid,))
+                self._conn.execute(
+                    "INSERT INTO search_content (rowid, name, body, type, entity) VALUES (?, ?, ?, ?, ?)",
+                    (rowid, entity["name"], body, entity_type, json.dumps(entity, default=str)),
+                )
+
+    def remove(self, entity_type: IndexedType, entity_id: int) -> None:
+        """Drop an entity from the index."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM search_content WHERE rowid = ?", (self._rowid(entity_type, entity_id),))
+
+    def clear(self) -> None:
+        """Drop all indexed content and refresh state."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM search_content")
+            self._conn.execute("DELETE FROM search_state")
+
+    def refresh(self, client, full: bool = False, count: int = 100, max_workers: int = 8) -> int:
+        """Pull new and updated content from BookStack into the index.
+
+        Books and chapters are indexed with their descriptions. Pages are indexed
+        with their content, fetched with up to `max_workers` concurrent requests;
+        pages deleted between listing and reading are dropped from the index.
+
+        Args:
+            client: The `BookStackClient` to read content with
+            full: Ignore the stored state and re-index everything
+            count: Number of items per listing page
+            max_workers: Number of concurrent page detail requests
+
+        Returns:
+            Number of indexed entities
+        """
+        indexed = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for entity_type, resource in (("book", client.books), ("chapter", client.chapters), ("page", client.pages)):
+                query = {"sort": "+updated_at"}
+                since = None if full else self._get_state(f"{entity_type}:updated_at")
+                if since is not None:
+                    query["filter[updated_at:gte]"] = since
+
+                for items in resource.iter_pages(validate=False, count=count, params=query, prefetch=1):
+                    if entity_type == "page":
+                        details = pool.map(partial(read_or_none, client.pages.read), [item["id"] for item in items])
+                        rows = []
+                        for item, detail in zip(items, details, strict=True):
+                            if detail is None:
+                                self.remove("page", item["id"])
+                            else:
+                                rows.append(self._page_row(client, item, detail))
+                    else:
+                        rows = [self._entity_row(client, entity_type, item) for item in items]
+
+                    self._upsert(rows)
+                    indexed += len(rows)
+
+                    # Items are sorted by updated_at, so the last one moves the state forward
+                    updated_at = datetime.fromisoformat(items[-1]["updated_at"].replace("Z", "+00:00"))
+                    self._set_state(f"{entity_type}:updated_at", format_filter_datetime(updated_at))
+
+        return indexed
+
+    @staticmethod
+    def _url(client, entity_type: str, item: dict[str, Any]) -> str:
+        if entity_type == "book":
+            return f"{client.base_url}/books/{item['slug']}"
+        return f"{client.base_url}/books/{item['book_slug']}/{entity_type}/{item['slug']}"
+
+    def _entity_row(self, client, entity_type: str, item: dict[str, Any]) -> tuple[str, dict[str, Any], str]:
+        entity = {
+            "id": item["id"],
+            "name": item["name"],
+            "slug": item["slug"],
+            "created_at": item["created_at"],
+            "updated_at": item["updated_at"],
+            "url": self._url(client, entity_type, item),
+            "book_id": item.get("book_id"),
+            "created_by": item.get("created_by"),
+            "updated_by": item.get("updated_by"),
+            "owned_by": item.get("owned_by"),
+        }
+        return entity_type, entity, item.get("description") or ""
+
+    def _page_row(self, client, item: dict[str, Any], detail) -> tuple[str, dict[str, Any], str]:
+        _, entity, _ = self._entity_row(client, "page", item)
+        entity.update(
+            chapter_id=item.get("chapter_id") or None,
+            draft=item.get("draft"),
+            template=item.get("template"),
+            tags=[tag.model_dump() for tag in detail.tags],
+        )
+        return "page", entity, html_to_text(detail.html) or detail.markdown or ""
+
+    def _lookup(self, entity_type: str, entity_id: int | None) -> dict[str, Any] | None:
+        if not entity_id:
+            return None
+        row = self._conn.execute(
+            "SELECT entity FROM search_content WHERE rowid = ?", (self._rowid(entity_type, entity_id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def search(
+        self,
+        query: str,
+        count: int = 20,
+        types: list[IndexedType] | None = None,
+        raw: bool = False,
+    ) -> list[SearchResultItem]:
+        """Search the index.
+
+        Args:
+            query: Free text; all terms must match. With `raw=True`, an FTS5 query
+            count: Maximum number of results
+            types: Restrict results to these entity types
+            raw: Pass `query` to FTS5 unchanged, allowing its query syntax
+
+        Returns:
+            Results ranked by relevance, with matches highlighted in `preview_html`
+        """
+        match = query if raw else _quote_query(query)
+        if not match:
+            return []
+
+        sql = (
+            "SELECT type, entity, "
+            f"highlight(search_content, 0, '{_MARK_START}', '{_MARK_END}'), "
+            f"snippet(search_content, 1, '{_MARK_START}', '{_MARK_END}', '...', 24) "
+            "FROM search_content WHERE search_content MATCH ?"
+        )
+        args: list[Any] = [match]
+        if types:
+            sql += f" AND type IN ({', '.join('?' * len(types))})"
+            args.extend(types)
+        # Matches in the name weigh more than matches in the body
+        sql += " ORDER BY bm25(search_content, 10.0, 1.0) LIMIT ?"
+        args.append(count)
+
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+            results = []
+            for entity_type, entity_json, name_html, content_html in rows:
+                entity = json.loads(entity_json)
+                book = self._lookup("book", entity.get("book_id"))
+                chapter = self._lookup("chapter", entity.get("chapter_id"))
+                results.append(SearchResultItem.model_validate({
+                    **entity,
+                    "type": entity_type,
+                    "tags": entity.get("tags", []),
+                    "preview_html": {
+                        "name": self._mark(name_html),
+                        "content": self._mark(content_html),
+                    },
+                    "book": book and {"id": book["id"], "name": book["name"], "slug": book["slug"]},
+                    "chapter": chapter and {"id": chapter["id"], "name": chapter["name"], "slug": chapter["slug"]},
+                }))
+        return results
+
+    @staticmethod
+    def _mark(value: str) -> str:
+        return html.escape(value).replace(_MARK_START, "<strong>").replace(_MARK_END, "</strong>")
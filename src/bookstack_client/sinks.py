@@ -0,0 +1,271 @@
+"""Streaming writers for exporting listing results to files."""
+
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from types import UnionType
+from typing import Any, BinaryIO, Literal, TextIO, Union, get_args, get_origin
+from pydantic import BaseModel
+
+
+class Column:
+    """A flat output column taken from a (possibly nested) model field."""
+
+    __slots__ = ("name", "path", "type")
+
+    def __init__(self, name: str, path: tuple[str, ...], type: type) -> None:
+        """Initialize column.
+
+        Args:
+            name: Column name in the output
+            path: Keys leading to the value in a raw API item
+            type: Python type of the values (int, float, bool, str or datetime)
+        """
+        self.name = name
+        self.path = path
+        self.type = type
+
+    def __repr__(self) -> str:
+        return f"Column({self.name!r}, {self.type.__name__})"
+
+    def get(self, item: dict[str, Any]) -> Any:
+        """Extract the column value from a raw API item."""
+        value: Any = item
+        for key in self.path:
+            if value is None:
+                return None
+            value = value.get(key)
+        return value
+
+
+def _scalar_type(annotation: Any) -> Any:
+    """Reduce optionals and literals to the underlying scalar or model type."""
+    origin = get_origin(annotation)
+    if origin is Union or origin is UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _scalar_type(args[0]) if len(args) == 1 else str
+    if origin is Literal:
+        return type(get_args(annotation)[0])
+    return annotation
+
+
+def model_columns(model: type[BaseModel]) -> list[Column]:
+    """Derive flat output columns from the fields of a model.
+
+    Fields holding a nested model are flattened into `<field>_<subfield>`
+    columns; names already taken by a top-level field (such as `user_id` on
+    `AuditLogItem`) are skipped. List fields are not exported.
+
+    Args:
+        model: The item model, e.g. `AuditLogItem`
+
+    Returns:
+        The columns in field order
+    """
+    columns: list[Column] = []
+    taken = set(model.model_fields)
+
+    for name, field in model.model_fields.items():
+        field_type = _scalar_type(field.annotation)
+        key = field.alias or name
+
+        if isinstance(field_type, type) and issubclass(field_type, BaseModel):
+            for sub_name, sub_field in field_type.model_fields.items():
+                sub_type = _scalar_type(sub_field.annotation)
+                column_name = f"{name}_{sub_name}"
+                if column_name in taken or sub_type not in (int, float, bool, str, datetime):
+                    continue
+                columns.append(Column(column_name, (key, sub_field.alias or sub_name), sub_type))
+        elif field_type in (int, float, bool, str, datetime):
+            columns.append(Column(name, (key,), field_type))
+
+    return columns
+
+
+class RecordSink(ABC):
+    """Interface for writers receiving batches of flat records.
+
+    Sinks are context managers; leaving the `with` block flushes and closes
+    the output.
+    """
+
+    def __init__(self, columns: list[Column]) -> None:
+        self.columns = columns
+        self.rows_written = 0
+
+    def __enter__(self) -> "RecordSink":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @abstractmethod
+    def write_items(self, items: list[dict[str, Any]]) -> None:
+        """Write a batch of raw API items, extracting the sink's columns."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush pending data and close the output."""
+
+
+def _open(target: str | os.PathLike | Any, mode: str, **kwargs) -> tuple[Any, bool]:
+    if isinstance(target, (str, os.PathLike)):
+        return open(target, mode, **kwargs), True
+    return target, False
+
+
+class NDJSONSink(RecordSink):
+    """Writes one JSON object per line; uses orjson when it is installed."""
+
+    def __init__(self, target: str | os.PathLike | BinaryIO, columns: list[Column]) -> None:
+        """Initialize NDJSON sink.
+
+        Args:
+            target: Output path or binary file object
+            columns: Columns to write, see `model_columns`
+        """
+        super().__init__(columns)
+        self._file, self._owned = _open(target, "wb")
+        self._dumps: Callable[[Any], bytes]
+        try:
+            import orjson
+            self._dumps = orjson.dumps
+        except ImportError:
+            self._dumps = lambda row: json.dumps(row, separators=(",", ":")).encode()
+
+    def write_items(self, items: list[dict[str, Any]]) -> None:
+        if not items:
+            return
+        columns = self.columns
+        lines = [self._dumps({c.name: c.get(item) for c in columns}) for item in items]
+        self._file.write(b"\n".join(lines) + b"\n")
+        self.rows_written += len(items)
+
+    def close(self) -> None:
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class CSVSink(RecordSink):
+    """Writes comma-separated values with a header row."""
+
+    def __init__(self, target: str | os.PathLike | TextIO, columns: list[Column], **fmtparams: Any) -> None:
+        """Initialize CSV sink.
+
+        Args:
+            target: Output path or text file object
+            columns: Columns to write, see `model_columns`
+            **fmtparams: Formatting parameters passed to `csv.writer`
+        """
+        super().__init__(columns)
+        self._file, self._owned = _open(target, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file, **fmtparams)
+        self._writer.writerow([c.name for c in columns])
+
+    def write_items(self, items: list[dict[str, Any]]) -> None:
+        columns = self.columns
+        self._writer.writerows([[c.get(item) for c in columns] for item in items])
+        self.rows_written += len(items)
+
+    def close(self) -> None:
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class ParquetSink(RecordSink):
+    """Writes an Apache Parquet file through pyarrow.
+
+    Values are buffered column-wise and written as one row group every
+    `row_group_size` rows, so memory stays bounded regardless of the number
+    of exported rows. Timestamps are stored as UTC microsecond timestamps.
+
+    Requires the optional `pyarrow` dependency.
+    """
+
+    def __init__(
+        self,
+        target: str | os.PathLike | BinaryIO,
+        columns: list[Column],
+        row_group_size: int = 65536,
+        **writer_kwargs: Any,
+    ) -> None:
+        """Initialize Parquet sink.
+
+        Args:
+            target: Output path or binary file object
+            columns: Columns to write, see `model_columns`
+            row_group_size: Number of rows buffered before a row group is written
+            **writer_kwargs: Additional arguments passed to `pyarrow.parquet.ParquetWriter`
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "ParquetSink requires pyarrow, install it with `pip install bookstack-client[parquet]`"
+            ) from e
+
+        super().__init__(columns)
+        self._pa = pa
+        arrow_types = {
+            int: pa.int64(),
+            float: pa.float64(),
+            bool: pa.bool_(),
+            str: pa.string(),
+            datetime: pa.timestamp("us", tz="UTC"),
+        }
+        self._schema = pa.schema([(c.name, arrow_types[c.type]) for c in columns])
+        self._writer = pq.ParquetWriter(target, self._schema, **writer_kwargs)
+        self.row_group_size = row_group_size
+        self._buffer: list[list[Any]] = [[] for _ in columns]
+
+    def write_items(self, items: list[dict[str, Any]]) -> None:
+        for column, values in zip(self.columns, self._buffer, strict=True):
+            values.extend(column.get(item) for item in items)
+        self.rows_written += len(items)
+
+        if len(self._buffer[0]) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer or not self._buffer[0]:
+            return
+
+        pa = self._pa
+        arrays = []
+        for field, values in zip(self._schema, self._buffer, strict=True):
+            if pa.types.is_timestamp(field.type):
+                # BookStack returns ISO 8601 strings; let Arrow parse them
+                arrays.append(pa.array(values, pa.string()).cast(field.type))
+            else:
+                arrays.append(pa.array(values, field.type))
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+        self._buffer = [[] for _ in self.columns]
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+def write_pages(pages: Iterable[list[dict[str, Any]]], sink: RecordSink) -> int:
+    """Stream pages of raw API items into a sink.
+
+    Args:
+        pages: Pages of raw items, e.g. from a resource's `iter_pages(validate=False)`
+        sink: Destination sink
+
+    Returns:
+        Number of items written
+    """
+    written = 0
+    for page in pages:
+        sink.write_items(page)
+        written += len(page)
+    return written
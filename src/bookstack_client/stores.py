@@ -0,0 +1,121 @@
+"""Persistent key-value stores for sync state such as cursors."""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+
+class StateStore(ABC):
+    """Interface for stores persisting small JSON-serializable state values."""
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Get the value stored under `key`, or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Persist `value` under `key`."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the value stored under `key`, if any."""
+
+
+class JSONFileStore(StateStore):
+    """State store backed by a single JSON file.
+
+    The file is rewritten atomically on every change, so a crash never leaves
+    a partially written state behind.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Initialize JSON file store.
+
+        Args:
+            path: Path of the JSON file; it is created on the first write
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _dump(self, state: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            return self._load().get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            state = self._load()
+            state[key] = value
+            self._dump(state)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            state = self._load()
+            if state.pop(key, None) is not None:
+                self._dump(state)
+
+
+class SQLiteStore(StateStore):
+    """State store backed by a table in a SQLite database."""
+
+    def __init__(self, path: str | os.PathLike, table: str = "bookstack_state") -> None:
+        """Initialize SQLite store.
+
+        Args:
+            path: Path of the database file (":memory:" for a temporary store)
+            table: Name of the table holding the state
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table!r}")
+
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT INTO {self.table} (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, json.dumps(value)),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
@@ -0,0 +1,89 @@
+"""Connection pools shared between clients."""
+
+from typing import Any
+
+import httpx
+
+
+class SharedTransport(httpx.BaseTransport):
+    """A connection pool that many `BookStackClient`s can use at the same time.
+
+    Each client normally owns its own pool, so clients for the same instance,
+    e.g. one per tenant token, cannot reuse each other's connections and pay
+    for their own TLS handshakes. API tokens are sent as request headers, not
+    bound to connections, so clients with different tokens can safely send
+    through one pool.
+
+    Closing a client leaves the shared transport open; call `shutdown` once
+    all clients using it are done.
+
+    Example:
+        transport = SharedTransport(limits=httpx.Limits(max_connections=50), http2=True)
+        clients = {
+            tenant: BookStackClient(url, token_id, token_secret, transport=transport)
+            for tenant, (token_id, token_secret) in tokens.items()
+        }
+        ...
+        transport.shutdown()
+    """
+
+    def __init__(
+        self,
+        verify_ssl: bool = True,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        **transport_kwargs: Any,
+    ) -> None:
+        """Initialize shared transport.
+
+        Args:
+            verify_ssl: Whether to verify SSL certificates; applies to every
+                client using the transport, in place of their own `verify_ssl`
+            limits: Pool size and keep-alive expiry (defaults to httpx's limits)
+            http2: Whether to use HTTP/2 where the server supports it (requires
+                the `http2` extra)
+            **transport_kwargs: Additional arguments passed to `httpx.HTTPTransport`
+        """
+        if limits is not None:
+            transport_kwargs["limits"] = limits
+        self._transport = httpx.HTTPTransport(verify=verify_ssl, http2=http2, **transport_kwargs)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        """Called by clients when they are closed; keeps the pool open for the others."""
+
+    def shutdown(self) -> None:
+        """Close all pooled connections."""
+        self._transport.close()
+
+
+class AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """A connection pool that many `AsyncBookStackClient`s can use at the same time.
+
+    The async counterpart of `SharedTransport`. Like any async connection
+    pool, it must only be used from one event loop.
+    """
+
+    def __init__(
+        self,
+        verify_ssl: bool = True,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        **transport_kwargs: Any,
+    ) -> None:
+        """Initialize async shared transport. See `SharedTransport`."""
+        if limits is not None:
+            transport_kwargs["limits"] = limits
+        self._transport = httpx.AsyncHTTPTransport(verify=verify_ssl, http2=http2, **transport_kwargs)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Called by clients when they are closed; keeps the pool open for the others."""
+
+    async def shutdown(self) -> None:
+        """Close all pooled connections."""
+        await self._transport.aclose()
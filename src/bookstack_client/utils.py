@@ -1,4 +1,11 @@
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from datetime import datetime, timezone
 from enum import Enum
+from typing import Any, TypeVar
+
+T = TypeVar("T")
 
 
 class HttpMethod(str, Enum):
@@ -10,3 +17,63 @@ class HttpMethod(str, Enum):
     PATCH = "PATCH"
     OPTIONS = "OPTIONS"
     HEAD = "HEAD"
+
+
+def format_filter_datetime(value: datetime) -> str:
+    """Format a datetime for use in BookStack listing filters, e.g. `filter[updated_at:gt]`.
+
+    Naive datetimes are assumed to be in UTC.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def read_or_none(read: Callable[[int], T], id: int) -> T | None:
+    """Read an entity by id, or return None if it was deleted since it was listed.
+
+    Args:
+        read: The `read` method of a resource, e.g. `client.pages.read`
+        id: ID of the entity
+    """
+    # Imported here so that importing the package does not import httpx
+    from .exceptions import BookStackNotFoundError
+
+    try:
+        return read(id)
+    except BookStackNotFoundError:
+        return None
+
+
+def lazy_exports(
+    module_name: str, exports: Mapping[str, tuple[str, ...]],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build a package's `__getattr__` and `__dir__` that import its exports on first access.
+
+    Keeps `import bookstack_client` cheap: httpx, pydantic and the models are
+    only imported once something that needs them is used.
+
+    Args:
+        module_name: `__name__` of the package
+        exports: Exported names by the relative name of the submodule defining them
+
+    Returns:
+        The `__getattr__` and `__dir__` functions for the package
+    """
+    module = sys.modules[module_name]
+    origins = {name: submodule for submodule, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        try:
+            submodule = origins[name]
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(submodule, module_name), name)
+        # Later lookups find the attribute without going through __getattr__
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(module), *origins})
+
+    return __getattr__, __dir__
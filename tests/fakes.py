@@ -0,0 +1,193 @@
+"""Fake BookStack API responses for the tests, served through `httpx.MockTransport`."""
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from bookstack_client import AsyncBookStackClient, BookStackClient
+
+BASE_URL = "http://bookstack.test"
+USER = {"id": 1, "name": "Admin", "slug": "admin"}
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+_FILTER = re.compile(r"filter\[(\w+)(?::(\w+))?\]")
+
+
+def timestamp(day: int = 1, second: int = 0) -> str:
+    """An API timestamp on a day of January 2024."""
+    return f"2024-01-{day:02d}T00:00:{second:02d}.000000Z"
+
+
+def audit_log_entry(id: int, **fields: Any) -> dict[str, Any]:
+    return {
+        "id": id, "type": "page_update", "detail": f"entry {id}", "user_id": 1, "loggable_id": id,
+        "loggable_type": "page", "ip": "127.0.0.1", "created_at": timestamp(), "user": USER, **fields,
+    }
+
+
+def book_item(id: int, **fields: Any) -> dict[str, Any]:
+    return {
+        "id": id, "name": f"Book {id}", "slug": f"book-{id}", "description": "", "created_at": timestamp(),
+        "updated_at": timestamp(), "created_by": 1, "updated_by": 1, "owned_by": 1, **fields,
+    }
+
+
+def chapter_item(id: int, book_id: int, **fields: Any) -> dict[str, Any]:
+    return {
+        "id": id, "book_id": book_id, "name": f"Chapter {id}", "slug": f"chapter-{id}", "description": "",
+        "priority": 0, "created_at": timestamp(), "updated_at": timestamp(), "created_by": 1, "updated_by": 1,
+        "owned_by": 1, "book_slug": f"book-{book_id}", **fields,
+    }
+
+
+def page_item(id: int, book_id: int = 1, chapter_id: int = 0, **fields: Any) -> dict[str, Any]:
+    return {
+        "id": id, "book_id": book_id, "chapter_id": chapter_id, "name": f"Page {id}", "slug": f"page-{id}",
+        "priority": 0, "draft": False, "revision_count": 1, "template": False, "created_at": timestamp(),
+        "updated_at": timestamp(), "created_by": 1, "updated_by": 1, "owned_by": 1, "editor": "wysiwyg",
+        "book_slug": f"book-{book_id}", **fields,
+    }
+
+
+def shelf_item(id: int, **fields: Any) -> dict[str, Any]:
+    return {
+        "id": id, "name": f"Shelf {id}", "slug": f"shelf-{id}", "description": "", "created_at": timestamp(),
+        "updated_at": timestamp(), "created_by": 1, "updated_by": 1, "owned_by": 1, **fields,
+    }
+
+
+def _comparable(value: Any) -> Any:
+    # API timestamps and filter values compare as "YYYY-MM-DD HH:MM:SS"
+    return value.replace("T", " ")[:19] if isinstance(value, str) else value
+
+
+def listing(rows: list[dict[str, Any]], request: httpx.Request) -> httpx.Response:
+    """Answer a listing request like BookStack: filter, sort, then cut the offset/count window."""
+    params = request.url.params
+    for key, value in params.multi_items():
+        match = _FILTER.fullmatch(key)
+        if match is None:
+            continue
+        field, op = match.group(1), match.group(2) or "eq"
+        target = int(value) if field.endswith("id") else value
+        compare = {
+            "eq": lambda a, b: a == b, "gt": lambda a, b: a > b, "gte": lambda a, b: a >= b,
+            "lt": lambda a, b: a < b, "lte": lambda a, b: a <= b,
+        }[op]
+        rows = [row for row in rows if compare(_comparable(row[field]), target)]
+
+    sort = params.get("sort")
+    if sort:
+        rows = sorted(rows, key=lambda row: _comparable(row[sort[1:]]), reverse=sort.startswith("-"))
+
+    offset, count = int(params.get("offset", 0)), int(params.get("count", 100))
+    return httpx.Response(200, json={"data": rows[offset:offset + count], "total": len(rows)})
+
+
+def error(status_code: int, message: str = "error", **headers: str) -> httpx.Response:
+    return httpx.Response(status_code, json={"error": {"code": status_code, "message": message}}, headers=headers)
+
+
+def make_client(handler: Handler, **kwargs: Any) -> BookStackClient:
+    return BookStackClient(BASE_URL, "id", "secret", transport=httpx.MockTransport(handler), **kwargs)
+
+
+def make_async_client(handler: Handler, **kwargs: Any) -> AsyncBookStackClient:
+    return AsyncBookStackClient(BASE_URL, "id", "secret", transport=httpx.MockTransport(handler), **kwargs)
+
+
+class Wiki:
+    """Fake BookStack instance holding shelves, books, chapters and pages.
+
+    Serves the listing, detail and export endpoints of the content and the
+    recycle bin, and records every request. Entities are plain listing items; page items
+    additionally carry their "html".
+    """
+
+    def __init__(self) -> None:
+        self.shelves: dict[int, dict[str, Any]] = {}
+        self.books: dict[int, dict[str, Any]] = {}
+        self.chapters: dict[int, dict[str, Any]] = {}
+        self.pages: dict[int, dict[str, Any]] = {}
+        self.shelf_books: dict[int, list[int]] = {}
+        self.recycle_bin: list[dict[str, Any]] = []
+        self.recycle_bin_forbidden = False
+        self.vanished: set[tuple[str, int]] = set()
+        self.requests: list[httpx.Request] = []
+
+    def add_shelf(self, id: int, book_ids: list[int], **fields: Any) -> dict[str, Any]:
+        self.shelf_books[id] = book_ids
+        self.shelves[id] = shelf_item(id, **fields)
+        return self.shelves[id]
+
+    def add_book(self, id: int, **fields: Any) -> dict[str, Any]:
+        self.books[id] = book_item(id, **fields)
+        return self.books[id]
+
+    def add_chapter(self, id: int, book_id: int, **fields: Any) -> dict[str, Any]:
+        self.chapters[id] = chapter_item(id, book_id, **fields)
+        return self.chapters[id]
+
+    def add_page(self, id: int, book_id: int, chapter_id: int = 0, html: str = "", **fields: Any) -> dict[str, Any]:
+        self.pages[id] = {**page_item(id, book_id, chapter_id, **fields), "html": html}
+        return self.pages[id]
+
+    def trash(self, collection: str, id: int, deleted_at: str, entry_id: int | None = None) -> None:
+        """Move an entity to the recycle bin, like deleting it in BookStack."""
+        deletable_type = {"shelves": "bookshelf", "books": "book", "chapters": "chapter", "pages": "page"}[collection]
+        deletable = getattr(self, collection).pop(id)
+        self.recycle_bin.append({
+            "id": entry_id or len(self.recycle_bin) + 1, "deleted_by": 1, "created_at": deleted_at,
+            "updated_at": deleted_at, "deletable_type": deletable_type, "deletable_id": id, "deletable": deletable,
+        })
+
+    def vanish(self, collection: str, id: int) -> None:
+        """Keep listing an entity but answer 404 for its details, as if deleted after listing."""
+        self.vanished.add((collection, id))
+
+    def _detail(self, collection: str, id: int) -> dict[str, Any] | None:
+        entity = getattr(self, collection).get(id)
+        if entity is None or (collection, id) in self.vanished:
+            return None
+
+        detail = {**entity, "created_by": USER, "updated_by": USER, "owned_by": USER, "tags": []}
+        if collection == "shelves":
+            detail.update(description_html="", books=[self.books[book_id] for book_id in self.shelf_books[id]])
+        elif collection == "books":
+            chapters = [chapter for chapter in self.chapters.values() if chapter["book_id"] == id]
+            detail["contents"] = [
+                {**chapter, "type": "chapter", "url": "",
+                 "pages": [{**page, "url": ""} for page in self.pages.values() if page["chapter_id"] == chapter["id"]]}
+                for chapter in chapters
+            ] + [
+                {**page, "type": "page", "url": ""}
+                for page in self.pages.values() if page["book_id"] == id and not page["chapter_id"]
+            ]
+        elif collection == "chapters":
+            detail["pages"] = [page for page in self.pages.values() if page["chapter_id"] == id]
+        elif collection == "pages":
+            detail.update(raw_html=entity["html"], markdown="")
+        return detail
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        parts = request.url.path.removeprefix("/api/").split("/")
+
+        if parts == ["recycle-bin"]:
+            if self.recycle_bin_forbidden:
+                return error(403, "Permission denied")
+            return listing(self.recycle_bin, request)
+        if len(parts) == 1 and parts[0] in ("shelves", "books", "chapters", "pages"):
+            rows = [{key: value for key, value in row.items() if key != "html"}
+                    for row in getattr(self, parts[0]).values()]
+            return listing(rows, request)
+        if len(parts) == 2 and parts[0] in ("shelves", "books", "chapters", "pages"):
+            detail = self._detail(parts[0], int(parts[1]))
+            if detail is not None:
+                return httpx.Response(200, json=detail)
+        if len(parts) == 4 and parts[2] == "export" and self._detail(parts[0], int(parts[1])) is not None:
+            return httpx.Response(200, content=f"{parts[0]} {parts[1]} as {parts[3]}".encode())
+        return error(404, "Not found")
@@ -0,0 +1,90 @@
+import asyncio
+
+import httpx
+import pytest
+
+from bookstack_client.exceptions import BookStackConnectionError, BookStackNotFoundError
+from bookstack_client.models import AuditLogItem, PageDetail
+
+from .fakes import USER, audit_log_entry, error, listing, make_async_client, page_item
+
+
+def test_list_fetches_every_page():
+    rows = [audit_log_entry(i) for i in range(1, 6)]
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return listing(rows, request)
+
+    async def main():
+        async with make_async_client(handler) as client:
+            return await client.audit_log.list(count=2)
+
+    response = asyncio.run(main())
+
+    assert [item.id for item in response.data] == [1, 2, 3, 4, 5]
+    assert all(isinstance(item, AuditLogItem) for item in response.data)
+    assert response.total == 5
+    assert [request.url.params["offset"] for request in requests] == ["0", "2", "4"]
+
+
+def test_iter_yields_items_in_order():
+    rows = [audit_log_entry(i) for i in range(1, 8)]
+
+    async def main():
+        async with make_async_client(lambda request: listing(rows, request)) as client:
+            return [item.id async for item in client.audit_log.iter(count=3)]
+
+    assert asyncio.run(main()) == list(range(1, 8))
+
+
+def test_read_sends_token_and_validates_detail():
+    def handler(request):
+        assert request.headers["Authorization"] == "Token id:secret"
+        assert request.url.path == "/api/pages/3"
+        return httpx.Response(200, json={
+            **page_item(3), "html": "<p>Hi</p>", "created_by": USER, "updated_by": USER, "owned_by": USER,
+        })
+
+    async def main():
+        async with make_async_client(handler) as client:
+            return await client.pages.read(3)
+
+    page = asyncio.run(main())
+
+    assert isinstance(page, PageDetail)
+    assert page.html == "<p>Hi</p>"
+    assert page.created_by.name == "Admin"
+
+
+def test_error_responses_are_mapped():
+    async def main():
+        async with make_async_client(lambda request: error(404, "Page not found")) as client:
+            await client.pages.read(1)
+
+    with pytest.raises(BookStackNotFoundError, match="Page not found"):
+        asyncio.run(main())
+
+
+def test_connection_errors_are_mapped():
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    async def main():
+        async with make_async_client(handler) as client:
+            await client.pages.read(1)
+
+    with pytest.raises(BookStackConnectionError):
+        asyncio.run(main())
+
+
+def test_context_manager_closes_http_client():
+    async def main():
+        async with make_async_client(lambda request: listing([], request)) as client:
+            pass
+        return client
+
+    client = asyncio.run(main())
+
+    assert client._client.is_closed
@@ -0,0 +1,131 @@
+import asyncio
+import base64
+import io
+import json
+
+import httpx
+import pytest
+
+from .fakes import USER, make_async_client, make_client, timestamp
+
+CONTENT = bytes(range(256)) * 40
+
+
+def attachment(id: int = 1, **fields):
+    return {
+        "id": id, "name": "Report", "extension": "bin", "uploaded_to": 5, "external": False, "order": 0,
+        "created_at": timestamp(), "updated_at": timestamp(), "created_by": 1, "updated_by": 1, **fields,
+    }
+
+
+def detail_body(content: bytes = CONTENT, **fields) -> bytes:
+    body = json.dumps({
+        **attachment(**fields), "created_by": USER, "updated_by": USER,
+        "links": {"html": "", "markdown": ""}, "content": base64.b64encode(content).decode(),
+    })
+    # PHP's json_encode escapes the "/" of the base64 alphabet
+    return body.replace("/", "\\/").encode()
+
+
+def test_download_decodes_the_streamed_content():
+    body = detail_body()
+    assert b"\\/" in body
+    client = make_client(lambda request: httpx.Response(200, content=body))
+    target = io.BytesIO()
+
+    written = client.attachments.download(1, target, chunk_size=7)
+
+    assert target.getvalue() == CONTENT
+    assert written == len(CONTENT)
+
+
+def test_download_to_a_path(tmp_path):
+    client = make_client(lambda request: httpx.Response(200, content=detail_body(b"hello")))
+
+    client.attachments.download(1, tmp_path / "report.bin")
+
+    assert (tmp_path / "report.bin").read_bytes() == b"hello"
+
+
+def test_download_rejects_link_attachments():
+    body = json.dumps({**attachment(external=True), "content": "https://example.com"}).encode()
+    client = make_client(lambda request: httpx.Response(200, content=body))
+
+    with pytest.raises(ValueError, match="external link"):
+        client.attachments.download(1, io.BytesIO())
+
+
+def test_download_rejects_truncated_responses():
+    client = make_client(lambda request: httpx.Response(200, content=detail_body()[:200]))
+
+    with pytest.raises(ValueError, match="ended"):
+        client.attachments.download(1, io.BytesIO())
+
+
+def test_async_download_decodes_the_streamed_content():
+    target = io.BytesIO()
+
+    async def main():
+        async with make_async_client(lambda request: httpx.Response(200, content=detail_body())) as client:
+            return await client.attachments.download(1, target, chunk_size=5)
+
+    assert asyncio.run(main()) == len(CONTENT)
+    assert target.getvalue() == CONTENT
+
+
+def test_create_streams_the_file_as_multipart(tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        request.read()
+        return httpx.Response(200, json=attachment())
+
+    path = tmp_path / "report.bin"
+    path.write_bytes(CONTENT)
+    client = make_client(handler)
+
+    created = client.attachments.create("Report", 5, file=path)
+
+    request = requests[0]
+    assert created.id == 1
+    assert request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert b'filename="report.bin"' in request.content
+    assert b'name="uploaded_to"\r\n\r\n5' in request.content
+    assert CONTENT in request.content
+
+
+def test_create_link_attachments_as_json():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=attachment(external=True))
+
+    make_client(handler).attachments.create("Docs", 5, link="https://example.com")
+
+    assert json.loads(requests[0].content) == {"name": "Docs", "uploaded_to": 5, "link": "https://example.com"}
+
+
+def test_create_needs_either_a_file_or_a_link():
+    client = make_client(lambda request: httpx.Response(200, json=attachment()))
+
+    with pytest.raises(ValueError):
+        client.attachments.create("Report", 5)
+    with pytest.raises(ValueError):
+        client.attachments.create("Report", 5, file=b"x", link="https://example.com")
+
+
+def test_update_with_a_file_overrides_the_method():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        request.read()
+        return httpx.Response(200, json=attachment())
+
+    make_client(handler).attachments.update(1, file=io.BytesIO(b"new"), filename="new.bin")
+
+    assert requests[0].method == "POST"
+    assert b'name="_method"\r\n\r\nPUT' in requests[0].content
+    assert b'filename="new.bin"' in requests[0].content
@@ -0,0 +1,132 @@
+import json
+import threading
+import time
+
+import httpx
+from pydantic import ValidationError
+
+from bookstack_client import RateLimiter, RetryPolicy, batch_write_pages
+from bookstack_client.bulk import WriteOperation
+from bookstack_client.exceptions import BookStackNotFoundError, BookStackValidationError
+from bookstack_client.models import PageCreate
+
+from .fakes import USER, error, make_client, page_item
+
+
+class Pages:
+    """Handler creating, updating and deleting pages; only pages 1 to 5 exist."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.next_id = 100
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.requests.append(request)
+            if request.method == "POST":
+                data = json.loads(request.content)
+                if not data.get("name"):
+                    return error(422, "The name field is required")
+                self.next_id += 1
+                return httpx.Response(200, json=self.page(self.next_id, name=data["name"]))
+
+            page_id = int(request.url.path.rsplit("/", 1)[1])
+            if page_id > 5:
+                return error(404, "Page not found")
+            if request.method == "DELETE":
+                return httpx.Response(204)
+            return httpx.Response(200, json=self.page(page_id, **json.loads(request.content)))
+
+    @staticmethod
+    def page(id, **fields):
+        return {**page_item(id, **fields), "html": "", "created_by": USER, "updated_by": USER, "owned_by": USER}
+
+
+def test_operations_run_in_order_of_creates_updates_deletes():
+    server = Pages()
+
+    report = batch_write_pages(
+        make_client(server),
+        creates=[PageCreate(book_id=1, name="New", html="<p></p>")],
+        updates={1: {"name": "Renamed"}},
+        deletes=[2],
+        max_workers=2,
+    )
+
+    assert report.ok
+    assert [result.item.action for result in report] == ["create", "update", "delete"]
+    assert report.results[0].value.name == "New"
+    assert report.results[1].value.name == "Renamed"
+    assert report.results[2].value is None
+    assert sorted(request.method for request in server.requests) == ["DELETE", "POST", "PUT"]
+
+
+def test_failures_are_reported_without_stopping_the_batch():
+    report = batch_write_pages(
+        make_client(Pages()),
+        creates=[{"book_id": 1, "name": ""}, {"book_id": 1, "name": "Fine"}],
+        updates=[(3, {"name": "A"}), (9, {"name": "B"})],
+        deletes=[4, 8],
+    )
+
+    assert not report.ok
+    assert len(report) == 6
+    assert len(report.succeeded) == 3
+    assert [result.item.id for result in report.failed] == [None, 9, 8]
+    assert isinstance(report.failed[0].error, BookStackValidationError)
+    assert isinstance(report.failed[1].error, BookStackNotFoundError)
+
+
+def test_invalid_data_is_reported_per_operation():
+    server = Pages()
+
+    report = batch_write_pages(make_client(server), updates={1: {"name": "x" * 300}, 2: {"name": "Fine"}})
+
+    # PageUpdate rejects the name before any request is sent
+    assert isinstance(report.failed[0].error, ValidationError)
+    assert [request.url.path for request in server.requests] == ["/api/pages/2"]
+
+
+def test_concurrency_is_bounded():
+    current = peak = 0
+    lock = threading.Lock()
+    server = Pages()
+
+    def handler(request):
+        nonlocal current, peak
+        with lock:
+            current += 1
+            peak = max(peak, current)
+        time.sleep(0.01)
+        with lock:
+            current -= 1
+        return server(request)
+
+    batch_write_pages(make_client(handler), deletes=range(1, 6), max_workers=2)
+
+    assert peak == 2
+
+
+def test_rate_limited_writes_are_retried(monkeypatch):
+    monkeypatch.setattr("bookstack_client.client.time.sleep", lambda delay: None)
+    server = Pages()
+    limited = {"count": 0}
+
+    def handler(request):
+        if limited["count"] < 2:
+            limited["count"] += 1
+            return error(429, **{"Retry-After": "0"})
+        return server(request)
+
+    client = make_client(handler, retry_policy=RetryPolicy(), rate_limiter=RateLimiter(requests=1000))
+
+    report = batch_write_pages(client, creates=[{"book_id": 1, "name": "New"}], max_workers=1)
+
+    assert report.ok
+    assert limited["count"] == 2
+
+
+def test_write_operations_describe_themselves():
+    assert repr(WriteOperation("update", 3, {})) == "WriteOperation(update 3)"
+    assert repr(WriteOperation("create", data={})) == "WriteOperation(create)"
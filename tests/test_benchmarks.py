@@ -0,0 +1,83 @@
+import json
+
+import httpx
+import pytest
+
+from benchmarks.mock_server import MockBookStack
+from benchmarks.run import Result, compare, main
+
+
+def result(name, value, higher_is_better=False, **params):
+    return Result(name, "ms", [value], higher_is_better, **params).to_dict()
+
+
+@pytest.fixture
+def baseline(tmp_path):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"results": [
+        result("latency", 10.0, size=1),
+        result("throughput", 100.0, higher_is_better=True, size=1),
+        result("empty", 0.0),
+    ]}))
+    return str(path)
+
+
+def test_result_reports_the_median_and_stats():
+    data = Result("x", "ms", [3.0, 1.0, 2.0], False, size=5).to_dict()
+
+    assert data["value"] == 2.0
+    assert data["params"] == {"size": 5}
+    assert data["stats"]["runs"] == 3
+    assert data["stats"]["min"] == 1.0
+
+
+@pytest.mark.parametrize(("latency", "throughput", "ok"), [
+    (10.5, 98.0, True),
+    (11.5, 100.0, False),
+    (10.0, 85.0, False),
+    (5.0, 200.0, True),
+])
+def test_compare_flags_regressions_beyond_the_threshold(baseline, latency, throughput, ok, capsys):
+    results = [result("latency", latency, size=1), result("throughput", throughput, higher_is_better=True, size=1)]
+
+    assert compare(results, baseline, threshold=0.10) is ok
+    assert ("REGRESSION" in capsys.readouterr().out) is not ok
+
+
+def test_compare_skips_new_and_zero_baselines(baseline):
+    results = [result("latency", 50.0, size=2), result("empty", 1.0)]
+
+    assert compare(results, baseline, threshold=0.10)
+
+
+def test_main_writes_results_and_fails_on_regressions(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    argv = ["json_decode", "--repeats", "2", "--number", "1", "--page-size", "5", "--output", str(output)]
+
+    assert main(argv) == 0
+    report = json.loads(output.read_text())
+    assert {item["params"]["decoder"] for item in report["results"]} >= {"json", "default"}
+    assert "python" in report["meta"]
+
+    # A baseline a thousand times faster than the measurement
+    for item in report["results"]:
+        item["value"] /= 1000
+    output.write_text(json.dumps(report))
+    assert main([*argv[:-2], "--compare", str(output)]) == 1
+
+
+def test_main_rejects_unknown_benchmarks():
+    with pytest.raises(SystemExit):
+        main(["nope"])
+
+
+def test_mock_server_paginates_listings():
+    server = MockBookStack(total=7)
+    client = httpx.Client(transport=server.transport(), base_url="http://bookstack.local")
+
+    body = client.get("/api/pages", params={"offset": 5, "count": 5}).json()
+
+    assert body["total"] == 7
+    assert [row["id"] for row in body["data"]] == [6, 7]
+    assert client.get("/api/books").status_code == 404
+    assert server.requests == 2
@@ -0,0 +1,132 @@
+import re
+import threading
+import time
+
+import httpx
+import pytest
+
+from bookstack_client import run_bulk, upload_images
+from bookstack_client.bulk import expand_paths
+from bookstack_client.exceptions import BookStackError, BookStackValidationError
+
+from .fakes import USER, error, make_client, timestamp
+
+
+def image(id: int, name: str):
+    return {
+        "id": id, "name": name, "url": f"/uploads/{name}", "path": f"/uploads/{name}", "type": "gallery",
+        "uploaded_to": 42, "created_by": USER, "updated_by": USER, "created_at": timestamp(),
+        "updated_at": timestamp(), "thumbs": {"gallery": "", "display": ""}, "content": {"html": "", "markdown": ""},
+    }
+
+
+class Gallery:
+    """Handler accepting image uploads, rejecting files whose name contains "bad"."""
+
+    def __init__(self) -> None:
+        self.uploads: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        body = request.read()
+        filename = re.search(rb'filename="([^"]+)"', body).group(1).decode()
+        if "bad" in filename:
+            return error(422, "The image must be an image")
+        with self._lock:
+            self.uploads[filename] = body
+            return httpx.Response(200, json=image(len(self.uploads), filename))
+
+
+def test_run_bulk_keeps_the_order_of_items():
+    def slow_square(n):
+        time.sleep((5 - n) / 500)
+        return n * n
+
+    results = run_bulk(slow_square, range(5), max_workers=5)
+
+    assert [result.item for result in results] == [0, 1, 2, 3, 4]
+    assert [result.value for result in results] == [0, 1, 4, 9, 16]
+
+
+def test_run_bulk_bounds_concurrency():
+    current = peak = 0
+    lock = threading.Lock()
+
+    def work(item):
+        nonlocal current, peak
+        with lock:
+            current += 1
+            peak = max(peak, current)
+        time.sleep(0.01)
+        with lock:
+            current -= 1
+
+    run_bulk(work, range(12), max_workers=3)
+
+    assert peak == 3
+
+
+def test_run_bulk_records_expected_errors_and_reports_progress():
+    progress = []
+
+    def work(item):
+        if item == 2:
+            raise BookStackError("failed")
+        return item
+
+    results = run_bulk(work, range(4), progress=lambda result, done, total: progress.append((done, total)))
+
+    assert [result.ok for result in results] == [True, True, False, True]
+    assert str(results[2].error) == "failed"
+    assert sorted(progress) == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+
+def test_run_bulk_raises_unexpected_errors():
+    def work(item):
+        raise KeyError(item)
+
+    with pytest.raises(KeyError):
+        run_bulk(work, range(3))
+
+
+def test_expand_paths_globs_recursively_and_keeps_missing_paths(tmp_path):
+    (tmp_path / "shots" / "deep").mkdir(parents=True)
+    for name in ("shots/a.png", "shots/deep/b.png", "shots/notes.txt"):
+        (tmp_path / name).write_bytes(b"x")
+
+    paths = expand_paths([tmp_path / "shots" / "**" / "*.png", tmp_path / "missing.png"])
+
+    assert [path.relative_to(tmp_path).as_posix() for path in paths] == [
+        "missing.png", "shots/a.png", "shots/deep/b.png",
+    ]
+
+
+def test_upload_images_reports_each_file(tmp_path):
+    for name in ("one.png", "two.png", "bad.png"):
+        (tmp_path / name).write_bytes(name.encode())
+    gallery = Gallery()
+
+    results = upload_images(make_client(gallery), [tmp_path / "*.png", tmp_path / "gone.png"], 42, max_workers=2)
+
+    outcome = {result.item.name: result for result in results}
+    assert sorted(gallery.uploads) == ["one.png", "two.png"]
+    assert b"one.png" in gallery.uploads["one.png"]
+    assert outcome["one.png"].value.name == "one.png"
+    assert isinstance(outcome["bad.png"].error, BookStackValidationError)
+    assert isinstance(outcome["gone.png"].error, FileNotFoundError)
+
+
+def test_image_update_only_sends_given_fields():
+    bodies = []
+
+    def handler(request):
+        bodies.append(request.content)
+        return httpx.Response(200, json=image(1, "renamed.png"))
+
+    client = make_client(handler)
+
+    assert client.images.update(1, name="renamed.png").name == "renamed.png"
+    with pytest.raises(ValueError):
+        client.images.update(1)
+
+    assert bodies == [b'{"name":"renamed.png"}']
@@ -0,0 +1,184 @@
+import httpx
+import pytest
+
+from bookstack_client import InMemoryCache
+from bookstack_client.cache import CacheEntry, ResponseCache
+
+from .fakes import USER, audit_log_entry, book_item, chapter_item, listing, make_client, page_item
+
+USERS = {"created_by": USER, "updated_by": USER, "owned_by": USER}
+
+
+class Wiki:
+    """Handler serving details of one book, chapter and page, counting reads per path."""
+
+    def __init__(self, **headers: str) -> None:
+        self.headers = headers
+        self.reads: dict[str, int] = {}
+        self.requests: list[httpx.Request] = []
+        self.version = 1
+
+    def __call__(self, request):
+        self.requests.append(request)
+        path = request.url.path.removeprefix("/api")
+        if request.method != "GET":
+            self.version += 1
+            return httpx.Response(204) if request.method == "DELETE" else httpx.Response(200, json=self.page())
+        self.reads[path] = self.reads.get(path, 0) + 1
+        if path == "/audit-log":
+            return listing([audit_log_entry(1)], request)
+        body = {
+            "/books/1": {**book_item(1, name=f"v{self.version}"), **USERS},
+            "/chapters/2": {**chapter_item(2, 1, name=f"v{self.version}"), **USERS},
+            "/pages/3": self.page(),
+        }[path]
+        return httpx.Response(200, json=body, headers=self.headers)
+
+    def page(self):
+        return {**page_item(3, chapter_id=2, name=f"v{self.version}"), "html": "", **USERS}
+
+
+def test_get_responses_are_served_from_the_cache():
+    server = Wiki()
+    client = make_client(server, cache=InMemoryCache())
+
+    first = client.pages.read(3)
+    second = client.pages.read(3)
+
+    assert second is first
+    assert server.reads == {"/pages/3": 1}
+
+
+def test_stale_entries_are_revalidated_with_their_etag():
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"Cache-Control": "max-age=0"})
+        return httpx.Response(200, json={**page_item(3), "html": "", **USERS},
+                              headers={"ETag": '"v1"', "Cache-Control": "max-age=0"})
+
+    requests = []
+    client = make_client(handler, cache=InMemoryCache())
+
+    first = client.pages.read(3)
+    second = client.pages.read(3)
+
+    assert second is first
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_max_age_overrides_the_default_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("bookstack_client.client.time.monotonic", lambda: now[0])
+    monkeypatch.setattr("bookstack_client.cache.time.monotonic", lambda: now[0])
+    server = Wiki(**{"Cache-Control": "max-age=5"})
+    client = make_client(server, cache=InMemoryCache(ttl=600))
+
+    client.pages.read(3)
+    now[0] += 4
+    client.pages.read(3)
+    now[0] += 2
+    client.pages.read(3)
+
+    assert server.reads == {"/pages/3": 2}
+
+
+def test_no_store_responses_are_not_cached():
+    server = Wiki(**{"Cache-Control": "no-store"})
+    client = make_client(server, cache=InMemoryCache())
+
+    client.pages.read(3)
+    client.pages.read(3)
+
+    assert server.reads == {"/pages/3": 2}
+
+
+def test_responses_decoded_differently_are_cached_separately():
+    server = Wiki()
+    client = make_client(server, cache=InMemoryCache())
+
+    client.audit_log.list()
+    client.audit_log.list(mode="lazy")
+    client.audit_log.list()
+    client.audit_log.list(mode="lazy")
+
+    assert server.reads == {"/audit-log": 2}
+
+
+@pytest.mark.parametrize("write", [
+    lambda client: client.pages.update(3, {"name": "new"}),
+    lambda client: client.pages.delete(3),
+])
+def test_page_writes_invalidate_the_page_and_its_parents(write):
+    server = Wiki()
+    client = make_client(server, cache=InMemoryCache())
+    client.books.read(1)
+    client.chapters.read(2)
+    client.pages.read(3)
+
+    write(client)
+    book, chapter, page = client.books.read(1), client.chapters.read(2), client.pages.read(3)
+
+    assert server.reads == {"/books/1": 2, "/chapters/2": 2, "/pages/3": 2}
+    assert book.name == chapter.name == page.name == "v2"
+
+
+def test_chapter_writes_keep_cached_pages():
+    server = Wiki()
+    client = make_client(server, cache=InMemoryCache())
+    client.books.read(1)
+    client.pages.read(3)
+
+    # The chapters resource has no write methods yet
+    client._request("DELETE", "/chapters/2")
+    client.books.read(1)
+    client.pages.read(3)
+
+    assert server.reads == {"/books/1": 2, "/pages/3": 1}
+
+
+def test_invalidate_matches_whole_path_segments():
+    cache = InMemoryCache()
+    for url in ("/pages", "/pages/1", "/pages?count=5", "/pages-x", "/pages-x/1"):
+        cache.set(("GET", url), CacheEntry(url, expires_at=0))
+
+    cache.invalidate("/pages")
+
+    assert cache.get(("GET", "/pages-x")) is not None
+    assert cache.get(("GET", "/pages-x/1")) is not None
+    assert len(cache) == 2
+
+
+def test_least_recently_used_entries_are_evicted_first():
+    cache = InMemoryCache(max_entries=2)
+    cache.set(("GET", "/a"), CacheEntry("a", 0))
+    cache.set(("GET", "/b"), CacheEntry("b", 0))
+    cache.get(("GET", "/a"))
+
+    cache.set(("GET", "/c"), CacheEntry("c", 0))
+
+    assert cache.get(("GET", "/b")) is None
+    assert cache.get(("GET", "/a")).value == "a"
+
+
+def test_total_size_is_kept_below_max_bytes():
+    cache = InMemoryCache(max_bytes=100)
+    cache.set(("GET", "/a"), CacheEntry("a", 0, size=60))
+    cache.set(("GET", "/big"), CacheEntry("big", 0, size=101))
+    cache.set(("GET", "/b"), CacheEntry("b", 0, size=60))
+
+    assert cache.get(("GET", "/big")) is None
+    assert cache.get(("GET", "/a")) is None
+    assert cache.get(("GET", "/b")).value == "b"
+
+
+def test_response_cache_is_abstract():
+    class Partial(ResponseCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        ResponseCache()
+    with pytest.raises(TypeError):
+        Partial()
@@ -0,0 +1,98 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from bookstack_client.columnar import ColumnarResult
+from bookstack_client.models import BookListItem
+from bookstack_client.sinks import model_columns
+
+from .fakes import audit_log_entry, book_item, listing, make_async_client, make_client, timestamp
+
+ROWS = [
+    audit_log_entry(1, type="page_create", created_at=timestamp(1, 0)),
+    audit_log_entry(2, created_at=timestamp(1, 30)),
+    audit_log_entry(3, loggable_id=None, loggable_type=None, created_at=timestamp(2, 0)),
+]
+
+
+@pytest.fixture
+def log():
+    return make_client(lambda request: listing(ROWS, request)).audit_log.list_columnar(count=2)
+
+
+def test_items_are_stored_column_by_column(log):
+    assert len(log) == 3
+    assert log.names[:2] == ["id", "type"]
+    assert log["id"].to_list() == [1, 2, 3]
+    assert log["user_name"].to_list() == ["Admin"] * 3
+    assert log["loggable_id"].to_list() == [1, 2, None]
+    assert log["loggable_type"].to_list() == ["page", "page", None]
+    assert log["created_at"].to_list()[2] == datetime(2024, 1, 2, tzinfo=timezone.utc)
+    # Strings are dictionary encoded
+    assert log["type"].categories == ["page_create", "page_update"]
+    assert list(log["type"].values) == [0, 1, 1]
+
+
+def test_value_counts(log):
+    assert log.value_counts("type") == {"page_update": 2, "page_create": 1}
+    assert log.value_counts("loggable_id") == {1: 1, 2: 1, None: 1}
+    assert log.value_counts("created_at", bucket=timedelta(days=1)) == {
+        datetime(2024, 1, 1, tzinfo=timezone.utc): 2,
+        datetime(2024, 1, 2, tzinfo=timezone.utc): 1,
+    }
+    with pytest.raises(ValueError):
+        log.value_counts("id", bucket=timedelta(days=1))
+
+
+def test_async_list_columnar():
+    async def main():
+        async with make_async_client(lambda request: listing(ROWS, request)) as client:
+            return await client.audit_log.list_columnar(count=2)
+
+    assert asyncio.run(main())["id"].to_list() == [1, 2, 3]
+
+
+def test_every_listing_resource_has_list_columnar():
+    rows = [book_item(1), book_item(2, name="Other")]
+
+    books = make_client(lambda request: listing(rows, request)).books.list_columnar()
+
+    assert books.names == [column.name for column in model_columns(BookListItem)]
+    assert books["name"].to_list() == ["Book 1", "Other"]
+
+
+def test_numpy_arrays_share_the_stored_values(log):
+    np = pytest.importorskip("numpy")
+
+    arrays = log.to_numpy()
+
+    assert arrays["id"].dtype == np.int64
+    assert np.shares_memory(arrays["id"], np.frombuffer(log["id"].values, dtype=np.int64))
+    assert arrays["created_at"].dtype == np.dtype("datetime64[us]")
+    assert log["loggable_id"].valid().tolist() == [True, True, False]
+
+
+def test_pandas_and_arrow_conversions(log):
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    df = log.to_pandas()
+    table = log.to_arrow()
+
+    assert df["type"].dtype == "category"
+    assert str(df["created_at"].dt.tz) == "UTC"
+    assert df["loggable_id"].isna().tolist() == [False, False, True]
+    assert table.num_rows == 3
+    assert table.column("loggable_type").null_count == 1
+    assert str(table.schema.field("created_at").type) == "timestamp[us, tz=UTC]"
+
+
+def test_results_can_be_filled_by_hand():
+    result = ColumnarResult(model_columns(BookListItem))
+
+    result.extend([book_item(1)])
+    result.extend([])
+
+    assert len(result) == 1
+    assert repr(result).startswith("ColumnarResult(1 rows")
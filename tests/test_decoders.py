@@ -0,0 +1,74 @@
+import builtins
+import json
+
+import httpx
+import pytest
+
+from bookstack_client.decoders import get_default_decoder
+from bookstack_client.models import AuditLogItem
+
+from .fakes import USER, audit_log_entry, listing, make_client, page_item
+
+
+def test_default_decoder_prefers_orjson():
+    orjson = pytest.importorskip("orjson")
+
+    assert get_default_decoder() is orjson.loads
+
+
+def test_default_decoder_falls_back_to_json(monkeypatch):
+    real_import = builtins.__import__
+
+    def without_fast_decoders(name, *args, **kwargs):
+        if name in ("orjson", "msgspec"):
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", without_fast_decoders)
+
+    assert get_default_decoder() is json.loads
+
+
+def test_client_decodes_raw_bodies_with_its_json_decoder():
+    decoded = []
+
+    def decoder(content):
+        decoded.append(content)
+        return json.loads(content)
+
+    rows = [audit_log_entry(1)]
+    client = make_client(lambda request: listing(rows, request), json_decoder=decoder)
+
+    items = list(client.audit_log.iter(validate=False))
+
+    assert items == rows
+    assert len(decoded) == 1
+
+
+def test_models_are_validated_straight_from_the_body():
+    decoded = []
+    body = {**page_item(1), "html": "", "created_by": USER, "updated_by": USER, "owned_by": USER}
+    client = make_client(lambda request: httpx.Response(200, json=body), json_decoder=decoded.append)
+
+    page = client.pages.read(1)
+
+    # Model responses skip the generic decoder and its intermediate dicts
+    assert page.id == 1
+    assert decoded == []
+
+
+def test_list_responses_are_validated_straight_from_the_body():
+    decoded = []
+    rows = [audit_log_entry(i) for i in range(1, 4)]
+    client = make_client(lambda request: listing(rows, request), json_decoder=decoded.append)
+
+    response = client.audit_log.list()
+
+    assert all(isinstance(item, AuditLogItem) for item in response.data)
+    assert decoded == []
+
+
+def test_empty_bodies_decode_to_an_empty_dict():
+    client = make_client(lambda request: httpx.Response(204), json_decoder=json.loads)
+
+    assert client._request("DELETE", "/pages/1") == {}
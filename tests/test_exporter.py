@@ -0,0 +1,116 @@
+import asyncio
+import io
+
+import httpx
+import pytest
+
+from bookstack_client import BulkExporter
+from bookstack_client.exceptions import BookStackNotFoundError
+
+from .fakes import BASE_URL, Wiki, make_async_client, make_client
+
+
+@pytest.fixture
+def wiki():
+    wiki = Wiki()
+    wiki.add_book(1)
+    wiki.add_chapter(10, 1)
+    for id in (100, 101, 102):
+        wiki.add_page(id, 1)
+    return wiki
+
+
+def test_exports_are_streamed_to_files(wiki, tmp_path):
+    progress = []
+    exporter = BulkExporter(make_client(wiki), tmp_path / "out", max_workers=2,
+                            progress=lambda result, done, total: progress.append((done, total)))
+
+    results = exporter.export([("book", 1), ("chapter", 10), ("page", 100)])
+
+    assert [result.item for result in results] == [("book", 1), ("chapter", 10), ("page", 100)]
+    assert all(result.ok for result in results)
+    assert (tmp_path / "out" / "chapter-10.md").read_bytes() == b"chapters 10 as markdown"
+    assert results[2].value.bytes_written == len(b"pages 100 as markdown")
+    assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_existing_files_are_skipped_unless_overwriting(wiki, tmp_path):
+    (tmp_path / "page-100.txt").write_text("old")
+
+    skipped = BulkExporter(make_client(wiki), tmp_path, format="plain-text").export_pages([100])
+    overwritten = BulkExporter(make_client(wiki), tmp_path, format="plaintext", overwrite=True).export_pages([100])
+
+    assert skipped[0].value.skipped
+    assert not overwritten[0].value.skipped
+    assert (tmp_path / "page-100.txt").read_text() == "pages 100 as plaintext"
+
+
+def test_api_errors_are_recorded_per_item(wiki, tmp_path):
+    results = BulkExporter(make_client(wiki), tmp_path).export_pages([100, 999, 101])
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, BookStackNotFoundError)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["page-100.md", "page-101.md"]
+
+
+def test_write_errors_are_recorded_per_item(wiki, tmp_path):
+    # A directory in the way of the output file makes the final rename fail
+    (tmp_path / "page-101.md").mkdir()
+
+    results = BulkExporter(make_client(wiki), tmp_path, overwrite=True).export_pages([100, 101, 102])
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, OSError)
+    assert not [path for path in tmp_path.iterdir() if path.name.endswith(".part")]
+
+
+def test_unsupported_formats_are_rejected(wiki, tmp_path):
+    with pytest.raises(ValueError):
+        BulkExporter(make_client(wiki), tmp_path, format="docx")
+
+
+def redirecting(request):
+    if request.url.path == "/api/old":
+        return httpx.Response(302, headers={"Location": f"{BASE_URL}/api/new"})
+    return httpx.Response(200, json={"path": request.url.path, "auth": request.headers["Authorization"]})
+
+
+def test_send_options_are_passed_to_httpx():
+    client = make_client(redirecting)
+
+    response = client._request("GET", "/old", follow_redirects=True, auth=("user", "pass"))
+
+    assert response["path"] == "/api/new"
+    assert response["auth"].startswith("Basic ")
+
+
+def test_async_send_options_are_passed_to_httpx():
+    async def main():
+        async with make_async_client(redirecting) as client:
+            return await client._request("GET", "/old", follow_redirects=True)
+
+    assert asyncio.run(main())["path"] == "/api/new"
+
+
+@pytest.mark.parametrize(("resource", "path"), [
+    ("pages", "/api/pages/1/export/plaintext"),
+    ("chapters", "/api/chapters/1/export/plaintext"),
+    ("books", "/api/books/1/export/plaintext"),
+])
+def test_resources_export_plain_text_as_plaintext(resource, path):
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        return httpx.Response(200, content=b"text")
+
+    async def export_async(buffer):
+        async with make_async_client(handler) as client:
+            return await getattr(client, resource).export(1, "plain-text", buffer)
+
+    buffer = io.BytesIO()
+    assert getattr(make_client(handler), resource).export(1, "plain-text", buffer) == 4
+    assert asyncio.run(export_async(buffer)) == 4
+
+    assert paths == [path, path]
+    assert buffer.getvalue() == b"texttext"
@@ -0,0 +1,100 @@
+import pytest
+
+from bookstack_client import load_hierarchy
+
+from .fakes import Wiki, make_client
+
+
+@pytest.fixture
+def wiki():
+    wiki = Wiki()
+    wiki.add_book(1, slug="admin-guide")
+    wiki.add_book(2)
+    wiki.add_book(3)
+    wiki.add_chapter(10, 1, slug="setup")
+    wiki.add_page(100, 1, 10, slug="installation")
+    wiki.add_page(101, 1, 0, slug="faq")
+    wiki.add_page(200, 2, 0, slug="installation")
+    wiki.add_shelf(50, [1, 2])
+    wiki.add_shelf(51, [1])
+    return wiki
+
+
+def test_tree_links_shelves_books_chapters_and_pages(wiki):
+    tree = load_hierarchy(make_client(wiki), max_workers=4)
+
+    page = tree.get_by_slug("page", "installation", book_slug="admin-guide")
+
+    assert len(tree) == 2 + 3 + 1 + 3
+    assert [node.name for node in page.ancestors()] == ["Chapter 10", "Book 1"]
+    assert page.book is tree.get("book", 1)
+    assert [node.id for node in tree.get("book", 1).walk()] == [1, 10, 100, 101]
+    assert [shelf.id for shelf in tree.shelves_of(page.book)] == [50, 51]
+    assert tree.get_by_slug("page", "installation", book_slug="book-2").id == 200
+
+
+def test_each_book_is_fetched_once(wiki):
+    load_hierarchy(make_client(wiki))
+
+    book_reads = [request.url.path for request in wiki.requests if request.url.path.startswith("/api/books/")]
+    assert sorted(book_reads) == ["/api/books/1", "/api/books/2", "/api/books/3"]
+
+
+def test_books_deleted_while_loading_are_skipped(wiki):
+    wiki.vanish("books", 2)
+
+    tree = load_hierarchy(make_client(wiki))
+
+    assert tree.get("book", 2) is None
+    assert tree.get("page", 200) is None
+    assert [book.id for book in tree.get("bookshelf", 50).children] == [1]
+
+
+def test_shelves_can_be_skipped(wiki):
+    tree = load_hierarchy(make_client(wiki), shelves=False)
+
+    assert tree.shelves == []
+    assert not any(request.url.path.startswith("/api/shelves") for request in wiki.requests)
+
+
+def test_replacing_a_book_keeps_its_positions(wiki):
+    client = make_client(wiki)
+    tree = load_hierarchy(client)
+    wiki.add_page(102, 1, 0, slug="new")
+    wiki.pages.pop(101)
+
+    tree.add_book(client.books.read(1))
+
+    assert [book.id for book in tree.books] == [1, 2, 3]
+    assert [book.id for book in tree.get("bookshelf", 50).children] == [1, 2]
+    assert tree.get("page", 101) is None
+    assert tree.get_by_slug("page", "new", book_slug="admin-guide").parent.id == 1
+
+
+def test_adding_a_shelf_twice_replaces_it(wiki):
+    client = make_client(wiki)
+    tree = load_hierarchy(client)
+
+    tree.add_shelf(client.shelves.read(50))
+    tree.add_shelf(client.shelves.read(50))
+
+    assert [shelf.id for shelf in tree.shelves] == [50, 51]
+    assert [shelf.id for shelf in tree.shelves_of(tree.get("book", 1))] == [51, 50]
+    assert [shelf.id for shelf in tree.shelves_of(tree.get("book", 2))] == [50]
+    tree.remove(tree.get("bookshelf", 50))
+    assert [shelf.id for shelf in tree.shelves] == [51]
+    assert tree.shelves_of(tree.get("book", 2)) == []
+
+
+def test_removing_nodes_unlinks_them(wiki):
+    tree = load_hierarchy(make_client(wiki))
+
+    tree.remove(tree.get("chapter", 10))
+    tree.remove(tree.get("book", 2))
+    tree.remove(tree.get("bookshelf", 51))
+
+    assert tree.get("page", 100) is None
+    assert [node.id for node in tree.get("book", 1).children] == [101]
+    assert [book.id for book in tree.get("bookshelf", 50).children] == [1]
+    assert [shelf.id for shelf in tree.shelves_of(tree.get("book", 1))] == [50]
+    assert [book.id for book in tree.books] == [1, 3]
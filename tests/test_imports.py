@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+RESOURCES = ("attachments", "audit_log", "books", "chapters", "images", "pages", "recycle_bin", "shelves")
+
+
+def loaded_modules(code: str) -> set[str]:
+    """Run `code` in a fresh interpreter and return the package modules it loaded."""
+    script = f"import sys\n{code}\nprint(' '.join(m for m in sys.modules if m.startswith('bookstack_client')))"
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    output = subprocess.run([sys.executable, "-c", script], env=env, check=True, capture_output=True, text=True)
+    return set(output.stdout.split())
+
+
+def test_resources_do_not_load_the_analytics_modules():
+    modules = loaded_modules(
+        "import bookstack_client\n"
+        "client = bookstack_client.BookStackClient('http://bookstack.test', 'id', 'secret')\n"
+        f"for name in {RESOURCES!r}:\n"
+        "    getattr(client, name)"
+    )
+
+    assert "bookstack_client.resources.audit_log" in modules
+    assert not modules & {
+        "bookstack_client.columnar",
+        "bookstack_client.sinks",
+        "bookstack_client.models.lazy",
+        "bookstack_client.models.records",
+    }
+
+
+def test_analytics_modules_load_on_first_use():
+    modules = loaded_modules(
+        "import bookstack_client\n"
+        "client = bookstack_client.BookStackClient('http://bookstack.test', 'id', 'secret')\n"
+        "client.audit_log.columns"
+    )
+
+    assert "bookstack_client.sinks" in modules
+    assert "bookstack_client.columnar" not in modules
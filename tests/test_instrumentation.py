@@ -0,0 +1,117 @@
+import asyncio
+
+import httpx
+import pytest
+
+from bookstack_client import MetricsCollector, RequestHooks, RetryPolicy
+from bookstack_client.exceptions import BookStackConnectionError, BookStackNotFoundError
+from bookstack_client.instrumentation import RequestEvent, normalize_endpoint
+
+from .fakes import audit_log_entry, error, listing, make_async_client, make_client
+
+ROWS = [audit_log_entry(i) for i in range(1, 6)]
+
+
+class Recorder:
+    """Duck-typed hooks, not derived from `RequestHooks`."""
+
+    def __init__(self) -> None:
+        self.started: list[RequestEvent] = []
+        self.ended: list[RequestEvent] = []
+
+    def on_request_start(self, event):
+        self.started.append(event)
+
+    def on_request_end(self, event):
+        self.ended.append(event)
+
+
+def test_endpoints_are_normalized_to_routes():
+    assert normalize_endpoint("/pages/12/export/pdf?x=1") == "/pages/{id}/export/pdf"
+    assert normalize_endpoint("/audit-log") == "/audit-log"
+
+
+@pytest.mark.parametrize("wrap", [lambda hook: hook, lambda hook: [hook], lambda hook: (hook,)])
+def test_hooks_can_be_single_objects_or_sequences(wrap):
+    recorder = Recorder()
+    client = make_client(lambda request: listing(ROWS, request), hooks=wrap(recorder))
+
+    client.audit_log.list(count=2, max_concurrency=1)
+
+    assert client.hooks == [recorder]
+    assert [event.page for event in recorder.ended] == [1, 2, 3]
+    assert recorder.started == recorder.ended
+    assert all(event.status_code == 200 and event.bytes_received > 0 for event in recorder.ended)
+
+
+def test_retries_and_errors_are_separate_events(monkeypatch):
+    monkeypatch.setattr("bookstack_client.client.time.sleep", lambda delay: None)
+    responses = [error(503), error(404, "Page not found")]
+    recorder = Recorder()
+    client = make_client(lambda request: responses.pop(0), hooks=recorder, retry_policy=RetryPolicy())
+
+    with pytest.raises(BookStackNotFoundError):
+        client.pages.read(7)
+
+    assert [(event.attempt, event.status_code) for event in recorder.ended] == [(0, 503), (1, 404)]
+    assert isinstance(recorder.ended[1].error, BookStackNotFoundError)
+    assert recorder.ended[0].route == "/pages/{id}"
+
+
+def test_connection_errors_are_reported():
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    recorder = Recorder()
+    client = make_client(handler, hooks=recorder)
+
+    with pytest.raises(BookStackConnectionError):
+        client.pages.read(1)
+
+    assert recorder.ended[0].status_code is None
+    assert recorder.ended[0].error is not None
+
+
+def test_async_client_reports_events():
+    recorder = Recorder()
+
+    async def main():
+        async with make_async_client(lambda request: listing(ROWS, request), hooks=recorder) as client:
+            await client.audit_log.list()
+
+    asyncio.run(main())
+
+    assert [event.route for event in recorder.ended] == ["/audit-log"]
+
+
+def test_metrics_collector_aggregates_per_route():
+    def handler(request):
+        if request.url.path == "/api/pages/2":
+            return error(404)
+        return listing(ROWS, request)
+
+    metrics = MetricsCollector()
+    client = make_client(handler, hooks=metrics)
+
+    client.audit_log.list(count=2, max_concurrency=1)
+    client._request("GET", "/pages/1")
+    with pytest.raises(BookStackNotFoundError):
+        client._request("GET", "/pages/2")
+
+    stats = {stats.route: stats for stats in metrics.snapshot()}
+    assert stats["/audit-log"].count == 3
+    assert stats["/pages/{id}"].count == 2
+    assert stats["/pages/{id}"].error_rate == 0.5
+    assert stats["/audit-log"].p50 <= stats["/audit-log"].p99
+    assert "/pages/{id}" in metrics.report()
+
+    metrics.reset()
+    assert metrics.snapshot() == []
+
+
+def test_base_hooks_are_no_ops():
+    hooks = RequestHooks()
+    event = RequestEvent("GET", "/pages")
+
+    hooks.on_request_start(event)
+    hooks.on_request_end(event)
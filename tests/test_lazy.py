@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from bookstack_client.models import AuditLogItem
+from bookstack_client.models.lazy import LazyModelList
+
+from .fakes import audit_log_entry, listing, make_async_client, make_client
+
+ROWS = [audit_log_entry(i) for i in range(1, 6)]
+
+
+def test_items_are_validated_on_first_access(monkeypatch):
+    validated = []
+    original = AuditLogItem.model_validate
+    monkeypatch.setattr(AuditLogItem, "model_validate", lambda data: validated.append(data["id"]) or original(data))
+    items = LazyModelList(AuditLogItem, ROWS)
+
+    first = items[2]
+
+    assert isinstance(first, AuditLogItem)
+    assert first.id == 3
+    assert items[2] is first
+    assert validated == [3]
+
+
+def test_slices_and_iteration_yield_models():
+    items = LazyModelList(AuditLogItem, ROWS)
+
+    assert [item.id for item in items[1:3]] == [2, 3]
+    assert [item.id for item in items] == [1, 2, 3, 4, 5]
+    assert len(items) == 5
+    assert items.raw is ROWS
+
+
+def test_invalid_items_only_fail_when_accessed():
+    items = LazyModelList(AuditLogItem, [ROWS[0], {"id": "not a number"}])
+
+    assert items[0].id == 1
+    with pytest.raises(ValidationError):
+        items[1]
+
+
+def test_lazy_list_keeps_the_response_shape():
+    client = make_client(lambda request: listing(ROWS, request))
+
+    response = client.audit_log.list(mode="lazy", count=2)
+
+    assert isinstance(response.data, LazyModelList)
+    assert response.total == 5
+    assert [item.id for item in response.data] == [1, 2, 3, 4, 5]
+    assert response.data[0].user.name == "Admin"
+
+
+def test_async_lazy_list():
+    async def main():
+        async with make_async_client(lambda request: listing(ROWS, request)) as client:
+            return await client.audit_log.list(mode="lazy")
+
+    response = asyncio.run(main())
+
+    assert isinstance(response.data, LazyModelList)
+    assert [item.id for item in response.data] == [1, 2, 3, 4, 5]
+
+
+def test_unknown_modes_are_rejected():
+    client = make_client(lambda request: listing(ROWS, request))
+
+    with pytest.raises(ValueError, match="mode"):
+        client.audit_log.list(mode="eager")
@@ -0,0 +1,117 @@
+import threading
+
+import httpx
+import pytest
+
+from bookstack_client import MultiInstanceClient
+from bookstack_client.exceptions import BookStackNotFoundError, BookStackTimeoutError
+
+from .fakes import BASE_URL, audit_log_entry, error, listing, make_client
+
+
+def instance(rows, release: threading.Event | None = None):
+    def handler(request):
+        if release is not None:
+            release.wait(5)
+        return listing(rows, request)
+    return make_client(handler)
+
+
+@pytest.fixture
+def release():
+    # Unblocks the slow instance once the test is done
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+@pytest.fixture
+def multi():
+    clients = {
+        "sales": instance([audit_log_entry(i) for i in range(1, 4)]),
+        "ops": instance([audit_log_entry(i) for i in range(1, 6)]),
+        "broken": make_client(lambda request: error(404, "Not found")),
+    }
+    with MultiInstanceClient(clients, concurrency=2) as multi:
+        yield multi
+
+
+def test_run_tags_values_and_errors_with_their_instance(multi):
+    results = {result.instance: result for result in multi.run("audit_log.list", count=2)}
+
+    assert results["sales"].value.total == 3
+    assert results["ops"].value.total == 5
+    assert isinstance(results["broken"].error, BookStackNotFoundError)
+    assert results["sales"].elapsed >= 0
+
+
+def test_gather_keeps_the_instance_order(multi):
+    results = multi.gather(lambda client, count: len(client.audit_log.list(count=count).data), 2,
+                           instances=["ops", "sales"])
+
+    assert list(results) == ["ops", "sales"]
+    assert [result.value for result in results.values()] == [5, 3]
+
+
+def test_unknown_instances_are_rejected(multi):
+    with pytest.raises(KeyError, match="nope"):
+        multi.gather("audit_log.list", instances=["sales", "nope"])
+
+
+def test_unexpected_errors_are_raised(multi):
+    def fail(client):
+        raise RuntimeError("bug")
+
+    with pytest.raises(RuntimeError):
+        multi.gather(fail)
+
+
+def test_slow_instances_time_out(release):
+    clients = {"fast": instance([audit_log_entry(1)]), "slow": instance([audit_log_entry(1)], release)}
+
+    with MultiInstanceClient(clients, timeout=0.2) as multi:
+        results = multi.gather("audit_log.list")
+
+    assert results["fast"].ok
+    assert isinstance(results["slow"].error, BookStackTimeoutError)
+
+
+def test_iter_items_merges_the_streams_of_all_instances(multi):
+    results = list(multi.iter_items("audit_log.iter", validate=False, count=2))
+
+    items = {}
+    for result in results:
+        items.setdefault(result.instance, []).append(result)
+    assert [result.value["id"] for result in items["sales"]] == [1, 2, 3]
+    assert [result.value["id"] for result in items["ops"]] == [1, 2, 3, 4, 5]
+    assert len(items["broken"]) == 1
+    assert isinstance(items["broken"][0].error, BookStackNotFoundError)
+
+
+def test_iter_items_times_out_stalled_instances(release):
+    clients = {"fast": instance([audit_log_entry(1)]), "slow": instance([audit_log_entry(1)], release)}
+
+    with MultiInstanceClient(clients) as multi:
+        results = list(multi.iter_items("audit_log.iter", timeout=0.2))
+
+    assert [(result.instance, result.ok) for result in results] == [("fast", True), ("slow", False)]
+    assert isinstance(results[1].error, BookStackTimeoutError)
+
+
+def test_from_config_creates_and_closes_the_clients():
+    transport = httpx.MockTransport(lambda request: listing([audit_log_entry(1)], request))
+
+    with MultiInstanceClient.from_config(
+        {"a": {"base_url": BASE_URL, "token_id": "a", "token_secret": "1"},
+         "b": {"base_url": BASE_URL, "token_id": "b", "token_secret": "2"}},
+        transport=transport,
+    ) as multi:
+        results = multi.gather("audit_log.list")
+
+    assert all(result.ok for result in results.values())
+    assert all(client._client.is_closed for client in multi.clients.values())
+
+
+def test_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        MultiInstanceClient({}, concurrency=0)
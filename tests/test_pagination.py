@@ -0,0 +1,246 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from .fakes import audit_log_entry, listing, make_async_client, make_client
+
+ROWS = [audit_log_entry(i) for i in range(1, 21)]
+
+
+class InFlight:
+    """Handler serving `ROWS` slowly while tracking how many requests overlap."""
+
+    def __init__(self, delay: float = 0.02) -> None:
+        self.delay = delay
+        self.current = 0
+        self.peak = 0
+        self.offsets: list[int] = []
+        self._lock = threading.Lock()
+
+    def _enter(self, request) -> None:
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+            self.offsets.append(int(request.url.params["offset"]))
+
+    def _leave(self) -> None:
+        with self._lock:
+            self.current -= 1
+
+    def __call__(self, request):
+        self._enter(request)
+        try:
+            time.sleep(self.delay)
+            return listing(ROWS, request)
+        finally:
+            self._leave()
+
+    async def handle_async(self, request):
+        self._enter(request)
+        try:
+            await asyncio.sleep(self.delay)
+            return listing(ROWS, request)
+        finally:
+            self._leave()
+
+
+def test_remaining_pages_are_fetched_concurrently_in_order():
+    server = InFlight()
+    client = make_client(server, pagination_concurrency=4)
+
+    items = client.audit_log.list(count=2).data
+
+    assert [item.id for item in items] == list(range(1, 21))
+    assert 1 < server.peak <= 4
+    assert sorted(server.offsets) == list(range(0, 20, 2))
+
+
+def test_max_concurrency_overrides_the_client_default():
+    server = InFlight()
+    client = make_client(server, pagination_concurrency=4)
+
+    items = client.audit_log.list(count=5, max_concurrency=1).data
+
+    assert len(items) == 20
+    assert server.peak == 1
+
+
+def test_concurrent_fetch_respects_max_items():
+    server = InFlight(delay=0)
+    client = make_client(server, pagination_concurrency=3)
+
+    items = client.audit_log.list(count=3, max_items=7).data
+
+    assert [item.id for item in items] == list(range(1, 8))
+    assert max(server.offsets) == 6
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_invalid_max_concurrency_is_rejected(max_concurrency):
+    client = make_client(InFlight(delay=0))
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        client.audit_log.list(max_concurrency=max_concurrency)
+
+
+def test_invalid_client_concurrency_is_rejected():
+    with pytest.raises(ValueError, match="pagination_concurrency"):
+        make_client(InFlight(delay=0), pagination_concurrency=0)
+
+
+def test_async_remaining_pages_are_fetched_concurrently():
+    server = InFlight()
+
+    async def main():
+        async with make_async_client(server.handle_async, pagination_concurrency=5) as client:
+            return (await client.audit_log.list(count=2)).data
+
+    items = asyncio.run(main())
+
+    assert [item.id for item in items] == list(range(1, 21))
+    assert 1 < server.peak <= 5
+
+
+def test_iter_fetches_pages_on_demand():
+    server = InFlight(delay=0)
+    client = make_client(server)
+
+    items = client.audit_log.iter(count=5)
+    assert server.offsets == []
+
+    first = [next(items) for _ in range(6)]
+
+    assert [item.id for item in first] == [1, 2, 3, 4, 5, 6]
+    assert server.offsets == [0, 5]
+
+
+def test_iter_pages_yields_raw_pages_without_validation():
+    client = make_client(InFlight(delay=0))
+
+    pages = list(client.audit_log.iter_pages(validate=False, count=8))
+
+    assert [len(page) for page in pages] == [8, 8, 4]
+    assert pages[0][0] == ROWS[0]
+
+
+def test_iter_keeps_query_params_next_to_the_window():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return listing(ROWS, request)
+
+    client = make_client(handler)
+
+    ids = [item.id for item in client.audit_log.iter(count=4, params={"filter[id:gt]": 12})]
+
+    assert ids == list(range(13, 21))
+    assert all(request.url.params["filter[id:gt]"] == "12" for request in requests)
+    assert [request.url.params["offset"] for request in requests] == ["0", "4"]
+
+
+def test_iter_stops_at_max_items():
+    server = InFlight(delay=0)
+    client = make_client(server)
+
+    ids = [item.id for item in client.audit_log.iter(count=4, max_items=6)]
+
+    assert ids == [1, 2, 3, 4, 5, 6]
+    assert server.offsets == [0, 4]
+
+
+def test_prefetch_reads_ahead_while_the_page_is_consumed():
+    ahead = threading.Event()
+
+    def handler(request):
+        if request.url.params["offset"] == "2":
+            ahead.set()
+        return listing(ROWS, request)
+
+    client = make_client(handler)
+    pages = client.audit_log.iter_pages(count=2, prefetch=1)
+
+    first = next(pages)
+
+    assert [item.id for item in first] == [1, 2]
+    assert ahead.wait(1)
+    pages.close()
+
+
+def test_prefetch_keeps_order_when_later_pages_answer_first():
+    def handler(request):
+        # Later pages answer faster than earlier ones
+        time.sleep(0.03 - int(request.url.params["offset"]) / 1000)
+        return listing(ROWS, request)
+
+    client = make_client(handler)
+
+    ids = [item.id for item in client.audit_log.iter(count=2, prefetch=4)]
+
+    assert ids == list(range(1, 21))
+
+
+def test_stopping_early_cancels_pending_prefetches():
+    server = InFlight(delay=0.02)
+    client = make_client(server)
+
+    pages = client.audit_log.iter_pages(count=2, prefetch=2)
+    next(pages)
+    pages.close()
+    time.sleep(0.1)
+
+    # The first page plus at most the read-ahead window
+    assert max(server.offsets) <= 4
+    assert len(server.offsets) <= 3
+
+
+def test_async_prefetch_keeps_order_and_stops_early():
+    server = InFlight(delay=0.01)
+
+    async def main():
+        async with make_async_client(server.handle_async) as client:
+            ids = [item.id async for item in client.audit_log.iter(count=3, prefetch=3)]
+            pages = client.audit_log.iter_pages(count=2, prefetch=4)
+            first = await pages.__anext__()
+            await pages.aclose()
+            # No prefetch is left running once the iteration is closed
+            others = asyncio.all_tasks() - {asyncio.current_task()}
+            assert all(task.done() for task in others)
+            assert server.current == 0
+            requested = len(server.offsets)
+            await asyncio.sleep(0.05)
+            return ids, first, requested
+
+    ids, first, requested = asyncio.run(main())
+
+    assert ids == list(range(1, 21))
+    assert [item.id for item in first] == [1, 2]
+    assert len(server.offsets) == requested
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_list_columnar_reads_ahead_by_default_in_both_clients(use_async):
+    calls = []
+
+    def spy(client):
+        original = client._iter_paginated_content
+
+        def iter_paginated_content(*args, **kwargs):
+            calls.append(kwargs.get("prefetch"))
+            return original(*args, **kwargs)
+
+        client._iter_paginated_content = iter_paginated_content
+        return client
+
+    if use_async:
+        async def main():
+            async with spy(make_async_client(lambda request: listing(ROWS, request))) as client:
+                return await client.audit_log.list_columnar(count=5)
+        result = asyncio.run(main())
+    else:
+        result = spy(make_client(lambda request: listing(ROWS, request))).audit_log.list_columnar(count=5)
+
+    assert len(result) == 20
+    assert calls == [1]
@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+
+from bookstack_client import RateLimiter
+from bookstack_client.exceptions import BookStackRateLimitError
+
+from .fakes import audit_log_entry, error, listing, make_client
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A frozen `time.monotonic` for the rate limiter, advanced by hand."""
+    now = [1000.0]
+    monkeypatch.setattr("bookstack_client.ratelimit.time.monotonic", lambda: now[0])
+    return now
+
+
+def test_requests_are_spaced_at_the_configured_rate(clock):
+    limiter = RateLimiter(requests=10, period=1.0)
+
+    delays = [limiter.reserve() for _ in range(4)]
+
+    assert delays == pytest.approx([0.0, 0.1, 0.2, 0.3])
+
+
+def test_burst_allows_back_to_back_requests(clock):
+    limiter = RateLimiter(requests=60, period=60.0, burst=3)
+
+    delays = [limiter.reserve() for _ in range(4)]
+
+    assert delays == pytest.approx([0.0, 0.0, 0.0, 1.0])
+
+
+def test_tokens_refill_over_time_up_to_the_burst(clock):
+    limiter = RateLimiter(requests=1, period=1.0, burst=2)
+    limiter.reserve()
+    limiter.reserve()
+
+    clock[0] += 10
+
+    assert [limiter.reserve() for _ in range(3)] == pytest.approx([0.0, 0.0, 1.0])
+
+
+def test_penalize_pauses_the_bucket(clock):
+    limiter = RateLimiter(requests=100, period=1.0, burst=5)
+
+    limiter.penalize(retry_after=3)
+
+    assert limiter.reserve() == pytest.approx(3.01)
+
+
+def test_concurrent_reservations_queue_in_order():
+    limiter = RateLimiter(requests=1000, period=1.0)
+    delays = []
+    lock = threading.Lock()
+
+    def reserve():
+        for _ in range(50):
+            delay = limiter.reserve()
+            with lock:
+                delays.append(delay)
+
+    threads = [threading.Thread(target=reserve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every token is handed out once: the n-th reservation waits about n intervals
+    ordered = sorted(delays)
+    assert len(ordered) == 400
+    assert ordered[-1] == pytest.approx(399 / 1000, abs=0.05)
+
+
+@pytest.mark.parametrize("kwargs", [{"requests": 0}, {"period": 0}, {"burst": 0}])
+def test_invalid_settings_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        RateLimiter(**kwargs)
+
+
+def test_client_waits_on_the_limiter_for_every_request(monkeypatch):
+    reserved = []
+    limiter = RateLimiter()
+    monkeypatch.setattr(limiter, "acquire", lambda: reserved.append(True))
+    rows = [audit_log_entry(i) for i in range(1, 6)]
+    client = make_client(lambda request: listing(rows, request), rate_limiter=limiter)
+
+    client.audit_log.list(count=2)
+
+    assert len(reserved) == 3
+
+
+def test_rate_limited_responses_penalize_the_limiter(monkeypatch):
+    penalties = []
+    limiter = RateLimiter()
+    monkeypatch.setattr(limiter, "penalize", penalties.append)
+    client = make_client(lambda request: error(429, **{"Retry-After": "5"}), rate_limiter=limiter)
+
+    with pytest.raises(BookStackRateLimitError):
+        client.audit_log.list()
+
+    assert penalties == [5]
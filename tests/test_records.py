@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel, create_model
+
+from bookstack_client.models import (
+    AuditLogItem,
+    BookListItem,
+    ChapterListItem,
+    PageListItem,
+    RecordPage,
+    ShelfListItem,
+    record_from_data,
+    record_type,
+    to_record,
+)
+
+from .fakes import (
+    audit_log_entry, book_item, chapter_item, listing, make_async_client, make_client, page_item, shelf_item,
+)
+
+ROWS = [audit_log_entry(i) for i in range(1, 6)]
+
+
+@pytest.fixture
+def no_validation(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("compact mode must not build models")
+
+    for model in (AuditLogItem, AuditLogItem.model_fields["user"].annotation):
+        monkeypatch.setattr(model, "model_validate", fail)
+        monkeypatch.setattr(model, "model_validate_json", fail)
+
+
+def test_compact_list_holds_records_without_building_models(no_validation):
+    client = make_client(lambda request: listing(ROWS, request))
+
+    response = client.audit_log.list(mode="compact", count=2)
+
+    assert isinstance(response, RecordPage)
+    assert not isinstance(response, BaseModel)
+    assert response.total == 5
+    assert [record.id for record in response.data] == [1, 2, 3, 4, 5]
+    assert response.data[0].user.name == "Admin"
+    # Values keep their JSON types
+    assert response.data[0].created_at == ROWS[0]["created_at"]
+    assert repr(response) == "RecordPage(5 records, total=5)"
+
+
+def test_async_compact_list(no_validation):
+    async def main():
+        async with make_async_client(lambda request: listing(ROWS, request)) as client:
+            return await client.audit_log.list(mode="compact")
+
+    response = asyncio.run(main())
+
+    assert [record.id for record in response.data] == [1, 2, 3, 4, 5]
+
+
+def test_records_from_data_fill_in_defaults():
+    data = audit_log_entry(1)
+    del data["loggable_id"]
+
+    record = record_from_data(AuditLogItem, data)
+
+    assert record.loggable_id is None
+    assert record.user == record_type(AuditLogItem.model_fields["user"].annotation)(**ROWS[0]["user"])
+
+
+def test_records_from_data_match_records_of_models_field_by_field():
+    model = AuditLogItem.model_validate(ROWS[0])
+
+    assert record_from_data(AuditLogItem, ROWS[0])._fields == to_record(model)._fields
+    assert to_record(model).created_at == model.created_at
+
+
+def test_invalid_field_names_are_renamed():
+    model = create_model("Keyword", **{"id": (int, ...), "class": (str, "x")})
+
+    record = record_from_data(model, {"id": 1})
+
+    assert record == (1, "x")
+    assert record._fields == ("id", "_1")
+
+
+@pytest.mark.parametrize(("resource", "path", "row", "model"), [
+    ("audit_log", "/api/audit-log", audit_log_entry(1), AuditLogItem),
+    ("books", "/api/books", book_item(1), BookListItem),
+    ("chapters", "/api/chapters", chapter_item(1, 1), ChapterListItem),
+    ("pages", "/api/pages", page_item(1), PageListItem),
+    ("shelves", "/api/shelves", shelf_item(1), ShelfListItem),
+])
+def test_listing_resources_share_list_and_iter(resource, path, row, model):
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        return listing([row], request)
+
+    listing_resource = getattr(make_client(handler), resource)
+
+    assert isinstance(listing_resource.list().data[0], model)
+    assert isinstance(list(listing_resource.iter())[0], model)
+    assert list(listing_resource.iter(validate=False)) == [row]
+    assert listing_resource.list(mode="compact").data[0].id == 1
+    assert set(paths) == {path}
@@ -0,0 +1,127 @@
+import pytest
+
+from bookstack_client import LocalReplica
+from bookstack_client.models import PageDetail
+
+from .fakes import Wiki, make_client, timestamp
+
+
+@pytest.fixture
+def wiki():
+    wiki = Wiki()
+    wiki.add_shelf(50, [1])
+    wiki.add_book(1)
+    wiki.add_book(2)
+    wiki.add_chapter(10, 1)
+    wiki.add_page(100, 1, 10, "<p>one</p>")
+    wiki.add_page(101, 1, 0, "<p>two</p>")
+    wiki.add_page(200, 2, 0, "<p>three</p>")
+    return wiki
+
+
+@pytest.fixture
+def replica():
+    replica = LocalReplica()
+    yield replica
+    replica.close()
+
+
+def detail_reads(wiki):
+    return sorted(
+        request.url.path.removeprefix("/api/") for request in wiki.requests
+        if request.url.path.count("/") == 3 and not request.url.path.startswith("/api/recycle-bin")
+    )
+
+
+def recycle_bin_queries(wiki):
+    return [dict(request.url.params) for request in wiki.requests if request.url.path == "/api/recycle-bin"]
+
+
+def test_first_sync_stores_every_entity(wiki, replica):
+    report = replica.sync(make_client(wiki))
+
+    page = replica.get("page", 100)
+    assert isinstance(page, PageDetail)
+    assert page.html == "<p>one</p>"
+    assert report.updated == {"bookshelf": 1, "book": 2, "chapter": 1, "page": 3}
+    assert report.deletions_checked
+    assert len(replica) == 7
+
+
+def test_later_syncs_only_read_updated_entities(wiki, replica):
+    client = make_client(wiki)
+    replica.sync(client)
+    wiki.requests.clear()
+    wiki.pages[101].update(updated_at=timestamp(2, 30), html="<p>changed</p>")
+
+    report = replica.sync(client)
+
+    # Entities at the stored boundary are listed again but not read
+    assert detail_reads(wiki) == ["pages/101"]
+    assert report.updated["page"] == 1
+    assert replica.get("page", 101).html == "<p>changed</p>"
+
+
+def test_recycle_bin_entries_remove_entities_and_their_contents(wiki, replica):
+    client = make_client(wiki)
+    replica.sync(client)
+    wiki.trash("books", 1, timestamp(3))
+
+    report = replica.sync(client)
+
+    assert report.deleted == 4
+    assert replica.get("page", 100) is None
+    assert replica.count("page") == 1
+
+
+def test_deletions_cursor_follows_the_server_clock(wiki, replica):
+    client = make_client(wiki)
+    replica.sync(client)
+    wiki.trash("pages", 100, timestamp(3, 5))
+    wiki.trash("pages", 101, timestamp(4, 7))
+    replica.sync(client)
+    wiki.requests.clear()
+
+    replica.sync(client)
+
+    assert recycle_bin_queries(wiki)[0]["filter[created_at:gte]"] == "2024-01-04 00:00:07"
+
+
+def test_full_sync_prunes_and_moves_the_deletions_cursor(wiki, replica):
+    client = make_client(wiki)
+    replica.sync(client)
+    wiki.trash("pages", 200, timestamp(5))
+    wiki.pages.pop(101)
+
+    report = replica.sync(client, full=True)
+    wiki.requests.clear()
+    replica.sync(client)
+
+    assert report.deleted == 2
+    assert replica.get("page", 101) is None
+    assert recycle_bin_queries(wiki)[0]["filter[created_at:gte]"] == "2024-01-05 00:00:00"
+
+
+def test_without_recycle_bin_access_deletions_are_skipped(wiki, replica):
+    wiki.recycle_bin_forbidden = True
+    client = make_client(wiki)
+    replica.sync(client)
+    wiki.trash("pages", 100, timestamp(3))
+
+    report = replica.sync(client)
+
+    assert not report.deletions_checked
+    assert replica.get("page", 100) is not None
+    assert replica.sync(client, full=True).deletions_checked
+
+
+def test_entities_deleted_while_syncing_are_removed(wiki, replica):
+    client = make_client(wiki)
+    replica.sync(client)
+    wiki.pages[100]["updated_at"] = timestamp(3)
+    wiki.vanish("pages", 100)
+
+    report = replica.sync(client)
+
+    assert report.deleted == 1
+    assert replica.get("page", 100) is None
@@ -0,0 +1,165 @@
+import asyncio
+
+import httpx
+import pytest
+
+from bookstack_client import RetryPolicy
+from bookstack_client.exceptions import (
+    BookStackConnectionError,
+    BookStackNotFoundError,
+    BookStackRateLimitError,
+    BookStackServerError,
+)
+
+from .fakes import USER, error, make_async_client, make_client, page_item
+
+PAGE = {**page_item(1), "created_by": USER, "updated_by": USER, "owned_by": USER}
+
+
+class Flaky:
+    """Handler answering with the queued failures first, then with a page."""
+
+    def __init__(self, *failures: httpx.Response | type[Exception]) -> None:
+        self.failures = list(failures)
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if self.failures:
+            failure = self.failures.pop(0)
+            if isinstance(failure, type):
+                raise failure("failed", request=request)
+            return failure
+        return httpx.Response(200, json=PAGE)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr("bookstack_client.client.time.sleep", slept.append)
+    return slept
+
+
+def test_requests_are_not_retried_without_a_policy(sleeps):
+    server = Flaky(error(503))
+    client = make_client(server)
+
+    with pytest.raises(BookStackServerError):
+        client.pages.read(1)
+
+    assert len(server.requests) == 1
+    assert sleeps == []
+
+
+def test_transient_failures_are_retried_with_backoff(sleeps):
+    server = Flaky(error(503), httpx.ConnectError, error(502))
+    client = make_client(server, retry_policy=RetryPolicy(backoff_factor=1.0, jitter=False))
+
+    page = client.pages.read(1)
+
+    assert page.id == 1
+    assert len(server.requests) == 4
+    assert sleeps == [1.0, 2.0, 4.0]
+
+
+def test_retries_stop_after_max_retries(sleeps):
+    server = Flaky(*[error(500)] * 5)
+    client = make_client(server, retry_policy=RetryPolicy(max_retries=2, jitter=False))
+
+    with pytest.raises(BookStackServerError):
+        client.pages.read(1)
+
+    assert len(server.requests) == 3
+
+
+def test_retries_stop_before_exceeding_max_total_wait(sleeps):
+    server = Flaky(*[error(503)] * 5)
+    policy = RetryPolicy(max_retries=10, backoff_factor=1.0, max_total_wait=3.5, jitter=False)
+    client = make_client(server, retry_policy=policy)
+
+    with pytest.raises(BookStackServerError):
+        client.pages.read(1)
+
+    # 1 + 2 seconds fit, another 4 would exceed the budget
+    assert sleeps == [1.0, 2.0]
+
+
+def test_client_errors_are_not_retried(sleeps):
+    server = Flaky(error(404))
+    client = make_client(server, retry_policy=RetryPolicy())
+
+    with pytest.raises(BookStackNotFoundError):
+        client.pages.read(1)
+
+    assert len(server.requests) == 1
+
+
+def test_retry_after_is_a_lower_bound_for_the_delay(sleeps):
+    server = Flaky(error(429, "Too many requests", **{"Retry-After": "7"}))
+    client = make_client(server, retry_policy=RetryPolicy(backoff_factor=0.1))
+
+    client.pages.read(1)
+
+    assert sleeps == [7.0]
+
+
+def test_rate_limited_posts_are_retried_but_failed_posts_are_not(sleeps):
+    created = httpx.Response(200, json=PAGE)
+    policy = RetryPolicy(backoff_factor=0, jitter=False)
+
+    limited = Flaky(error(429), created)
+    make_client(limited, retry_policy=policy).pages.create({"book_id": 1, "name": "New", "html": "<p></p>"})
+    assert len(limited.requests) == 2
+
+    failed = Flaky(error(503), created)
+    with pytest.raises(BookStackServerError):
+        make_client(failed, retry_policy=policy).pages.create({"book_id": 1, "name": "New", "html": "<p></p>"})
+    assert len(failed.requests) == 1
+
+
+def test_connection_errors_of_posts_are_not_retried(sleeps):
+    server = Flaky(httpx.ConnectError)
+    client = make_client(server, retry_policy=RetryPolicy(backoff_factor=0))
+
+    with pytest.raises(BookStackConnectionError):
+        client.pages.create({"book_id": 1, "name": "New", "html": "<p></p>"})
+
+    assert len(server.requests) == 1
+
+
+def test_jittered_delays_stay_within_the_backoff():
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0)
+    failure = BookStackServerError()
+
+    delays = [policy.get_delay(attempt, failure) for attempt in range(6) for _ in range(20)]
+
+    assert all(0 <= delay <= 5.0 for delay in delays)
+
+
+def test_async_client_retries_rate_limited_requests(monkeypatch):
+    slept = []
+
+    async def sleep(delay):
+        slept.append(delay)
+
+    monkeypatch.setattr("bookstack_client.client.asyncio.sleep", sleep)
+    server = Flaky(error(429, **{"Retry-After": "2"}), error(503))
+
+    async def main():
+        async with make_async_client(server, retry_policy=RetryPolicy(backoff_factor=0)) as client:
+            return await client.pages.read(1)
+
+    assert asyncio.run(main()).id == 1
+    assert slept == [2.0, 0.0]
+
+
+def test_async_client_does_not_retry_without_a_policy():
+    server = Flaky(error(429))
+
+    async def main():
+        async with make_async_client(server) as client:
+            await client.pages.read(1)
+
+    with pytest.raises(BookStackRateLimitError):
+        asyncio.run(main())
+    assert len(server.requests) == 1
@@ -0,0 +1,92 @@
+import pytest
+
+from bookstack_client import LocalSearchIndex
+from bookstack_client.search_index import html_to_text
+
+from .fakes import Wiki, make_client, timestamp
+
+
+@pytest.fixture
+def wiki():
+    wiki = Wiki()
+    wiki.add_book(1, name="Operations", description="Runbooks for the platform team")
+    wiki.add_chapter(10, 1, name="Setup")
+    wiki.add_page(100, 1, 10, "<p>Run the <b>deploy</b> script &amp; verify</p>", name="Deployment checklist")
+    wiki.add_page(101, 1, 0, "<p>Grind the beans</p>", name="Coffee", updated_at=timestamp(2))
+    return wiki
+
+
+@pytest.fixture
+def index():
+    index = LocalSearchIndex()
+    yield index
+    index.close()
+
+
+def test_html_is_reduced_to_text():
+    assert html_to_text("<p>Fish &amp; <b>chips</b></p>\n<p>x</p>") == "Fish & chips x"
+
+
+def test_refresh_indexes_books_chapters_and_pages(wiki, index):
+    indexed = index.refresh(make_client(wiki))
+
+    results = index.search("deploy")
+
+    assert indexed == len(index) == 4
+    assert [(result.type, result.id) for result in results] == [("page", 100)]
+    assert results[0].book.name == "Operations"
+    assert results[0].chapter.name == "Setup"
+    assert "<strong>deploy</strong>" in results[0].preview_html.content
+
+
+def test_matches_in_the_name_rank_first(wiki, index):
+    wiki.add_page(102, 1, 0, "<p>Notes about the deployment checklist</p>", name="Misc")
+    index.refresh(make_client(wiki))
+
+    results = index.search("deployment checklist", types=["page"])
+
+    assert [result.id for result in results] == [100, 102]
+
+
+def test_later_refreshes_only_fetch_updated_entities(wiki, index):
+    client = make_client(wiki)
+    index.refresh(client)
+    wiki.requests.clear()
+    wiki.pages[101].update(updated_at=timestamp(3), html="<p>Brew tea instead</p>")
+
+    index.refresh(client)
+
+    page_reads = [request.url.path for request in wiki.requests if request.url.path.startswith("/api/pages/")]
+    assert page_reads == ["/api/pages/101"]
+    assert [result.id for result in index.search("tea")] == [101]
+    assert index.search("beans") == []
+
+
+def test_pages_deleted_during_a_refresh_are_skipped(wiki, index):
+    for id in range(102, 110):
+        wiki.add_page(id, 1, 0, f"<p>filler {id}</p>")
+    wiki.vanish("pages", 105)
+
+    indexed = index.refresh(make_client(wiki), count=3, max_workers=2)
+
+    assert indexed == 2 + 9
+    assert sorted(result.id for result in index.search("filler")) == [102, 103, 104, 106, 107, 108, 109]
+
+
+def test_a_page_vanishing_later_is_dropped_from_the_index(wiki, index):
+    client = make_client(wiki)
+    index.refresh(client)
+    wiki.pages[100]["updated_at"] = timestamp(3)
+    wiki.vanish("pages", 100)
+
+    index.refresh(client)
+
+    assert index.search("deploy") == []
+
+
+def test_queries_are_matched_literally_unless_raw(wiki, index):
+    index.refresh(make_client(wiki))
+
+    assert index.search('deploy"') != []
+    assert index.search("") == []
+    assert sorted(result.id for result in index.search("deploy OR beans", raw=True)) == [100, 101]
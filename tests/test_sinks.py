@@ -0,0 +1,78 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from bookstack_client.models import AuditLogItem
+from bookstack_client.sinks import CSVSink, NDJSONSink, ParquetSink, RecordSink, model_columns, write_pages
+
+from .fakes import audit_log_entry, listing, make_client
+
+ROWS = [audit_log_entry(i) for i in range(1, 8)]
+
+
+def test_model_columns_flatten_nested_models():
+    columns = {column.name: column for column in model_columns(AuditLogItem)}
+
+    assert columns["id"].type is int
+    assert columns["created_at"].type is datetime
+    assert columns["user_name"].path == ("user", "name")
+    # Taken by the top-level field already
+    assert columns["user_id"].path == ("user_id",)
+
+
+def test_ndjson_sink_writes_one_object_per_line():
+    buffer = io.BytesIO()
+
+    with NDJSONSink(buffer, model_columns(AuditLogItem)) as sink:
+        written = write_pages([ROWS[:3], ROWS[3:]], sink)
+
+    lines = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert written == sink.rows_written == 7
+    assert [line["id"] for line in lines] == list(range(1, 8))
+    assert lines[0]["user_name"] == "Admin"
+    assert not buffer.closed
+
+
+def test_csv_sink_writes_a_header_row(tmp_path):
+    path = tmp_path / "audit.csv"
+
+    with CSVSink(path, model_columns(AuditLogItem)) as sink:
+        sink.write_items(ROWS[:2])
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["id"] for row in rows] == ["1", "2"]
+    assert rows[1]["detail"] == "entry 2"
+
+
+def test_parquet_sink_writes_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "audit.parquet"
+
+    with ParquetSink(path, model_columns(AuditLogItem), row_group_size=3) as sink:
+        write_pages([ROWS[:4], ROWS[4:]], sink)
+
+    parquet = pq.ParquetFile(path)
+    table = parquet.read()
+    assert parquet.num_row_groups == 2
+    assert table.column("id").to_pylist() == list(range(1, 8))
+    assert str(table.schema.field("created_at").type) == "timestamp[us, tz=UTC]"
+
+
+def test_audit_log_export_streams_raw_pages():
+    buffer = io.BytesIO()
+    client = make_client(lambda request: listing(ROWS, request))
+
+    with NDJSONSink(buffer, client.audit_log.columns) as sink:
+        written = client.audit_log.export(sink, count=3)
+
+    assert written == 7
+    assert len(buffer.getvalue().splitlines()) == 7
+
+
+def test_record_sink_is_abstract():
+    with pytest.raises(TypeError):
+        RecordSink(model_columns(AuditLogItem))
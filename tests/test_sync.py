@@ -0,0 +1,120 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from bookstack_client import AuditLogSync, JSONFileStore, SQLiteStore
+from bookstack_client.stores import StateStore
+
+from .fakes import audit_log_entry, listing, make_client, timestamp
+
+
+class AuditLog:
+    """Handler serving a growing audit log and recording the query of every request."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def __call__(self, request):
+        self.queries.append(dict(request.url.params))
+        return listing(self.rows, request)
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "json":
+        return JSONFileStore(tmp_path / "state.json")
+    store = SQLiteStore(tmp_path / "state.db")
+    request.addfinalizer(store.close)
+    return store
+
+
+def test_stores_persist_values(store):
+    store.set("cursor", {"id": 5})
+    store.set("other", [1, 2])
+    store.set("cursor", {"id": 7})
+    store.delete("other")
+    store.delete("missing")
+
+    assert store.get("cursor") == {"id": 7}
+    assert store.get("other") is None
+
+
+def test_json_file_store_survives_reopening(tmp_path):
+    JSONFileStore(tmp_path / "nested" / "state.json").set("cursor", {"id": 1})
+
+    assert JSONFileStore(tmp_path / "nested" / "state.json").get("cursor") == {"id": 1}
+    assert [path.name for path in (tmp_path / "nested").iterdir()] == ["state.json"]
+
+
+def test_sqlite_store_rejects_invalid_table_names(tmp_path):
+    with pytest.raises(ValueError):
+        SQLiteStore(tmp_path / "state.db", table="state; DROP TABLE x")
+
+
+def test_state_store_is_abstract():
+    with pytest.raises(TypeError):
+        StateStore()
+
+
+def test_runs_only_fetch_entries_after_the_cursor(store):
+    server = AuditLog([audit_log_entry(i) for i in range(1, 6)])
+    sync = AuditLogSync(make_client(server), store)
+
+    first = [entry.id for entry in sync.run(count=2)]
+    server.rows.extend(audit_log_entry(i) for i in range(6, 9))
+    second = [entry.id for entry in sync.run(count=2)]
+
+    assert first == [1, 2, 3, 4, 5]
+    assert second == [6, 7, 8]
+    assert sync.cursor == {"id": 8}
+    assert server.queries[-1]["filter[id:gt]"] == "5"
+    assert server.queries[-1]["sort"] == "+id"
+
+
+def test_cursor_advances_with_raw_entries(store):
+    server = AuditLog([audit_log_entry(i) for i in range(1, 4)])
+    sync = AuditLogSync(make_client(server), store)
+
+    entries = sync.run(validate=False)
+
+    assert entries == server.rows
+    assert sync.cursor == {"id": 3}
+
+
+def test_a_partly_consumed_page_is_delivered_again(store):
+    server = AuditLog([audit_log_entry(i) for i in range(1, 6)])
+    sync = AuditLogSync(make_client(server), store)
+
+    entries = sync.iter_new(count=2)
+    consumed = [next(entries).id for _ in range(3)]
+    entries.close()
+
+    assert consumed == [1, 2, 3]
+    assert sync.cursor == {"id": 2}
+    assert [entry.id for entry in sync.run(count=2)] == [3, 4, 5]
+
+
+def test_since_only_applies_without_a_cursor(store):
+    server = AuditLog([
+        audit_log_entry(1, created_at=timestamp(1)),
+        audit_log_entry(2, created_at=timestamp(3)),
+    ])
+    sync = AuditLogSync(make_client(server), store, since=datetime(2024, 1, 2, tzinfo=timezone.utc))
+
+    assert [entry.id for entry in sync.run()] == [2]
+    assert "filter[created_at:gte]" in server.queries[0]
+
+    sync.run()
+    assert "filter[created_at:gte]" not in server.queries[-1]
+
+
+def test_reset_starts_over(store):
+    server = AuditLog([audit_log_entry(i) for i in range(1, 3)])
+    sync = AuditLogSync(make_client(server), store)
+    sync.run()
+
+    sync.reset()
+
+    assert sync.cursor is None
+    assert [entry.id for entry in sync.run()] == [1, 2]
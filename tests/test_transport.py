@@ -0,0 +1,75 @@
+import asyncio
+
+import httpx
+import pytest
+
+from bookstack_client import AsyncBookStackClient, AsyncSharedTransport, BookStackClient, SharedTransport
+
+from .fakes import BASE_URL, audit_log_entry, listing
+
+ROWS = [audit_log_entry(1)]
+
+
+class Pool(httpx.MockTransport):
+    """Mock transport recording whether it was closed."""
+
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_shared_transport_outlives_its_clients():
+    seen = []
+
+    def record(request):
+        seen.append(request.headers["Authorization"])
+        return listing(ROWS, request)
+
+    transport = SharedTransport()
+    pool = transport._transport = Pool(record)
+    for token_id, secret in (("a", "1"), ("b", "2")):
+        with BookStackClient(BASE_URL, token_id, secret, transport=transport) as client:
+            client.audit_log.list()
+
+    assert seen == ["Token a:1", "Token b:2"]
+    assert not pool.closed
+
+    transport.shutdown()
+    assert pool.closed
+
+
+def test_async_shared_transport_outlives_its_clients():
+    transport = AsyncSharedTransport()
+    pool = transport._transport = Pool(lambda request: listing(ROWS, request))
+
+    async def main():
+        for token_id in ("a", "b"):
+            async with AsyncBookStackClient(BASE_URL, token_id, "secret", transport=transport) as client:
+                await client.audit_log.list()
+        closed_before_shutdown = pool.closed
+        await transport.shutdown()
+        return closed_before_shutdown
+
+    assert asyncio.run(main()) is False
+    assert pool.closed
+
+
+@pytest.mark.parametrize("options", [{"limits": httpx.Limits(max_connections=5)}, {"http2": True}])
+@pytest.mark.parametrize("client_class", [BookStackClient, AsyncBookStackClient])
+def test_pool_options_cannot_be_combined_with_a_transport(client_class, options):
+    with pytest.raises(ValueError, match="transport"):
+        client_class(BASE_URL, "id", "secret", transport=httpx.MockTransport(lambda request: None), **options)
+
+
+def test_limits_configure_the_client_pool():
+    limits = httpx.Limits(max_connections=3, max_keepalive_connections=3)
+
+    with BookStackClient(BASE_URL, "id", "secret", limits=limits) as client:
+        pool = client._client._transport._pool
+
+    assert pool._max_connections == 3
+    assert pool._max_keepalive_connections == 3